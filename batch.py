@@ -0,0 +1,221 @@
+# batch.py
+# Plays many games of Clip 'Em at once with NumPy.  N games are held as
+#   a 16 x N array of marker squares (one row per marker, the same order
+#   as GameState) and advanced one ply at a time: every game rolls, builds
+#   its legal-move mask from the engine's transition table, picks a move
+#   and resolves clips, all as whole-array operations.  Each ply works in
+#   uint8 and uint16 arrays kept between plies, with lookup tables standing
+#   in for arithmetic, since the cost is almost all in passes over arrays.
+#
+# All games start together and every ply, passes included, hands the turn
+#   to the next player, so the player to move is the same in every game
+#   and only needs to be tracked once.
+
+import numpy as np
+
+from engine import MOVES, HOME, SQUARES
+
+# A roll is a random byte below 216: the die is roll % 72 // 12 + 1 and
+#   roll % 12 picks among the legal pieces (12 is divisible by 1, 2, 3 and
+#   4).  216 = 3 * 72, so both are uniform and independent.  Rolls are
+#   made POOL at a time.
+ROLLS = 216
+POOL = 1 << 17
+
+NESTS = np.arange(16, dtype=np.uint8)
+HOME_SLOTS = np.array([HOME[m // 4] + m % 4 for m in range(16)], dtype=np.uint8)
+NOWHERE = 255
+# A game with no legal move still makes one: it puts NOWHERE, which clips
+#   nothing, in this spare row of the board.
+SPARE = 16
+
+
+def _build_tables():
+    # TABLES[marker][square * ROLLS + roll] is where marker goes from square
+    #   with roll: engine.MOVES, indexed by a uint16 built in place.
+    moves = np.frombuffer(MOVES, dtype=np.uint8).reshape(16, SQUARES, 6)
+    die = np.arange(ROLLS) % 72 // 12
+    return [np.ascontiguousarray(moves[marker][:, die]).ravel() for marker in range(16)]
+
+def _build_choice():
+    # CHOICE[player][legal * ROLLS + roll] is the board row of the piece
+    #   moved given the 4-bit legal mask, or SPARE if there is none.
+    choice = np.full((4, 16 * ROLLS), SPARE, dtype=np.uint8)
+    for player in range(4):
+        for legal in range(1, 16):
+            pieces = [piece for piece in range(4) if legal >> piece & 1]
+            for roll in range(ROLLS):
+                choice[player, legal * ROLLS + roll] = 4 * player + pieces[roll % 12 % len(pieces)]
+    return choice
+
+TABLES = _build_tables()
+CHOICE = _build_choice()
+LEGAL_KEYS = (np.array([1, 2, 4, 8], dtype=np.uint16) * ROLLS)[:, None]
+
+
+class BatchGame(object):
+
+    """N independent games advanced in lock-step.
+
+    squares[:, g] holds the 16 marker squares of the g-th running game and
+    ids[g] its original index.  winner[i] and plies[i] are filled in for
+    game i when it ends (winner is -1 until then).  Randomness comes from
+    rng, a NumPy Generator, or else from the generator of the Dice dice,
+    or else from a new generator seeded with seed."""
+
+    def __init__(self, n, seed=None, rng=None, dice=None):
+        if rng is None and dice is not None:
+            rng = dice.generator
+        if rng is None:
+            rng = np.random.default_rng(seed)
+        self.rng = rng
+        # board has the 16 marker rows and the SPARE row.
+        start = np.append(NESTS, NOWHERE).astype(np.uint8)
+        self.board = np.repeat(start[:, None], n, axis=1)
+        self.ids = np.arange(n)
+        self.done = np.zeros(n, dtype=bool)
+        self.winner = np.full(n, -1, dtype=np.int64)
+        self.plies = np.zeros(n, dtype=np.int64)
+        self.running = n
+        self.pool = np.zeros(0, dtype=np.uint8)
+        self.drawn = 0
+        self.player = 0
+        self.ply = 0
+        self._buffers()
+
+    @property
+    def squares(self):
+        return self.board[:16]
+
+    def _buffers(self):
+        # Work arrays for step(), sized to the running games.  Only
+        #   _compact() changes that size.
+        m = len(self.ids)
+        self.games = np.arange(m)
+        self.dests = np.full((17, m), NOWHERE, dtype=np.uint8)
+        self.key = np.empty((4, m), dtype=np.uint16)
+        self.ok = np.empty((4, m), dtype=bool)
+        self.blocked = np.empty((4, m), dtype=bool)
+        self.legal_key = np.empty(m, dtype=np.uint16)
+        self.row = np.empty(m, dtype=np.uint8)
+        self.at = np.empty(m, dtype=np.intp)
+        self.dest = np.empty(m, dtype=np.uint8)
+        self.hit = np.empty((12, m), dtype=bool)
+
+    def rolls(self):
+        """Return a uint8 roll (0-215) for every running game."""
+        m = len(self.ids)
+        if len(self.pool) - self.drawn < m:
+            # Bytes of 216 and up are drawn again in place, which is much
+            #   cheaper than filtering them out.
+            block = np.frombuffer(bytearray(self.rng.bytes(max(POOL, m))), dtype=np.uint8)
+            redraw = np.flatnonzero(block >= ROLLS)
+            while len(redraw):
+                block[redraw] = np.frombuffer(self.rng.bytes(len(redraw)), dtype=np.uint8)
+                redraw = redraw[block[redraw] >= ROLLS]
+            self.pool = np.concatenate((self.pool[self.drawn:], block))
+            self.drawn = 0
+        rolls = self.pool[self.drawn:self.drawn + m]
+        self.drawn += m
+        return rolls
+
+    def legal(self, rolls):
+        """Return (dests, legal): dests[4 * player + piece] is where each
+        of the mover's pieces would land with rolls in every running game,
+        and legal[piece] whether it may move there.  Both are work arrays
+        that the next call overwrites."""
+        first = 4 * self.player
+        own = self.board[first:first + 4]
+        key = self.key
+        np.multiply(own, ROLLS, out=key, dtype=np.uint16)
+        key += rolls
+        dests = self.dests
+        for piece in range(4):
+            np.take(TABLES[first + piece], key[piece], out=dests[first + piece])
+        # A piece may move if it lands somewhere new and not on its own
+        #   side's marker; comparing with all four own squares covers both.
+        ok = self.ok
+        blocked = self.blocked
+        np.not_equal(dests[first:first + 4], own[0], out=ok)
+        for other in range(1, 4):
+            np.not_equal(dests[first:first + 4], own[other], out=blocked)
+            ok &= blocked
+        return dests, ok
+
+    def step(self):
+        """Play one ply in every running game, moving a random legal piece
+        (games with no legal move pass).  Returns the number of games
+        still running."""
+        m = len(self.ids)
+        player = self.player
+        first = 4 * player
+        rolls = self.rolls()
+        dests, ok = self.legal(rolls)
+
+        # The uint16 CHOICE index: legal mask * ROLLS + roll.
+        weighted = self.key
+        np.multiply(ok, LEGAL_KEYS, out=weighted)
+        legal_key = self.legal_key
+        np.add(weighted[0], weighted[1], out=legal_key)
+        legal_key += weighted[2]
+        legal_key += weighted[3]
+        legal_key += rolls
+        row = np.take(CHOICE[player], legal_key, out=self.row)
+
+        # at is the flat (row, game) index of each move, in the board and
+        #   in dests alike.
+        at = self.at
+        np.multiply(row, m, out=at, dtype=np.intp)
+        at += self.games
+        dest = np.take(dests, at, out=self.dest)
+
+        # Clips: only the twelve opposing markers can stand on dest.
+        board = self.board
+        for low, high in ((0, first), (first + 4, 16)):
+            if low < high:
+                rows = board[low:high]
+                hit = self.hit[:high - low]
+                np.equal(rows, dest, out=hit)
+                np.copyto(rows, NESTS[low:high, None], where=hit)
+        board.ravel()[at] = dest
+
+        self.ply += 1
+        # Only a game whose piece just reached a home slot can have been won.
+        arrived = dest - HOME[player] < 4
+        if arrived.any():
+            games = np.flatnonzero(arrived)
+            home = (board[first:first + 4, games] == HOME_SLOTS[first:first + 4, None]).all(axis=0)
+            games = games[home & ~self.done[games]]
+            if len(games):
+                ids = self.ids[games]
+                self.winner[ids] = player
+                self.plies[ids] = self.ply
+                self.done[games] = True
+                self.running -= len(games)
+                self._compact()
+        self.player = (player + 1) % 4
+        return self.running
+
+    def _compact(self):
+        # Finished games are cheap to keep stepping, so they are only
+        #   dropped from the arrays once they make up an eighth of them.
+        if (len(self.ids) - self.running) * 8 > len(self.ids):
+            keep = ~self.done
+            self.board = np.ascontiguousarray(self.board[:, keep])
+            self.ids = self.ids[keep]
+            self.done = self.done[keep]
+            self._buffers()
+
+    def run(self, max_plies=5000):
+        """Play every game to the end (or max_plies turns) and return the
+        winner array."""
+        while self.ply < max_plies and self.step():
+            pass
+        return self.winner
+
+
+def simulate(n, seed=None, max_plies=5000):
+    """Play n random games and return (winners, plies) arrays."""
+    games = BatchGame(n, seed)
+    games.run(max_plies)
+    return games.winner, games.plies
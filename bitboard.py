@@ -0,0 +1,170 @@
+# bitboard.py
+# A second state backend for the rules in engine.py, where each player's
+#   markers are kept as bitmasks so that rule checks become bitwise AND,
+#   OR and shift operations on Python ints.
+#
+# Every player has two masks:
+#
+#   board[player]  bit `square` set for each board index (0-103) the
+#                  player occupies, nests and home slots included
+#   path[player]   the same markers, counted along the player's own route:
+#                  bit 0 is the start square, bits 0-51 the track, bits
+#                  52-56 the home stretch.  Markers in the nest or in a
+#                  home slot are not on the path.
+#
+# Moving every marker on the path by a roll is a single `path << die`,
+#   and the rotation in to_board() turns path bits back into board bits.
+
+from engine import (NEST, START, ARROW, HOME, SQUARES, TRACK_FIRST,
+                    TRACK_LENGTH, MOVES, GameState, next_player)
+
+PATH_LENGTH = TRACK_LENGTH + 5
+TRACK_MASK = (1 << TRACK_LENGTH) - 1
+PATH_MASK = (1 << PATH_LENGTH) - 1
+
+
+def _build_progress():
+    progress = []
+    for player in range(4):
+        steps = [-1] * SQUARES
+        for step in range(TRACK_LENGTH):
+            offset = (START[player] - TRACK_FIRST + step) % TRACK_LENGTH
+            steps[TRACK_FIRST + offset] = step
+        for step in range(5):
+            steps[ARROW[player] + step] = TRACK_LENGTH + step
+        progress.append(tuple(steps))
+    return tuple(progress)
+
+# PROGRESS[player][square] is how far along its path a marker of player
+#   standing on square is, or -1 for squares not on that path.
+PROGRESS = _build_progress()
+
+
+def to_board(player, path):
+    """Turn a path mask of player into a mask of board indices."""
+    shift = START[player] - TRACK_FIRST
+    track = path & TRACK_MASK
+    track = ((track << shift) | (track >> (TRACK_LENGTH - shift))) & TRACK_MASK
+    return (track << TRACK_FIRST) | ((path >> TRACK_LENGTH) << ARROW[player])
+
+
+class BitState(object):
+
+    """A GameState kept alongside per-player board and path bitmasks."""
+
+    __slots__ = ("squares", "player", "board", "path")
+
+    def __init__(self, squares=None, player=0, board=None, path=None):
+        if squares is None:
+            squares = range(16)
+        self.squares = bytes(squares)
+        self.player = player
+        if board is None:
+            board = [0, 0, 0, 0]
+            path = [0, 0, 0, 0]
+            for marker in range(16):
+                owner = marker // 4
+                square = self.squares[marker]
+                board[owner] |= 1 << square
+                step = PROGRESS[owner][square]
+                if step >= 0:
+                    path[owner] |= 1 << step
+        self.board = tuple(board)
+        self.path = tuple(path)
+
+    @classmethod
+    def from_state(cls, state):
+        return cls(state.squares, state.player)
+
+    def to_state(self):
+        return GameState(self.squares, self.player)
+
+    def __eq__(self, other):
+        return (isinstance(other, BitState) and self.player == other.player
+                and self.squares == other.squares)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.squares) ^ self.player
+
+
+def movable(bits, player, die):
+    """Return the path mask of player's markers on the path that may move
+    with die: those that reach home, and those whose landing square is
+    not already one of player's own."""
+    path = bits.path[player]
+    staying = path & (PATH_MASK >> die)
+    return (path & ~staying) | (staying & ~(path >> die))
+
+def destinations(bits, player, die):
+    """Return the board mask of every square player can legally reach
+    with die, home slots and the start square included."""
+    path = bits.path[player]
+    moving = movable(bits, player, die)
+    reach = to_board(player, (moving << die) & PATH_MASK)
+    finishing = moving >> (PATH_LENGTH - die)
+    if finishing:
+        first = 4 * player
+        for piece in range(4):
+            step = PROGRESS[player][bits.squares[first + piece]]
+            if step >= PATH_LENGTH - die:
+                reach |= 1 << (HOME[player] + piece)
+    if die == 6 and not path & 1 and bits.board[player] & (15 << NEST[player]):
+        reach |= 1 << START[player]
+    return reach
+
+def clips(bits, player, die):
+    """Return the board mask of the other players' markers that player
+    could clip with die."""
+    others = 0
+    for other in range(4):
+        if other != player:
+            others |= bits.board[other]
+    return destinations(bits, player, die) & others
+
+def legal_moves(bits, player, die):
+    """Same as engine.legal_moves(), answered from the bitmasks."""
+    first = 4 * player
+    nest = NEST[player]
+    moving = to_board(player, movable(bits, player, die))
+    entering = die == 6 and not bits.path[player] & 1
+    legal = []
+    for piece in range(4):
+        square = bits.squares[first + piece]
+        if square == nest + piece:
+            if entering:
+                legal.append(piece)
+        elif (moving >> square) & 1:
+            legal.append(piece)
+    return legal
+
+def apply_move(bits, player, piece, die):
+    """Same as engine.apply_move(), updating the masks as it goes."""
+    marker = 4 * player + piece
+    square = bits.squares[marker]
+    dest = MOVES[(marker * SQUARES + square) * 6 + die - 1]
+    squares = bytearray(bits.squares)
+    board = list(bits.board)
+    path = list(bits.path)
+    squares[marker] = dest
+    board[player] ^= (1 << square) | (1 << dest)
+    progress = PROGRESS[player]
+    if progress[square] >= 0:
+        path[player] &= ~(1 << progress[square])
+    if progress[dest] >= 0:
+        path[player] |= 1 << progress[dest]
+    hit = 1 << dest
+    for other in range(4):
+        if other != player and board[other] & hit:
+            for victim in range(4 * other, 4 * other + 4):
+                if squares[victim] == dest:
+                    squares[victim] = victim
+                    board[other] ^= hit | (1 << victim)
+                    path[other] &= ~(1 << PROGRESS[other][dest])
+    return BitState(squares, next_player(player), board, path)
+
+def pass_turn(bits):
+    """Same as engine.pass_turn()."""
+    return BitState(bits.squares, next_player(bits.player), bits.board, bits.path)
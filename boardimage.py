@@ -0,0 +1,154 @@
+# boardimage.py
+# The static part of the board (the track, the coloured nests, stretches
+#   and start squares, the centre triangles and the 104 spots) painted
+#   once into a PPM image instead of drawn as a hundred-odd canvas items.
+#   Only the player names, the markers and the die stay live.
+#
+# The image depends only on the four player colours, so it is cached per
+#   colour tuple, in memory and as a file in the temp directory that
+#   graphics.Image can load.
+
+import os
+import tempfile
+
+# Pixels per board unit in the 900 x 900 window, whose coordinates run
+#   from 0 to 100 (the same scale graphics.py uses for setCoords()).
+SIZE = 900
+SCALE = (SIZE - 1) / 100.0
+SPOT_RADIUS = 0.7
+
+COLORS = {
+    "red": (255, 0, 0),
+    "white": (255, 255, 255),
+    "blue": (0, 0, 255),
+    "green": (0, 255, 0),
+    "black": (0, 0, 0),
+    "darkgray": (169, 169, 169),
+    "lightblue4": (104, 131, 139),
+    }
+
+BACKGROUND = "lightblue4"
+TRACK = "darkgray"
+
+# (corner, corner, colour) where colour is the track colour or 1-4 for
+#   that player's colour, in the order DrawBoard() used to draw them.
+RECTANGLES = (
+    ((14, 57.5), (86, 42.5), TRACK),
+    ((42.5, 86), (57.5, 14), TRACK),
+    ((7, 60), (12, 40), 1),
+    ((40, 7), (60, 12), 2),
+    ((88, 60), (93, 40), 3),
+    ((40, 93), (60, 88), 4),
+    ((19, 52.5), (44, 47.5), 1),
+    ((56, 52.5), (81, 47.5), 3),
+    ((47.5, 81), (52.5, 56), 4),
+    ((47.5, 44), (52.5, 19), 2),
+    ((14, 47.5), (19, 42.5), 1),
+    ((52.5, 19), (57.5, 14), 2),
+    ((81, 57.5), (86, 52.5), 3),
+    ((42.5, 86), (47.5, 81), 4),
+    )
+
+TRIANGLES = (
+    (((44, 56), (50, 50), (44, 44)), 1),
+    (((44, 44), (50, 50), (56, 44)), 2),
+    (((56, 44), (50, 50), (56, 56)), 3),
+    (((56, 56), (50, 50), (44, 56)), 4),
+    )
+
+
+def rgb(color):
+    """Return the (r, g, b) of a colour name from COLORS or a "#rrggbb"
+    string such as color_rgb() makes."""
+    if color.startswith("#"):
+        return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+    return COLORS[color.lower()]
+
+
+class Canvas(object):
+
+    """An RGB pixel buffer addressed in board coordinates."""
+
+    def __init__(self, color):
+        self.pixels = bytearray(bytes(rgb(color)) * (SIZE * SIZE))
+
+    def span(self, row, left, right, color):
+        """Fill pixels left to right (inclusive) of row."""
+        left = max(left, 0)
+        right = min(right, SIZE - 1)
+        if 0 <= row < SIZE and left <= right:
+            start = 3 * (row * SIZE + left)
+            self.pixels[start:start + 3 * (right - left + 1)] = color * (right - left + 1)
+
+    def rectangle(self, corner1, corner2, color):
+        color = bytes(rgb(color))
+        x1, x2 = sorted((corner1[0], corner2[0]))
+        y1, y2 = sorted((corner1[1], corner2[1]))
+        for row in range(pixel_y(y2), pixel_y(y1) + 1):
+            self.span(row, pixel_x(x1), pixel_x(x2), color)
+
+    def polygon(self, points, color):
+        """Fill a convex polygon."""
+        color = bytes(rgb(color))
+        corners = [(x * SCALE, (100 - y) * SCALE) for x, y in points]
+        top = int(round(min(y for x, y in corners)))
+        bottom = int(round(max(y for x, y in corners)))
+        for row in range(top, bottom + 1):
+            crossings = []
+            for (xa, ya), (xb, yb) in zip(corners, corners[1:] + corners[:1]):
+                if ya != yb and min(ya, yb) <= row <= max(ya, yb):
+                    crossings.append(xa + (row - ya) * (xb - xa) / (yb - ya))
+            if crossings:
+                self.span(row, int(round(min(crossings))), int(round(max(crossings))), color)
+
+    def circle(self, center, radius, color):
+        color = bytes(rgb(color))
+        cx = center[0] * SCALE
+        cy = (100 - center[1]) * SCALE
+        r = radius * SCALE
+        for row in range(int(cy - r), int(cy + r) + 2):
+            dy = row - cy
+            if dy * dy <= r * r:
+                half = (r * r - dy * dy) ** 0.5
+                self.span(row, int(round(cx - half)), int(round(cx + half)), color)
+
+    def ppm(self):
+        return b"P6\n" + "{0} {0}\n255\n".format(SIZE).encode("ascii") + bytes(self.pixels)
+
+
+def pixel_x(x):
+    return int(round(x * SCALE))
+
+def pixel_y(y):
+    return int(round((100 - y) * SCALE))
+
+def render(colors, spots):
+    """Return the board for the four player colours as PPM bytes, with a
+    spot at every (x, y) in spots."""
+    canvas = Canvas(BACKGROUND)
+    for corner1, corner2, color in RECTANGLES:
+        canvas.rectangle(corner1, corner2, color if color == TRACK else colors[color - 1])
+    for points, player in TRIANGLES:
+        canvas.polygon(points, colors[player - 1])
+    for spot in spots:
+        canvas.circle(spot, SPOT_RADIUS, "black")
+    return canvas.ppm()
+
+
+_cache = {}
+
+def board_image(colors, spots):
+    """Return the path of a PPM file of the board for the four player
+    colours, rendering it only if it is not already cached."""
+    colors = tuple(colors)
+    path = _cache.get(colors)
+    if path is None or not os.path.exists(path):
+        name = "clipem-board-v1-{0}.ppm".format("-".join(c.lower().lstrip("#") for c in colors))
+        path = os.path.join(tempfile.gettempdir(), name)
+        if not os.path.exists(path):
+            partial = path + ".{0}".format(os.getpid())
+            with open(partial, "wb") as out:
+                out.write(render(colors, spots))
+            os.rename(partial, path)
+        _cache[colors] = path
+    return path
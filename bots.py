@@ -0,0 +1,160 @@
+# bots.py
+# Computer players for Clip 'Em.  Any object with a choose_move() method
+#   can fill a seat, in a TurnMachine (turnflow.py) or in a headless game loop:
+#
+#     choose_move(state, die, legal_moves) -> piece
+#
+#   where state is the GameState, die the roll, and legal_moves the
+#   non-empty list of pieces engine.legal_moves() allows.  The returned
+#   piece must be one of them.
+
+import random
+
+from engine import SQUARES, MOVES, apply_move
+from bitboard import PROGRESS, PATH_LENGTH
+
+# How far along its route a marker in the nest counts as being: it needs
+#   a six to get going, so it is treated as a full roll behind the start.
+NEST_PROGRESS = -6
+
+
+def progress(player, marker, square):
+    """How far marker (one of player's) has come: NEST_PROGRESS in the
+    nest, 0 on the start square, PATH_LENGTH in its home slot."""
+    step = PROGRESS[player][square]
+    if step >= 0:
+        return step
+    if square == marker:
+        return NEST_PROGRESS
+    return PATH_LENGTH
+
+def advance(state, player, piece, die):
+    """How much further along its route piece gets by moving with die."""
+    marker = 4 * player + piece
+    square = state[marker]
+    dest = MOVES[(marker * SQUARES + square) * 6 + die - 1]
+    return progress(player, marker, dest) - progress(player, marker, square)
+
+def victim(state, player, piece, die):
+    """Return the marker that moving piece would clip, or None."""
+    marker = 4 * player + piece
+    dest = MOVES[(marker * SQUARES + state[marker]) * 6 + die - 1]
+    other = state.occupant[dest] - 1
+    if other >= 0 and other // 4 != player:
+        return other
+    return None
+
+def threatened(state, player):
+    """Return the set of squares some other player could land on with
+    their next roll."""
+    squares = set()
+    for marker in range(16):
+        if marker // 4 == player:
+            continue
+        square = state[marker]
+        for die in range(1, 7):
+            dest = MOVES[(marker * SQUARES + square) * 6 + die - 1]
+            if dest != square:
+                squares.add(dest)
+    return squares
+
+
+class Player(object):
+
+    """Base class for computer players."""
+
+    name = "Bot"
+
+    def choose_move(self, state, die, legal_moves):
+        raise NotImplementedError
+
+
+class RandomBot(Player):
+
+    """Moves a random legal piece."""
+
+    name = "Random Bot"
+
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+
+    def choose_move(self, state, die, legal_moves):
+        return self.rng.choice(legal_moves)
+
+
+class GreedyAdvanceBot(Player):
+
+    """Moves whichever piece gains the most ground."""
+
+    name = "Greedy Bot"
+
+    def choose_move(self, state, die, legal_moves):
+        player = state.player
+        return max(legal_moves, key=lambda piece: advance(state, player, piece, die))
+
+
+class GreedyClipBot(Player):
+
+    """Clips the most advanced marker it can reach, otherwise gains the
+    most ground."""
+
+    name = "Clip Bot"
+
+    def choose_move(self, state, die, legal_moves):
+        player = state.player
+
+        def score(piece):
+            hit = victim(state, player, piece, die)
+            if hit is None:
+                return (-1, advance(state, player, piece, die))
+            owner = hit // 4
+            return (progress(owner, hit, state[hit]), advance(state, player, piece, die))
+        return max(legal_moves, key=score)
+
+
+class SafetyFirstBot(Player):
+
+    """Leaves as few of its own markers as possible where another player
+    could clip them next turn, then gains the most ground."""
+
+    name = "Safe Bot"
+
+    def choose_move(self, state, die, legal_moves):
+        player = state.player
+        first = 4 * player
+
+        def score(piece):
+            after = apply_move(state, player, piece, die)
+            danger = threatened(after, player)
+            exposed = 0
+            for marker in range(first, first + 4):
+                if after[marker] in danger:
+                    exposed += 1
+            return (-exposed, advance(state, player, piece, die))
+        return max(legal_moves, key=score)
+
+
+BOTS = {
+    "random": RandomBot,
+    "greedy": GreedyAdvanceBot,
+    "clip": GreedyClipBot,
+    "safe": SafetyFirstBot,
+    }
+
+def make_bot(name):
+    """Return a new bot for a seat named "bot random", "bot greedy",
+    "bot clip", "bot safe", "bot expectimax" or "bot mcts" (any case), or
+    None for a human seat."""
+    words = name.lower().split()
+    if len(words) != 2 or words[0] != "bot":
+        return None
+    # The search bots build on this module, so they are imported here.
+    if words[1] == "expectimax":
+        from search import ExpectimaxBot
+        return ExpectimaxBot()
+    if words[1] == "mcts":
+        from mcts import MCTSBot
+        return MCTSBot()
+    if words[1] in BOTS:
+        return BOTS[words[1]]()
+    return None
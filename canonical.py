@@ -0,0 +1,77 @@
+# canonical.py
+# Symmetries of Clip 'Em.  The board looks the same from every seat (the
+#   start squares are 13 apart and every seat has its own nest, arrow and
+#   home), and a seat's four pieces are interchangeable apart from which
+#   nest and home slot each one uses.  So a state can be turned to face
+#   the player to move and have each seat's pieces put in order without
+#   changing how the game plays out.
+#
+# canonical_form() picks that one representative for every state, which
+#   lets tables and caches store a state and all its mirror images once.
+
+from engine import (NEST, ARROW, HOME, SQUARES, TRACK_FIRST, TRACK_LAST,
+                    TRACK_LENGTH, GameState)
+from bitboard import PROGRESS, PATH_LENGTH
+
+# Squares between neighbouring seats' starts and arrows.
+TRACK_SHIFT = TRACK_LENGTH // 4
+ARROW_SHIFT = ARROW[1] - ARROW[0]
+
+
+def _build_rotate():
+    # ROTATE[shift][square] is where square ends up when seat `shift` is
+    #   turned to sit where seat 0 does.
+    rotate = []
+    for shift in range(4):
+        table = bytearray(SQUARES)
+        for square in range(SQUARES):
+            if square < TRACK_FIRST:
+                seat, piece = divmod(square, 4)
+                table[square] = NEST[(seat - shift) % 4] + piece
+            elif square <= TRACK_LAST:
+                offset = square - TRACK_FIRST - TRACK_SHIFT * shift
+                table[square] = TRACK_FIRST + offset % TRACK_LENGTH
+            else:
+                seat, step = divmod(square - ARROW[0], ARROW_SHIFT)
+                table[square] = ARROW[(seat - shift) % 4] + step
+        rotate.append(bytes(table))
+    return tuple(rotate)
+
+ROTATE = _build_rotate()
+
+
+def rank(seat, square):
+    """Order of a square along seat's route: -1 for the nest, the path step
+    on the track and home stretch, PATH_LENGTH for a home slot."""
+    step = PROGRESS[seat][square]
+    if step >= 0:
+        return step
+    if square < TRACK_FIRST:
+        return -1
+    return PATH_LENGTH
+
+def canonical_form(state):
+    """Return (form, pieces): form is state turned so the player to move is
+    player 0, with each player's pieces sorted by how far they have come,
+    and pieces[i] is the piece of the player to move in state that piece i
+    of player 0 in form stands for.  So a move of piece i found for form is
+    a move of pieces[i] in state."""
+    shift = state.player
+    rotate = ROTATE[shift]
+    squares = bytearray(16)
+    pieces = None
+    for seat in range(4):
+        first = 4 * ((seat + shift) % 4)
+        order = sorted(range(4), key=lambda piece:
+                       rank(seat, rotate[state.squares[first + piece]]))
+        for i, piece in enumerate(order):
+            square = rotate[state.squares[first + piece]]
+            step = rank(seat, square)
+            if step < 0:
+                square = NEST[seat] + i
+            elif step == PATH_LENGTH:
+                square = HOME[seat] + i
+            squares[4 * seat + i] = square
+        if seat == 0:
+            pieces = tuple(order)
+    return GameState(squares, 0), pieces
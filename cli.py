@@ -0,0 +1,179 @@
+# cli.py
+# Command-line entry point for Clip 'Em:
+#
+#   python cli.py play [--seed N]
+#   python cli.py simulate [--games N] [--workers N] [--seed N] [--batch]
+#   python cli.py bench [--seconds S] [--startup]
+#   python cli.py analyze SQUARES --die D [--budget S] [--workers N]
+#
+# Only `play` opens a window.  The other commands import the modules they
+#   need inside their own functions and never touch graphics, so they
+#   start quickly on machines with no display.  `bench --startup` checks
+#   that: it times fresh interpreters importing the headless modules and
+#   fails if any takes longer than STARTUP_BUDGET.
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+STARTUP_BUDGET = 0.1
+# Imports a headless process makes on the way in, clip_em included since
+#   its rules-side code is meant to be reusable without a window.
+HEADLESS = ("import cli", "import engine, bots, search", "import clip_em, dieview")
+
+
+def positive(text):
+    """argparse type for a count that must be at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return value
+
+def play_command(args):
+    import clip_em
+    from dice import Dice
+    clip_em.main(Dice(args.seed))
+
+def simulate_command(args):
+    start = time.time()
+    if args.batch:
+        import batch
+        winners, plies = batch.simulate(args.games, args.seed, args.max_plies)
+        wins = [int((winners == player).sum()) for player in range(4)]
+        total = int(plies.sum())
+    else:
+        import simulate
+        tally = simulate.simulate(args.games, args.workers, args.seed,
+                                  max_plies=args.max_plies)
+        wins = tally.wins
+        total = tally.plies
+    elapsed = time.time() - start
+    for player in range(4):
+        print("player {0}: {1} wins ({2:.1%})".format(
+            player + 1, wins[player], wins[player] / float(args.games)))
+    print("{0} games, {1:.1f} plies per game, {2:.1f}s ({3:.0f} games/s)".format(
+        args.games, total / float(args.games), elapsed, args.games / elapsed))
+
+def startup_times(repeat=5):
+    """Return (code, seconds) for each of HEADLESS: the best of `repeat`
+    runs of a new interpreter executing it.  Raises RuntimeError if one of
+    them fails or imports graphics."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    check = "; import sys; sys.exit(3 if 'graphics' in sys.modules else 0)"
+    times = []
+    for code in HEADLESS:
+        best = None
+        for _ in range(repeat):
+            start = time.time()
+            status = subprocess.call([sys.executable, "-c", code + check], cwd=here)
+            if status == 3:
+                raise RuntimeError("{0!r} imported graphics".format(code))
+            if status:
+                raise RuntimeError("{0!r} failed".format(code))
+            elapsed = time.time() - start
+            if best is None or elapsed < best:
+                best = elapsed
+        times.append((code, best))
+    return times
+
+def bench_command(args):
+    if args.startup:
+        slow = False
+        for code, seconds in startup_times():
+            ok = seconds < STARTUP_BUDGET
+            slow = slow or not ok
+            print("{0}: {1:.0f} ms{2}".format(code, seconds * 1000, "" if ok else " (over budget)"))
+        if slow:
+            sys.exit(1)
+        return
+    import random
+    import mcts
+    from engine import new_game, legal_moves, apply_move, pass_turn, winner
+    rng = random.Random(1)
+    plies = 0
+    start = time.time()
+    while time.time() - start < args.seconds:
+        state = new_game()
+        while winner(state) is None:
+            die = rng.randint(1, 6)
+            legal = legal_moves(state, state.player, die)
+            if legal:
+                state = apply_move(state, state.player, rng.choice(legal), die)
+            else:
+                state = pass_turn(state)
+            plies += 1
+    print("engine: {0:.0f} plies/s".format(plies / (time.time() - start)))
+    print("mcts playouts: {0:.0f} playouts/s".format(mcts.benchmark(args.seconds)))
+    try:
+        import batch
+    except ImportError:
+        return
+    start = time.time()
+    games = 0
+    while time.time() - start < args.seconds:
+        batch.simulate(1000, seed=games)
+        games += 1000
+    print("batch: {0:.0f} games/s".format(games / (time.time() - start)))
+
+def analyze_command(args):
+    from engine import GameState, SQUARES, legal_moves
+    from search import analyse
+    try:
+        squares = [int(square) for square in args.squares.split(",")]
+    except ValueError:
+        sys.exit("analyze: squares must be whole numbers")
+    if len(squares) != 16:
+        sys.exit("analyze: expected 16 comma-separated squares")
+    if not all(0 <= square < SQUARES for square in squares):
+        sys.exit("analyze: squares must be 0-{0}".format(SQUARES - 1))
+    state = GameState(squares, args.player)
+    if not legal_moves(state, state.player, args.die):
+        print("no legal move: the turn passes")
+        return
+    for piece, depth, value in analyse(state, args.die, args.budget, args.workers):
+        print("piece {0}: {1:+.2f} (depth {2})".format(
+            piece + 1, value[state.player], depth))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="cli.py", description="Clip 'Em")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    command = commands.add_parser("play", help="play in a window")
+    command.add_argument("--seed", type=int, help="seed the dice")
+    command.set_defaults(run=play_command)
+
+    command = commands.add_parser("simulate", help="play random games and report who wins")
+    command.add_argument("--games", type=positive, default=10000)
+    command.add_argument("--workers", type=int, help="processes (default: all cores)")
+    command.add_argument("--seed", type=int)
+    command.add_argument("--max-plies", type=int, default=5000)
+    command.add_argument("--batch", action="store_true",
+                         help="use the NumPy lock-step simulator")
+    command.set_defaults(run=simulate_command)
+
+    command = commands.add_parser("bench", help="measure engine and simulator speed")
+    command.add_argument("--seconds", type=float, default=1.0)
+    command.add_argument("--startup", action="store_true",
+                         help="check headless imports start within {0:.0f} ms".format(
+                             STARTUP_BUDGET * 1000))
+    command.set_defaults(run=bench_command)
+
+    command = commands.add_parser("analyze", help="score the moves in a position")
+    command.add_argument("squares", help="the 16 marker squares, comma-separated")
+    command.add_argument("--player", type=int, default=0, choices=range(4),
+                         help="player to move (0-3)")
+    command.add_argument("--die", type=int, required=True, choices=range(1, 7))
+    command.add_argument("--budget", type=float, default=1.0, help="seconds")
+    command.add_argument("--workers", type=int, help="processes (default: all cores)")
+    command.set_defaults(run=analyze_command)
+
+    args = parser.parse_args(argv)
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# dice.py
+# Where die rolls come from.  A Dice is a seedable stream of rolls: the
+#   same seed gives the same rolls, so a game or a simulation can be
+#   replayed, and spawn() splits off independent streams, one per game.
+#
+# Rolls are drawn from NumPy in blocks of `size` and handed out one at a
+#   time, so roll() costs a list lookup rather than a call into the random
+#   module, and rolls(n) returns a whole NumPy array at once.  Without
+#   NumPy, Dice falls back on random.Random and still works, one roll at a
+#   time.
+
+import random
+
+BLOCK = 4096
+
+
+def _numpy():
+    # NumPy is imported when the first Dice is made, not with this module,
+    #   so that importing the GUI stays quick.
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class Dice(object):
+
+    """A stream of die rolls.  seed may be None (fresh entropy), an int or
+    a numpy SeedSequence."""
+
+    def __init__(self, seed=None, size=BLOCK):
+        self.size = size
+        self.block = []
+        self.next = 0
+        self.np = np = _numpy()
+        if np is None:
+            self.seed_seq = None
+            self.generator = random.Random(seed)
+            return
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        self.seed_seq = seed
+        self.generator = np.random.default_rng(seed)
+
+    def roll(self):
+        """Return the next roll, 1-6."""
+        if self.next == len(self.block):
+            if self.np is None:
+                return self.generator.randint(1, 6)
+            self.block = self.generator.integers(1, 7, self.size, dtype=self.np.uint8).tolist()
+            self.next = 0
+        value = self.block[self.next]
+        self.next += 1
+        return value
+
+    def rolls(self, n):
+        """Return the next n rolls as a NumPy array of uint8 (a list
+        without NumPy).  These do not come out of the block roll() uses."""
+        if self.np is None:
+            return [self.generator.randint(1, 6) for _ in range(n)]
+        return self.generator.integers(1, 7, n, dtype=self.np.uint8)
+
+    def random(self):
+        """Return a float in [0, 1) from the same stream."""
+        return float(self.generator.random())
+
+    def spawn(self, n):
+        """Return n new Dice whose streams are independent of this one and
+        of each other, and fixed by this one's seed."""
+        if self.np is None:
+            return [Dice(self.generator.getrandbits(64), self.size) for _ in range(n)]
+        return [Dice(seq, self.size) for seq in self.seed_seq.spawn(n)]
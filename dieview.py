@@ -1,15 +1,23 @@
 # dieview.py
-from graphics import *
+#   graphics.py is only imported when the first DieView is made.
+import lazygraphics
+
+# Set by the first DieView made.
+graphics = None
+
 class DieView:
     """DieView is a widget that displays a graphical representation
     of a standard six-sided die."""
 
     def __init__(self, win, center, size):
         """Create a view of a die, e.g.:
-           d1 = DieView(myWin, Point(40,50), 20)
+           d1 = DieView(myWin, graphics.Point(40,50), 20)
            creates a die centered at (40,50) having sides
            of length 20."""
 
+        global graphics
+        graphics = lazygraphics.load()
+
         # first define some standard values
         self.win = win            # save this for darwing pips later
         self.background = "white" # color of die face
@@ -20,9 +28,9 @@ class DieView:
 
         # create a square for the face
         cx, cy = center.getX(), center.getY()
-        p1 = Point(cx-hsize, cy-hsize)
-        p2 = Point(cx+hsize, cy+hsize)
-        rect = Rectangle(p1,p2)
+        p1 = graphics.Point(cx-hsize, cy-hsize)
+        p2 = graphics.Point(cx+hsize, cy+hsize)
+        rect = graphics.Rectangle(p1,p2)
         rect.draw(win)
         rect.setFill(self.background)
 
@@ -40,7 +48,7 @@ class DieView:
 
     def __makePip(self, x, y):
         """Internal helper method to draw a pip at (x,y)"""
-        pip = Circle(Point(x,y), self.psize)
+        pip = graphics.Circle(graphics.Point(x,y), self.psize)
         pip.setFill(self.background)
         pip.setOutline(self.background)
         pip.draw(self.win)
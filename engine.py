@@ -0,0 +1,242 @@
+# engine.py
+# The rules of Clip 'Em with no graphics attached, so that games can be
+#   played, searched and simulated without a window.
+#
+# A game state is a GameState: 16 board indices, one per marker, in the
+#   same order as the markers m1..m16 in clip_em.py, plus the player to move.
+#   Marker 4*player + piece is piece number `piece` (0-3) of `player` (0-3).
+#   The board indices are the ones in BOARD in clip_em.py:
+#
+#     0-15    the nests, four per player (NEST[player] + piece)
+#     16-67   the shared track, walked in increasing order, 67 wraps to 16
+#     68-72   player 1's home stretch, 73-76 player 1's home slots
+#     77-81   player 2's home stretch, 82-85 player 2's home slots
+#     86-90   player 3's home stretch, 91-94 player 3's home slots
+#     95-99   player 4's home stretch, 100-103 player 4's home slots
+#
+# These rules follow the old click-driven helpers that clip_em.py used to
+#   have, square for square, except where those had bugs; test_rules.py
+#   replays the old helpers (kept in oldrules.py) against this module and
+#   lists each difference.
+
+import random
+
+NEST = (0, 4, 8, 12)
+START = (16, 29, 42, 55)
+ARROW = (68, 77, 86, 95)
+HOME = (73, 82, 91, 100)
+
+SQUARES = 104
+TRACK_FIRST = 16
+TRACK_LAST = 67
+TRACK_LENGTH = 52
+
+
+def _build_zobrist():
+    # A fixed seed keeps the keys the same from run to run, so they can be
+    #   stored alongside saved positions and tables.
+    rng = random.Random(0x5EED)
+    return (tuple(rng.getrandbits(64) for _ in range(16 * SQUARES)),
+            tuple(rng.getrandbits(64) for _ in range(4)))
+
+# ZOBRIST[marker * SQUARES + square] is the key for marker standing on
+#   square and SIDE[player] the key for player being on move.  A state's
+#   key is the XOR of the keys of everything true of it.
+ZOBRIST, SIDE = _build_zobrist()
+
+def zobrist(squares, player):
+    """Return the Zobrist key of a state, computed from scratch."""
+    key = SIDE[player]
+    for marker in range(16):
+        key ^= ZOBRIST[marker * SQUARES + squares[marker]]
+    return key
+
+
+class GameState(object):
+
+    """The 16 marker squares packed into a bytes object, plus the player to
+    move.  States are immutable, hash and compare by value, and are cheap
+    enough to keep by the million as dict keys.
+
+    occupant is the reverse index: occupant[square] is 1 + the marker on
+    that square, or 0 if it is empty.  apply_move() keeps it up to date, so
+    finding a clipped marker is one lookup rather than a scan.  key is the
+    state's Zobrist key, also kept up to date by apply_move() and used as
+    the hash."""
+
+    __slots__ = ("squares", "player", "occupant", "key")
+
+    def __init__(self, squares=None, player=0, occupant=None, key=None):
+        if squares is None:
+            squares = range(16)
+        self.squares = bytes(squares)
+        self.player = player
+        if occupant is None:
+            occupant = bytearray(SQUARES)
+            for marker in range(16):
+                occupant[self.squares[marker]] = marker + 1
+        self.occupant = bytes(occupant)
+        if key is None:
+            key = zobrist(self.squares, player)
+        self.key = key
+
+    def __getitem__(self, marker):
+        return self.squares[marker]
+
+    def __len__(self):
+        return 16
+
+    def __iter__(self):
+        return iter(self.squares)
+
+    def __eq__(self, other):
+        return (isinstance(other, GameState) and self.player == other.player
+                and self.squares == other.squares)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return self.key
+
+    def __repr__(self):
+        return "GameState({0}, {1})".format(list(self.squares), self.player)
+
+    def copy(self):
+        return GameState(self.squares, self.player, self.occupant, self.key)
+
+    def pack(self):
+        """Return the state as a single int (7 bits per square)."""
+        n = self.player
+        for square in self.squares:
+            n = (n << 7) | square
+        return n
+
+    @classmethod
+    def unpack(cls, n):
+        """Return the state that pack() turned into n."""
+        squares = bytearray(16)
+        for marker in range(15, -1, -1):
+            squares[marker] = n & 127
+            n >>= 7
+        return cls(squares, n)
+
+
+def new_game(player=0):
+    """Return the starting state: every marker in its nest."""
+    return GameState(None, player)
+
+def destination(player, piece, square, die):
+    """Return the square that piece `piece` of `player` reaches from `square`
+    with a roll of `die`.  A marker that cannot move with that roll (in the
+    nest without a six, or already home) stays on `square`."""
+    home = HOME[player]
+    if square == NEST[player] + piece:
+        if die == 6:
+            return START[player]
+        return square
+    if square >= home:
+        return square
+    if player == 0:
+        if square + die <= home - 1:
+            return square + die
+        return home + piece
+    if square <= TRACK_LAST and square + die > TRACK_LAST:
+        return square + die - TRACK_LENGTH
+    start = START[player]
+    if square < start and square + die > start - 1:
+        square = ARROW[player] + (square + die - start)
+        if square > home - 1:
+            return home + piece
+        return square
+    if square + die > home - 1:
+        return home + piece
+    return square + die
+
+def _build_moves():
+    table = bytearray(16 * SQUARES * 6)
+    for marker in range(16):
+        player, piece = divmod(marker, 4)
+        for square in range(SQUARES):
+            for die in range(1, 7):
+                index = (marker * SQUARES + square) * 6 + die - 1
+                if square == marker or (TRACK_FIRST <= square <= TRACK_LAST or
+                                        ARROW[player] <= square < HOME[player] + 4):
+                    table[index] = destination(player, piece, square, die)
+                else:
+                    table[index] = square
+    return bytes(table)
+
+# MOVES[(marker * SQUARES + square) * 6 + die - 1] is destination() for
+#   marker 4*player + piece, looked up once here instead of on every move.
+#   Squares a marker can never stand on map to themselves.
+MOVES = _build_moves()
+
+def move_to(marker, square, die):
+    """Return destination() for `marker` (4*player + piece) from the table."""
+    return MOVES[(marker * SQUARES + square) * 6 + die - 1]
+
+def legal_moves(state, player, die):
+    """Return the pieces (0-3) that `player` may move with a roll of `die`.
+
+    A piece may move if the roll takes it somewhere and it does not land on
+    another marker of the same player.  An empty list means the turn passes."""
+    first = 4 * player
+    squares = state.squares
+    occupant = state.occupant
+    legal = []
+    for piece in range(4):
+        square = squares[first + piece]
+        dest = MOVES[((first + piece) * SQUARES + square) * 6 + die - 1]
+        if dest != square and (occupant[dest] - 1) // 4 != player:
+            legal.append(piece)
+    return legal
+
+def apply_move(state, player, piece, die):
+    """Return the state after `player` moves `piece` with a roll of `die`.
+
+    Any other player's marker on the landing square is clipped back to its
+    nest.  The move is assumed to be one of legal_moves(state, player, die)."""
+    marker = 4 * player + piece
+    square = state.squares[marker]
+    dest = MOVES[(marker * SQUARES + square) * 6 + die - 1]
+    squares = bytearray(state.squares)
+    occupant = bytearray(state.occupant)
+    following = next_player(player)
+    key = (state.key ^ ZOBRIST[marker * SQUARES + square] ^
+           ZOBRIST[marker * SQUARES + dest] ^ SIDE[player] ^ SIDE[following])
+    victim = occupant[dest] - 1
+    if victim >= 0:
+        squares[victim] = victim
+        occupant[victim] = victim + 1
+        key ^= ZOBRIST[victim * SQUARES + dest] ^ ZOBRIST[victim * SQUARES + victim]
+    squares[marker] = dest
+    occupant[square] = 0
+    occupant[dest] = marker + 1
+    return GameState(squares, following, occupant, key)
+
+def pass_turn(state):
+    """Return the state after the player to move has no legal move."""
+    following = next_player(state.player)
+    return GameState(state.squares, following, state.occupant,
+                     state.key ^ SIDE[state.player] ^ SIDE[following])
+
+def is_home(state, player):
+    """Return True if all four of `player`'s markers are in their home slots."""
+    first = 4 * player
+    home = HOME[player]
+    return (state[first] == home and state[first + 1] == home + 1 and
+            state[first + 2] == home + 2 and state[first + 3] == home + 3)
+
+def winner(state):
+    """Return the player who has brought all four markers home, or None."""
+    for player in range(4):
+        if is_home(state, player):
+            return player
+    return None
+
+def game_over(state):
+    return winner(state) is not None
+
+def next_player(player):
+    return (player + 1) % 4
@@ -0,0 +1,40 @@
+# hitgrid.py
+# Turns a click into a board square, and from there into the marker on it,
+#   without testing the click against every marker.  The board is cut into
+#   square cells and each cell lists the spots that reach into it, so a
+#   click only has to be compared, by squared distance, with the one or
+#   two spots in its own cell.
+
+
+class HitGrid(object):
+
+    """A uniform grid over spots, a sequence of (x, y) board coordinates
+    indexed by square, each spot being a circle of the given radius."""
+
+    def __init__(self, spots, radius, cell=5.0):
+        self.spots = spots
+        self.radius2 = radius * radius
+        self.cell = cell
+        self.cells = {}
+        for square, (x, y) in enumerate(spots):
+            for col in range(int((x - radius) // cell), int((x + radius) // cell) + 1):
+                for row in range(int((y - radius) // cell), int((y + radius) // cell) + 1):
+                    self.cells.setdefault((col, row), []).append(square)
+
+    def square_at(self, x, y):
+        """Return the square whose spot contains (x, y), or None."""
+        for square in self.cells.get((int(x // self.cell), int(y // self.cell)), ()):
+            sx, sy = self.spots[square]
+            if (x - sx) * (x - sx) + (y - sy) * (y - sy) <= self.radius2:
+                return square
+        return None
+
+    def marker_at(self, state, x, y):
+        """Return the marker standing under (x, y) in state, or None."""
+        square = self.square_at(x, y)
+        if square is None:
+            return None
+        marker = state.occupant[square] - 1
+        if marker < 0:
+            return None
+        return marker
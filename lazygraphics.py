@@ -0,0 +1,12 @@
+# lazygraphics.py
+# graphics.py starts up Tkinter when it is imported, which is wasted time
+#   for anything that never opens a window.  Modules that draw keep the
+#   module in a single name, `graphics`, set to None at the top and filled
+#   in from load() on their way into the first drawing code, instead of
+#   doing `from graphics import *` at the top.
+
+
+def load():
+    """Import graphics and return the module."""
+    import graphics
+    return graphics
@@ -0,0 +1,84 @@
+# markov.py
+# One piece's trip from its nest to its home slot as an absorbing Markov
+#   chain, with no other markers on the board.  Each turn is one roll: in
+#   the nest only a six gets the piece out onto its start square, then it
+#   goes round the 52-square track (67 wrapping to 16), turns off at its
+#   arrow into the home stretch, and stops for good in its home slot.
+#
+# The transitions come straight from engine.MOVES, so the chain follows
+#   exactly the same rules as the game.  The expected number of turns comes
+#   from the fundamental matrix (I - Q)^-1 and the distribution of turns
+#   from stepping the chain forward, both with NumPy.
+
+import numpy as np
+
+from engine import NEST, HOME, SQUARES, MOVES
+
+
+class PieceChain(object):
+
+    """The chain for `piece` of `player`.  squares lists the board index of
+    every state, the nest first and the home slot last; index maps a board
+    index back to its state.  P is the full transition matrix and Q its
+    transient part (every state but the home slot)."""
+
+    def __init__(self, player=0, piece=0):
+        marker = 4 * player + piece
+        nest = NEST[player] + piece
+        home = HOME[player] + piece
+        # Walk the squares the piece can reach, in the order it reaches them.
+        squares = [nest]
+        index = {nest: 0}
+        for square in squares:
+            for die in range(1, 7):
+                dest = MOVES[(marker * SQUARES + square) * 6 + die - 1]
+                if dest not in index and dest != home:
+                    index[dest] = len(squares)
+                    squares.append(dest)
+        index[home] = len(squares)
+        squares.append(home)
+        size = len(squares)
+        P = np.zeros((size, size))
+        for square in squares:
+            for die in range(1, 7):
+                dest = MOVES[(marker * SQUARES + square) * 6 + die - 1]
+                P[index[square], index[dest]] += 1 / 6.0
+        self.squares = squares
+        self.index = index
+        self.P = P
+        self.Q = P[:-1, :-1]
+
+    def fundamental(self):
+        """Return N = (I - Q)^-1: N[i, j] is the expected number of turns
+        spent in state j starting from state i."""
+        return np.linalg.inv(np.eye(len(self.Q)) - self.Q)
+
+    def expected_turns(self, square=None):
+        """Return the expected number of turns to get home from square (the
+        nest by default)."""
+        if square is None:
+            square = self.squares[0]
+        if square == self.squares[-1]:
+            return 0.0
+        size = len(self.Q)
+        turns = np.linalg.solve(np.eye(size) - self.Q, np.ones(size))
+        return float(turns[self.index[square]])
+
+    def distribution(self, max_turns=200, square=None):
+        """Return an array d with d[t] the chance of getting home in exactly
+        t turns from square (the nest by default), for t up to max_turns."""
+        if square is None:
+            square = self.squares[0]
+        state = np.zeros(len(self.squares))
+        state[self.index[square]] = 1.0
+        home = np.zeros(max_turns + 1)
+        home[0] = state[-1]
+        for turn in range(1, max_turns + 1):
+            state = state.dot(self.P)
+            home[turn] = state[-1]
+        return np.diff(home, prepend=0.0)
+
+
+def expected_turns(player=0, piece=0):
+    """Expected turns for one piece to get from its nest to its home slot."""
+    return PieceChain(player, piece).expected_turns()
@@ -0,0 +1,237 @@
+# mcts.py
+# Monte Carlo tree search (UCT) for Clip 'Em.  Each node of the tree is a
+#   state before its player to move has rolled.  An iteration rolls a die
+#   at every node on the way down, picks a piece by the UCT rule among the
+#   moves that die allows, adds one new node, plays the rest of the game
+#   out at random and credits the winner in every node it passed through.
+#
+# The playout is where nearly all the time goes, so it works on two
+#   bytearrays updated in place and never builds a GameState or a list of
+#   legal moves.  MCTSBot keeps its tree between turns: the next time it
+#   is asked to move it looks for the current state a few plies below the
+#   node it moved to, and carries on from there.
+
+import math
+import random
+import time
+
+from engine import (SQUARES, HOME, MOVES, new_game, legal_moves, apply_move,
+                    pass_turn, winner)
+from bots import Player
+
+# Playouts that have not finished by now count as a draw.
+PLAYOUT_PLIES = 5000
+
+
+def playout(state, rng, max_plies=PLAYOUT_PLIES):
+    """Play state out with random legal moves; return the winner or None."""
+    squares = bytearray(state.squares)
+    occupant = bytearray(state.occupant)
+    player = state.player
+    uniform = rng.random
+    for ply in range(max_plies):
+        die = int(uniform() * 6)
+        first = 4 * player
+        chosen = -1
+        count = 0
+        for marker in range(first, first + 4):
+            square = squares[marker]
+            dest = MOVES[(marker * SQUARES + square) * 6 + die]
+            if dest != square and not first < occupant[dest] <= first + 4:
+                # Keep each legal marker with chance 1/count, so the one
+                #   left at the end is uniform over them.
+                count += 1
+                if count == 1 or uniform() * count < 1:
+                    chosen = marker
+                    landing = dest
+        if chosen >= 0:
+            victim = occupant[landing] - 1
+            if victim >= 0:
+                squares[victim] = victim
+                occupant[victim] = victim + 1
+            occupant[squares[chosen]] = 0
+            occupant[landing] = chosen + 1
+            squares[chosen] = landing
+            home = HOME[player]
+            if (landing >= home and squares[first] == home and
+                    squares[first + 1] == home + 1 and
+                    squares[first + 2] == home + 2 and
+                    squares[first + 3] == home + 3):
+                return player
+        player = (player + 1) & 3
+    return None
+
+
+class Node(object):
+
+    """A state in the tree.  children maps (die, piece) to the node that
+    move leads to, or None to the node after a pass; rolls[die] counts how
+    often each die was rolled here and wins[player] the playouts through
+    this node each player won."""
+
+    __slots__ = ("state", "visits", "wins", "rolls", "legal", "children")
+
+    def __init__(self, state):
+        self.state = state
+        self.visits = 0
+        self.wins = [0, 0, 0, 0]
+        self.rolls = [0] * 7
+        self.legal = [None] * 7
+        self.children = {}
+
+    def moves(self, die):
+        legal = self.legal[die]
+        if legal is None:
+            legal = self.legal[die] = legal_moves(self.state, self.state.player, die)
+        return legal
+
+    def find(self, state, depth):
+        """Return the node for state at most depth plies below this one."""
+        level = [self]
+        for _ in range(depth + 1):
+            below = []
+            for node in level:
+                if node.state == state:
+                    return node
+                below.extend(node.children.values())
+            level = below
+        return None
+
+
+class Tree(object):
+
+    """A search tree rooted at root, grown one iteration at a time."""
+
+    def __init__(self, root, rng, exploration=1.4):
+        self.root = root
+        self.rng = rng
+        self.exploration = exploration
+
+    def select(self, node, die):
+        """Return the piece to try at node for die: an untried one if there
+        is any, otherwise the one with the best UCT score."""
+        children = node.children
+        player = node.state.player
+        untried = [piece for piece in node.moves(die) if (die, piece) not in children]
+        if untried:
+            return self.rng.choice(untried)
+        scale = self.exploration * math.sqrt(math.log(node.rolls[die]))
+        best = None
+        for piece in node.moves(die):
+            child = children[die, piece]
+            score = (child.wins[player] / float(child.visits) +
+                     scale / math.sqrt(child.visits))
+            if best is None or score > best:
+                best = score
+                choice = piece
+        return choice
+
+    def iterate(self, die=None):
+        """Run one iteration.  die, if given, is the roll at the root."""
+        node = self.root
+        path = [node]
+        while True:
+            won = winner(node.state)
+            if won is not None:
+                break
+            if die is None:
+                die = self.rng.randint(1, 6)
+            node.rolls[die] += 1
+            if node.moves(die):
+                piece = self.select(node, die)
+                key = (die, piece)
+            else:
+                key = None
+            child = node.children.get(key)
+            if child is None:
+                if key is None:
+                    child = Node(pass_turn(node.state))
+                else:
+                    child = Node(apply_move(node.state, node.state.player, piece, die))
+                node.children[key] = child
+                path.append(child)
+                # playout() only looks for a win after a move it makes.
+                won = winner(child.state)
+                if won is None:
+                    won = playout(child.state, self.rng)
+                break
+            node = child
+            path.append(node)
+            die = None
+        for node in path:
+            node.visits += 1
+            if won is not None:
+                node.wins[won] += 1
+
+    def best(self, die):
+        """Return the most visited piece at the root for die."""
+        children = self.root.children
+
+        def visits(piece):
+            child = children.get((die, piece))
+            return child.visits if child is not None else -1
+        return max(self.root.moves(die), key=visits)
+
+
+class MCTSBot(Player):
+
+    """UCT search that stops after `budget` seconds or `iterations`
+    iterations, whichever comes first (either may be None, not both).
+    After each move, playouts and elapsed hold the work done for it and
+    rate() the playouts per second."""
+
+    name = "MCTS Bot"
+
+    def __init__(self, budget=0.5, iterations=None, exploration=1.4, rng=None):
+        if budget is None and iterations is None:
+            raise ValueError("MCTSBot needs a budget or an iterations limit")
+        self.budget = budget
+        self.iterations = iterations
+        self.exploration = exploration
+        self.rng = rng or random.Random()
+        self.node = None
+        self.playouts = 0
+        self.elapsed = 0.0
+
+    def choose_move(self, state, die, legal_moves):
+        root = None
+        if self.node is not None:
+            root = self.node.find(state, 4)
+        if root is None:
+            root = Node(state)
+        tree = Tree(root, self.rng, self.exploration)
+        start = time.time()
+        if self.budget is not None:
+            deadline = start + self.budget
+        count = 0
+        while self.iterations is None or count < self.iterations:
+            tree.iterate(die)
+            count += 1
+            if self.budget is not None and not count & 15 and time.time() > deadline:
+                break
+        self.playouts = count
+        self.elapsed = time.time() - start
+        piece = tree.best(die)
+        self.node = root.children.get((die, piece))
+        return piece
+
+    def rate(self):
+        if not self.elapsed:
+            return 0.0
+        return self.playouts / self.elapsed
+
+
+def benchmark(seconds=1.0, seed=1):
+    """Return the playouts per second of playout() from the opening."""
+    rng = random.Random(seed)
+    state = new_game()
+    count = 0
+    start = time.time()
+    while time.time() - start < seconds:
+        playout(state, rng)
+        count += 1
+    return count / (time.time() - start)
+
+
+if __name__ == "__main__":
+    print("{0:.0f} playouts/s".format(benchmark()))
@@ -0,0 +1,2425 @@
+# oldrules.py
+# The move rules as clip_em.py had them before engine.py: moves() and its
+#   p*zhelper, pmoves*, psmoves*, clipped() and check() helpers, copied
+#   unchanged.  They are kept only so that test_rules.py can replay them
+#   against the engine; nothing else imports this module.
+#
+# The old rules hold each player's markers as a list of four squares, 0
+#   for the nest, and learn which marker to move from mouse clicks.
+#   old_move() at the bottom feeds them one click through a stand-in
+#   window and converts to and from engine squares.
+
+def gameOver(p1, p2, p3, p4):
+    return p1 == [73,74,75,76] or p2 == [82,83,84,85] or p3 == [91,92,93,94] or p4 == [100,101,102,103]
+
+def clipped(win, updatedpos, player, positions1, positions2, positions3):
+    list = [positions1, positions2, positions3]
+    for i in list:
+        for p in i:
+            if p == updatedpos:
+                positions1, positions2, positions3 = check(win, updatedpos, player,
+                                                           positions1, positions2,
+                                                           positions3)
+    return positions1, positions2, positions3
+
+def check(win, updatedpos, player, positions1, positions2, positions3):
+    list = [positions1, positions2, positions3]
+    l = -1
+    for i in list:
+        l = l + 1
+        n = -1
+        for p in i:
+            n = n + 1
+            if p == updatedpos:
+                spot = n
+                person = l
+                break
+    if player == "player1":
+        if person == 0:
+            if spot == 0:
+                positions1[0] = 0
+            elif spot == 1:
+                positions1[1] = 0
+            elif spot == 2:
+                positions1[2] = 0
+            elif spot == 3:
+                positions1[3] = 0
+        elif person == 1:
+            if spot == 0:
+                positions2[0] = 0
+            elif spot == 1:
+                positions2[1] = 0
+            elif spot == 2:
+                positions2[2] = 0
+            elif spot == 3:
+                positions2[3] = 0
+        else:
+            if spot == 0:
+                positions3[0] = 0
+            elif spot == 1:
+                positions3[1] = 0
+            elif spot == 2:
+                positions3[2] = 0
+            elif spot == 3:
+                positions3[3] = 0
+    elif player == "player2":
+        if person == 0:
+            if spot == 0:
+                positions1[0] = 0
+            elif spot == 1:
+                positions1[1] = 0
+            elif spot == 2:
+                positions1[2] = 0
+            elif spot == 3:
+                positions1[3] = 0
+        elif person == 1:
+            if spot == 0:
+                positions2[0] = 0
+            elif spot == 1:
+                positions2[1] = 0
+            elif spot == 2:
+                positions2[2] = 0
+            elif spot == 3:
+                positions2[3] = 0
+        else:
+            if spot == 0:
+                positions3[0] = 0
+            elif spot == 1:
+                positions3[1] = 0
+            elif spot == 2:
+                positions3[2] = 0
+            elif spot == 3:
+                positions3[3] = 0
+    elif player == "player3":
+        if person == 0:
+            if spot == 0:
+                positions1[0] = 0
+            elif spot == 1:
+                positions1[1] = 0
+            elif spot == 2:
+                positions1[2] = 0
+            elif spot == 3:
+                positions1[3] = 0
+        elif person == 1:
+            if spot == 0:
+                positions2[0] = 0
+            elif spot == 1:
+                positions2[1] = 0
+            elif spot == 2:
+                positions2[2] = 0
+            elif spot == 3:
+                positions2[3] = 0
+        else:
+            if spot == 0:
+                positions3[0] = 0
+            elif spot == 1:
+                positions3[1] = 0
+            elif spot == 2:
+                positions3[2] = 0
+            elif spot == 3:
+                positions3[3] = 0
+    else:
+        if person == 0:
+            if spot == 0:
+                positions1[0] = 0
+            elif spot == 1:
+                positions1[1] = 0
+            elif spot == 2:
+                positions1[2] = 0
+            elif spot == 3:
+                positions1[3] = 0
+        elif person == 1:
+            if spot == 0:
+                positions2[0] = 0
+            elif spot == 1:
+                positions2[1] = 0
+            elif spot == 2:
+                positions2[2] = 0
+            elif spot == 3:
+                positions2[3] = 0
+        else:
+            if spot == 0:
+                positions3[0] = 0
+            elif spot == 1:
+                positions3[1] = 0
+            elif spot == 2:
+                positions3[2] = 0
+            elif spot == 3:
+                positions3[3] = 0
+
+    return positions1, positions2, positions3
+
+def moves(win, value, positions, player, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, m11, m12, m13, m14, m15, m16,
+          positions1, positions2, positions3):
+    w,x,y,z = positions[0], positions[1], positions[2], positions[3]
+    if w+x+y+z == 0:
+        if player == "player1":
+            if value == 6:
+                pmoves6_0(win, player, positions, m1, m2, m3, m4, positions1, positions2, positions3)
+            else:
+                pass
+        if player == "player2":
+            if value == 6:
+                pmoves6_0(win, player, positions, m5, m6, m7, m8, positions1, positions2, positions3)
+            else:
+                pass
+        if player == "player3":
+            if value == 6:
+                pmoves6_0(win, player, positions, m9, m10, m11, m12, positions1, positions2, positions3)
+            else:
+                pass
+        if player == "player4":
+            if value == 6:
+                pmoves6_0(win, player, positions, m13, m14, m15, m16, positions1, positions2, positions3)
+            else:
+                pass
+    elif (w!=0 and x!=0 and y!=0 and z!=0):
+        if player == "player1":
+            p0zhelper(win, player, positions, value, w, x, y, z, m1, m2, m3, m4,
+                      73, 74, 75, 76, positions1, positions2, positions3)
+        if player == "player2":
+            p0zhelper(win, player, positions, value, w, x, y, z, m5, m6, m7, m8,
+                      82, 83, 84, 85, positions1, positions2, positions3)
+        if player == "player3":
+            p0zhelper(win, player, positions, value, w, x, y, z, m9, m10, m11, m12,
+                      91, 92, 93, 94, positions1, positions2, positions3)
+        if player == "player4":
+            p0zhelper(win, player, positions, value, w, x, y, z, m13, m14, m15, m16,
+                      100, 101, 102, 103, positions1, positions2, positions3)
+    elif w+x+y == 0:
+        if player == "player1":
+            p3zhelper(win, player, positions, value, m1, m2, m3, m4, z, 16, 76, 0, 1, 2, 3, positions1, positions2, positions3)
+        if player == "player2":
+            p3zhelper(win, player, positions, value, m5, m6, m7, m8, z, 29, 85, 0, 1, 2, 3, positions1, positions2, positions3)
+        if player == "player3":
+            p3zhelper(win, player, positions, value, m9, m10, m11, m12, z, 42, 94, 0, 1, 2, 3, positions1, positions2, positions3)
+        if player == "player4":
+            p3zhelper(win, player, positions, value, m13, m14, m15, m16, z, 55, 103, 0, 1, 2, 3, positions1, positions2, positions3)
+    elif w+x+z == 0:
+        if player == "player1":
+            p3zhelper(win, player, positions, value, m1, m2, m4, m3, y, 16, 75, 0, 1, 3, 2, positions1, positions2, positions3)
+        if player == "player2":
+            p3zhelper(win, player, positions, value, m5, m6, m8, m7, y, 29, 84, 0, 1, 3, 2, positions1, positions2, positions3)
+        if player == "player3":
+            p3zhelper(win, player, positions, value, m9, m10, m12, m11, y, 42, 93, 0, 1, 3, 2, positions1, positions2, positions3)
+        if player == "player4":
+            p3zhelper(win, player, positions, value, m13, m14, m16, m15, y, 55, 102, 0, 1, 3, 2, positions1, positions2, positions3)
+    elif w+y+z == 0:
+        if player == "player1":
+            p3zhelper(win, player, positions, value, m1, m3, m4, m2, x, 16, 74, 0, 2, 3, 1, positions1, positions2, positions3)
+        if player == "player2":
+            p3zhelper(win, player, positions, value, m5, m7, m8, m6, x, 29, 83, 0, 2, 3, 1, positions1, positions2, positions3)
+        if player == "player3":
+            p3zhelper(win, player, positions, value, m9, m11, m12, m10, x, 42, 92, 0, 2, 3, 1, positions1, positions2, positions3)
+        if player == "player4":
+            p3zhelper(win, player, positions, value, m13, m15, m16, m14, x, 55, 101, 0, 2, 3, 1, positions1, positions2, positions3)
+    elif x+y+z == 0:
+        if player == "player1":
+            p3zhelper(win, player, positions, value, m2, m3, m4, m1, w, 16, 73, 1, 2, 3, 0, positions1, positions2, positions3)
+        elif player == "player2":
+            p3zhelper(win, player, positions, value, m6, m7, m8, m5, w, 29, 82, 1, 2, 3, 0, positions1, positions2, positions3)
+        elif player == "player3":
+            p3zhelper(win, player, positions, value, m10, m11, m12, m9, w, 42, 91, 1, 2, 3, 0, positions1, positions2, positions3)
+        elif player == "player4":
+            p3zhelper(win, player, positions, value, m14, m15, m16, m13, w, 55, 100, 1, 2, 3, 0, positions1, positions2, positions3)
+    elif w+x == 0:
+        if player == "player1":
+            p2zhelper(win, player, positions, value, m1, m2, m3, m4, y, 16, 75, z, 76, 0, 1, 2, 3, positions1, positions2, positions3)
+        if player == "player2":
+            p2zhelper(win, player, positions, value, m5, m6, m7, m8, y, 29, 84, z, 85, 0, 1, 2, 3, positions1, positions2, positions3)
+        if player == "player3":
+            p2zhelper(win, player, positions, value, m9, m10, m11, m12, y, 42, 93, z, 94, 0, 1, 2, 3, positions1, positions2, positions3)
+        if player == "player4":
+            p2zhelper(win, player, positions, value, m13, m14, m15, m16, y, 55, 102, z, 103, 0, 1, 2, 3, positions1, positions2, positions3)
+    elif w+y == 0:
+        if player == "player1":
+            p2zhelper(win, player, positions, value, m1, m3, m2, m4, x, 16, 74, z, 76, 0, 2, 1, 3, positions1, positions2, positions3)
+        if player == "player2":
+            p2zhelper(win, player, positions, value, m5, m7, m6, m8, x, 29, 83, z, 85, 0, 2, 1, 3, positions1, positions2, positions3)
+        if player == "player3":
+            p2zhelper(win, player, positions, value, m9, m11, m10, m12, x, 42, 92, z, 94, 0, 2, 1, 3, positions1, positions2, positions3)
+        if player == "player4":
+            p2zhelper(win, player, positions, value, m13, m15, m14, m16, x, 55, 101, z, 103, 0, 2, 1, 3, positions1, positions2, positions3)
+    elif w+z == 0:
+        if player == "player1":
+            p2zhelper(win, player, positions, value, m1, m4, m2, m3, x, 16, 74, y, 75, 0, 3, 1, 2, positions1, positions2, positions3)
+        if player == "player2":
+            p2zhelper(win, player, positions, value, m5, m8, m6, m7, x, 29, 83, y, 84, 0, 3, 1, 2, positions1, positions2, positions3)
+        if player == "player3":
+            p2zhelper(win, player, positions, value, m9, m12, m10, m11, x, 42, 92, y, 93, 0, 3, 1, 2, positions1, positions2, positions3)
+        if player == "player4":
+            p2zhelper(win, player, positions, value, m13, m16, m14, m15, x, 55, 101, y, 102, 0, 3, 1, 2, positions1, positions2, positions3)
+    elif x+y == 0:
+        if player == "player1":
+            p2zhelper(win, player, positions, value, m2, m3, m1, m4, w, 16, 73, z, 76, 1, 2, 0, 3, positions1, positions2, positions3)
+        if player == "player2":
+            p2zhelper(win, player, positions, value, m6, m7, m5, m8, w, 29, 82, z, 85, 1, 2, 0, 3, positions1, positions2, positions3)
+        if player == "player3":
+            p2zhelper(win, player, positions, value, m10, m11, m9, m12, w, 42, 91, z, 94, 1, 2, 0, 3, positions1, positions2, positions3)
+        if player == "player4":
+            p2zhelper(win, player, positions, value, m14, m15, m13, m16, w, 55, 100, z, 103, 1, 2, 0, 3, positions1, positions2, positions3)
+    elif x+z == 0:
+        if player == "player1":
+            p2zhelper(win, player, positions, value, m2, m4, m1, m3, w, 16, 73, y, 75, 1, 3, 0, 2, positions1, positions2, positions3)
+        if player == "player2":
+            p2zhelper(win, player, positions, value, m6, m8, m5, m7, w, 29, 82, y, 84, 1, 3, 0, 2, positions1, positions2, positions3)
+        if player == "player3":
+            p2zhelper(win, player, positions, value, m10, m12, m9, m11, w, 42, 91, y, 93, 1, 3, 0, 2, positions1, positions2, positions3)
+        if player == "player4":
+            p2zhelper(win, player, positions, value, m14, m16, m13, m15, w, 55, 100, y, 102, 1, 3, 0, 2, positions1, positions2, positions3)
+    elif y+z == 0:
+        if player == "player1":
+            p2zhelper(win, player, positions, value, m3, m4, m1, m2, w, 16, 73, x, 74, 2, 3, 0, 1, positions1, positions2, positions3)
+        if player == "player2":
+            p2zhelper(win, player, positions, value, m7, m8, m5, m6, w, 29, 82, x, 83, 2, 3, 0, 1, positions1, positions2, positions3)
+        if player == "player3":
+            p2zhelper(win, player, positions, value, m11, m12, m9, m10, w, 42, 91, x, 92, 2, 3, 0, 1, positions1, positions2, positions3)
+        if player == "player4":
+            p2zhelper(win, player, positions, value, m15, m16, m13, m14, w, 55, 100, x, 101, 2, 3, 0, 1, positions1, positions2, positions3)
+    elif w == 0:
+        if player == "player1":
+            p1zhelper(win, player, positions, value, m1, m2, m3, m4, x, y, z, 0, 1, 2, 3, 16, 74, 75, 76, positions1, positions2, positions3)
+        if player == "player2":
+            p1zhelper(win, player, positions, value, m5, m6, m7, m8, x, y, z, 0, 1, 2, 3, 29, 83, 84, 85, positions1, positions2, positions3)
+        if player == "player3":
+            p1zhelper(win, player, positions, value, m9, m10, m11, m12, x, y, z, 0, 1, 2, 3, 42, 92, 93, 94, positions1, positions2, positions3)
+        if player == "player4":
+            p1zhelper(win, player, positions, value, m13, m14, m15, m16, x, y, z, 0, 1, 2, 3, 55, 101, 102, 103, positions1, positions2, positions3)
+    elif x == 0:
+        if player == "player1":
+            p1zhelper(win, player, positions, value, m2, m1, m3, m4, w, y, z, 1, 0, 2, 3, 16, 73, 75, 76, positions1, positions2, positions3)
+        if player == "player2":
+            p1zhelper(win, player, positions, value, m6, m5, m7, m8, w, y, z, 1, 0, 2, 3, 29, 82, 84, 85, positions1, positions2, positions3)
+        if player == "player3":
+            p1zhelper(win, player, positions, value, m10, m9, m11, m12, w, y, z, 1, 0, 2, 3, 42, 91, 93, 94, positions1, positions2, positions3)
+        if player == "player4":
+            p1zhelper(win, player, positions, value, m14, m13, m15, m16, w, y, z, 1, 0, 2, 3, 55, 100, 102, 103, positions1, positions2, positions3)
+    elif y == 0:
+        if player == "player1":
+            p1zhelper(win, player, positions, value, m3, m1, m2, m4, w, x, z, 2, 0, 1, 3, 16, 73, 74, 76, positions1, positions2, positions3)
+        if player == "player2":
+            p1zhelper(win, player, positions, value, m7, m5, m6, m8, w, x, z, 2, 0, 1, 3, 29, 82, 83, 85, positions1, positions2, positions3)
+        if player == "player3":
+            p1zhelper(win, player, positions, value, m11, m9, m10, m12, w, x, z, 2, 0, 1, 3, 42, 91, 92, 94, positions1, positions2, positions3)
+        if player == "player4":
+            p1zhelper(win, player, positions, value, m15, m13, m14, m16, w, x, z, 2, 0, 1, 3, 55, 100, 101, 103, positions1, positions2, positions3)
+    elif z == 0:
+        if player == "player1":
+            p1zhelper(win, player, positions, value, m4, m1, m2, m3, w, x, y, 3, 0, 1, 2, 16, 73, 74, 75, positions1, positions2, positions3)
+        if player == "player2":
+            p1zhelper(win, player, positions, value, m8, m5, m6, m7, w, x, y, 3, 0, 1, 2, 29, 82, 83, 84, positions1, positions2, positions3)
+        if player == "player3":
+            p1zhelper(win, player, positions, value, m12, m9, m10, m11, w, x, y, 3, 0, 1, 2, 42, 91, 92, 93, positions1, positions2, positions3)
+        if player == "player4":
+            p1zhelper(win, player, positions, value, m16, m13, m14, m15, w, x, y, 3, 0, 1, 2, 55, 100, 101, 102, positions1, positions2, positions3)
+                
+    return positions, positions1, positions2, positions3
+
+def p3zhelper(win, player, positions, value, m1zero, m2zero, m3zero, m1nozero,
+               l_nozero, start_nozero, home_nozero, comp1, comp2, comp3, comp4, positions1, positions2, positions3):
+    if l_nozero == start_nozero:
+        pmoves1(win, player, positions, value, m1nozero, comp4, positions1, positions2, positions3)
+    elif l_nozero == home_nozero:
+        if value == 6:
+            psmoves3(win, player, positions, m1zero, m2zero, m3zero, comp1, comp2,
+                     comp3, positions1, positions2, positions3)
+        else:
+            pass
+    else:
+        if value == 6:
+            pmoves6_1(win, player, positions, m1zero, m2zero, m3zero, m1nozero,
+                      comp1, comp2, comp3, comp4, positions1, positions2, positions3)
+        else:
+            pmoves1(win, player, positions, value, m1nozero, comp4, positions1, positions2, positions3) 
+
+def p2zhelper(win, player, positions, value, m1zero, m2zero, m1nozero, m2nozero,
+              l1_nozero, start, home1_nozero, l2_nozero, home2_nozero, comp1,
+              comp2, comp3, comp4, positions1, positions2, positions3):
+    if l1_nozero == start or l2_nozero == start:
+        if (l1_nozero + value) == l2_nozero:
+            pmoves1(win, player, positions, value, m2nozero, comp4, positions1, positions2, positions3)
+        elif (l2_nozero + value) == l1_nozero:
+            pmoves1(win, player, positions, value, m1nozero, comp3, positions1, positions2, positions3)
+        else:
+            pmoves2(win, player, positions, value, m1nozero, m2nozero, comp3,
+                    comp4, positions1, positions2, positions3)
+    elif l1_nozero == start and l2_nozero == home2_nozero:
+        pmoves1(win, player, positions, value, m1nozero, comp3, positions1, positions2, positions3)
+    elif l2_nozero == start and l1_nozero == home1_nozero:
+        pmoves1(win, player, positions, value, m2nozero, comp4, positions1, positions2, positions3)
+    elif l1_nozero == home1_nozero and l2_nozero == home2_nozero:
+        if value == 6:
+            psmoves2(win, player, positions, m1zero, m2zero, comp1, comp2, positions1, positions2, positions3)
+        else:
+            pass
+    elif l1_nozero == start:
+        if (l1_nozero + value) == l2_nozero:
+            pmoves1(win, player, positions, value, m2nozero, comp4, positions1, positions2, positions3)
+        else:
+            pmoves2(win, player, positions, value, m1nozero, m2nozero, comp3,
+                    comp4, positions1, positions2, positions3)
+    elif l2_nozero == start:
+        if (l2_nozero + value) == l1_nozero:
+            pmoves1(win, player, positions, value, m1nozero, comp3, positions1, positions2, positions3)
+        else:
+            pmoves2(win, player, positions, value, m1nozero, m2nozero, comp3,
+                    comp4, positions1, positions2, positions3)
+    elif l2_nozero == home2_nozero:
+        if value == 6:
+            psmoves2_1(win, player, positions, value, m1zero, m2zero, m1nozero,
+                       comp1, comp2, comp3, positions1, positions2, positions3)
+        else:
+            pmoves1(win, player, positions, value, m1nozero, comp3, positions1, positions2, positions3)
+    elif l1_nozero == home1_nozero:
+        if value == 6:
+            psmoves2_1(win, player, positions, value, m1zero, m2zero, m2nozero,
+                       comp1, comp2, comp4, positions1, positions2, positions3)
+        else:
+            pmoves1(win, player, positions, value, m2nozero, comp4, positions1, positions2, positions3)
+    else:
+        if (l1_nozero + value) == l2_nozero:
+            if value == 6:
+                psmoves2_1(win, player, positions, value, m1zero, m2zero, m2nozero,
+                           comp1, comp2, comp4, positions1, positions2, positions3)
+            else:
+                pmoves1(win, player, positions, value, m2nozero, comp4, positions1, positions2, positions3)
+        elif (l2_nozero + value) == l1_nozero:
+            if value == 6:
+                psmoves2_1(win, player, positions, value, m1zero, m2zero, m1nozero,
+                           comp1, comp2, comp3, positions1, positions2, positions3)
+            else:
+                pmoves1(win, player, positions, value, m1nozero, comp3, positions1, positions2, positions3)
+        else:
+            if value == 6:
+                psmoves2_2(win, player, positions, value, m1zero, m2zero, m1nozero,
+                           m2nozero, comp1, comp2, comp3, comp4, positions1, positions2, positions3)
+            else:
+                pmoves2(win, player, positions, value, m1nozero, m2nozero, comp3,
+                        comp4, positions1, positions2, positions3)
+
+def p1zhelper(win, player, positions, value, m1zero, m1nozero, m2nozero, m3nozero,
+              l1_nozero, l2_nozero, l3_nozero, comp1, comp2, comp3,
+              comp4, start, home1_nozero, home2_nozero, home3_nozero, positions1, positions2, positions3):
+    if l1_nozero == home1_nozero and l2_nozero == home2_nozero and l3_nozero == home3_nozero:
+        if value == 6:
+            psmoves1(win, player, positions, m1zero, comp1, positions1, positions2, positions3)
+        else:
+            pass
+    elif l1_nozero == home1_nozero and l2_nozero == home2_nozero:
+        if l3_nozero == start:
+            pmoves1(win, player, positions, value, m3nozero, comp4, positions1, positions2, positions3)
+        else:
+            if value == 6:
+                psmoves1_1(win, player, positions, value, m1zero, m3nozero, comp1, comp4, positions1, positions2, positions3)
+            else:
+                pmoves1(win, player, positions, value, m3nozero, comp4, positions1, positions2, positions3)
+    elif l1_nozero == home1_nozero and l3_nozero == home3_nozero:
+        if l2_nozero == start:
+            pmoves1(win, player, positions, value, m2nozero, comp3, positions1, positions2, positions3)
+        else:
+            if value == 6:
+                psmoves1_1(win, player, positions, value, m1zero, m2nozero, comp1, comp3, positions1, positions2, positions3)
+            else:
+                pmoves1(win, player, positions, value, m2nozero, comp3, positions1, positions2, positions3)
+    elif l2_nozero == home2_nozero and l3_nozero == home3_nozero:
+        if l1_nozero == start:
+            pmoves1(win, player, positions, value, m1nozero, comp2, positions1, positions2, positions3)
+        else:
+            if value == 6:
+                psmoves1_1(win, player, positions, value, m1zero, m1nozero, comp1, comp2, positions1, positions2, positions3)
+            else:
+                pmoves1(win, player, positions, value, m1nozero, comp2, positions1, positions2, positions3)
+    elif l1_nozero == home1_nozero:
+        if l2_nozero == start or l3_nozero == start:
+            if (l2_nozero + value) == l3_nozero:
+                pmoves1(win, player, positions, value, m3nozero, comp4, positions1, positions2, positions3)
+            elif (l3_nozero + value) == l2_nozero:
+                pmoves1(win, player, positions, value, m2nozero, comp3, positions1, positions2, positions3)
+            else:
+                pmoves2(win, player, positions, value, m2nozero, m3nozero, comp3, comp4, positions1, positions2, positions3)
+        else:
+            if (l2_nozero + value) == l3_nozero:
+                if value == 6:
+                    psmoves1_1(win, player, positions, value, m1zero, m3nozero, comp1, comp4, positions1, positions2, positions3)
+                else:
+                    pmoves1(win, player, positions, value, m3nozero, comp4, positions1, positions2, positions3)
+            elif (l3_nozero + value) == l2_nozero:
+                if value == 6:
+                    psmoves1_1(win, player, positions, value, m1zero, m2nozero, comp1, comp3, positions1, positions2, positions3)
+                else:
+                    pmoves1(win, player, positions, value, m2nozero, comp3, positions1, positions2, positions3)
+            else:
+                psmoves1_2(win, player, positions, value, m1zero, m2nozero, m3nozero, comp1, comp3, comp4, positions1, positions2, positions3)
+    elif l2_nozero == home2_nozero:
+        if l1_nozero == start or l3_nozero == start:
+            if (l1_nozero + value) == l3_nozero:
+                pmoves1(win, player, positions, value, m3nozero, comp4, positions1, positions2, positions3)
+            elif (l3_nozero + value) == l1_nozero:
+                pmoves1(win, player, positions, value, m1nozero, comp2, positions1, positions2, positions3)
+            else:
+                pmoves2(win, player, positions, value, m1nozero, m3nozero, comp2, comp4, positions1, positions2, positions3)
+        else:
+            if (l1_nozero + value) == l3_nozero:
+                if value == 6:
+                    psmoves1_1(win, player, positions, value, m1zero, m3nozero, comp1, comp4, positions1, positions2, positions3)
+                else:
+                    pmoves1(win, player, positions, value, m3nozero, comp4, positions1, positions2, positions3)
+            elif (l3_nozero + value) == l1_nozero:
+                if value == 6:
+                    psmoves1_1(win, player, positions, value, m1zero, m1nozero, comp1, comp2, positions1, positions2, positions3)
+                else:
+                    pmoves1(win, player, positions, value, m1nozero, comp2, positions1, positions2, positions3)
+            else:
+                psmoves1_2(win, player, positions, value, m1zero, m1nozero, m3nozero, comp1, comp2, comp4, positions1, positions2, positions3)
+    elif l3_nozero == home3_nozero:
+        if l1_nozero == start or l2_nozero == start:
+            if (l1_nozero + value) == l2_nozero:
+                pmoves1(win, player, positions, value, m2nozero, comp3, positions1, positions2, positions3)
+            elif (l2_nozero + value) == l1_nozero:
+                pmoves1(win, player, positions, value, m1nozero, comp2, positions1, positions2, positions3)
+            else:
+                pmoves2(win, player, positions, value, m1nozero, m2nozero, comp2, comp3, positions1, positions2, positions3)
+        else:
+            if (l1_nozero + value) == l2_nozero:
+                if value == 6:
+                    psmoves1_1(win, player, positions, value, m1zero, m2nozero, comp1, comp3, positions1, positions2, positions3)
+                else:
+                    pmoves1(win, player, positions, value, m2nozero, comp3, positions1, positions2, positions3)
+            elif (l2_nozero + value) == l1_nozero:
+                if value == 6:
+                    psmoves1_1(win, player, positions, value, m1zero, m1nozero, comp1, comp2, positions1, positions2, positions3)
+                else:
+                    pmoves1(win, player, positions, value, m1nozero, comp2, positions1, positions2, positions3)
+            else:
+                psmoves1_2(win, player, positions, value, m1zero, m1nozero, m2nozero, comp1, comp2, comp3, positions1, positions2, positions3)
+    else:
+        if l1_nozero == start or l2_nozero == start or l3_nozero == start:
+            if (l1_nozero + value) == l2_nozero or (l1_nozero + value) == l3_nozero:
+                if (l2_nozero + value) == l3_nozero:
+                    pmoves1(win, player, positions, value, m3nozero, comp4, positions1, positions2, positions3)
+                elif (l3_nozero + value) == l2_nozero:
+                    pmoves1(win, player, positions, value, m2nozero, comp3, positions1, positions2, positions3)
+                else:
+                    pmoves2(win, player, positions, value, m2nozero, m3nozero, comp3, comp4, positions1, positions2, positions3)
+            elif (l2_nozero + value) == l1_nozero or (l2_nozero + value) == l3_nozero:
+                if (l1_nozero + value) == l3_nozero:
+                    pmoves1(win, player, positions, value, m3nozero, comp4, positions1, positions2, positions3)
+                elif (l3_nozero + value) == l1_nozero:
+                    pmoves1(win, player, positions, value, m1nozero, comp2, positions1, positions2, positions3)
+                else:
+                    pmoves2(win, player, positions, value, m1nozero, m3nozero, comp2, comp4, positions1, positions2, positions3)
+            elif (l3_nozero + value) == l1_nozero or (l3_nozero + value) == l2_nozero:
+                if (l1_nozero + value) == l2_nozero:
+                    pmoves1(win, player, positions, value, m2nozero, comp3, positions1, positions2, positions3)
+                elif (l2_nozero + value) == l1_nozero:
+                    pmoves1(win, player, positions, value, m1nozero, comp2, positions1, positions2, positions3)
+                else:
+                    pmoves2(win, player, positions, value, m1nozero, m2nozero, comp2, comp3, positions1, positions2, positions3)
+            else:
+                pmoves3(win, player, positions, value, m1nozero, m2nozero, m3nozero, comp2, comp3, comp4, positions1, positions2, positions3)
+        else:
+            if (l1_nozero + value) == l2_nozero or (l1_nozero + value) == l3_nozero:
+                if (l2_nozero + value) == l3_nozero:
+                    if value == 6:
+                        psmoves1_1(win, player, positions, value, m1zero, m3nozero, comp1, comp4, positions1, positions2, positions3)
+                    else:
+                        pmoves1(win, player, positions, value, m3nozero, comp4, positions1, positions2, positions3)
+                elif (l3_nozero + value) == l2_nozero:
+                    if value == 6:
+                        psmoves1_1(win, player, positions, value, m1zero, m2nozero, comp1, comp3, positions1, positions2, positions3)
+                    else:
+                        pmoves1(win, player, positions, value, m2nozero, comp3, positions1, positions2, positions3)
+                else:
+                    if value == 6:
+                        psmoves1_2(win, player, positions, value, m1zero, m2nozero, m3nozero, comp1, comp3, comp4, positions1, positions2, positions3)
+                    else:
+                        pmoves2(win, player, positions, value, m2nozero, m3nozero, comp3, comp4, positions1, positions2, positions3)
+            elif (l2_nozero + value) == l1_nozero or (l2_nozero + value) == l3_nozero:
+                if (l1_nozero + value) == l3_nozero:
+                    if value == 6:
+                        psmoves1_1(win, player, positions, value, m1zero, m3nozero, comp1, comp4, positions1, positions2, positions3)
+                    else:
+                        pmoves1(win, player, positions, value, m3nozero, comp4, positions1, positions2, positions3)
+                elif (l3_nozero + value) == l1_nozero:
+                    if value == 6:
+                        psmoves1_1(win, player, positions, value, m1zero, m1nozero, comp1, comp2, positions1, positions2, positions3)
+                    else:
+                        pmoves1(win, player, positions, value, m1nozero, comp2, positions1, positions2, positions3)
+                else:
+                    if value == 6:
+                        psmoves1_2(win, player, positions, value, m1zero, m1nozero, m3nozero, comp1, comp2, comp4, positions1, positions2, positions3)
+                    else:
+                        pmoves2(win, player, positions, value, m1nozero, m3nozero, comp2, comp4, positions1, positions2, positions3)
+            elif (l3_nozero + value) == l1_nozero or (l3_nozero + value) == l2_nozero:
+                if (l1_nozero + value) == l2_nozero:
+                    if value == 6:
+                        psmoves1_1(win, player, positions, value, m1zero, m2nozero, comp1, comp3, positions1, positions2, positions3)
+                    else:
+                        pmoves1(win, player, positions, value, m2nozero, comp3, positions1, positions2, positions3)
+                elif (l2_nozero + value) == l1_nozero:
+                    if value == 6:
+                        psmoves1_1(win, player, positions, value, m1zero, m1nozero, comp1, comp2, positions1, positions2, positions3)
+                    else:
+                        pmoves1(win, player, positions, value, m1nozero, comp2, positions1, positions2, positions3)
+                else:
+                    if value == 6:
+                        psmoves1_2(win, player, positions, value, m1zero, m1nozero, m2nozero, comp1, comp2, comp3, positions1, positions2, positions3)
+                    else:
+                        pmoves2(win, player, positions, value, m1nozero, m2nozero, comp2, comp3, positions1, positions2, positions3)
+            else:
+                if value == 6:
+                    psmoves1_3(win, player, positions, value, m1zero, m1nozero, m2nozero, m3nozero,
+                           comp1, comp2, comp3, comp4, positions1, positions2, positions3)
+                else:
+                    pmoves3(win, player, positions, value, m1nozero, m2nozero, m3nozero, comp2, comp3, comp4, positions1, positions2, positions3)
+
+def p0zhelper(win, player, positions, value, w, x, y, z, m1, m2, m3, m4, home1,
+              home2, home3, home4, positions1, positions2, positions3):
+    if w == home1 and x == home2 and y == home3:
+        pmoves1(win, player, positions, value, m4, 3, positions1, positions2, positions3)
+    elif w == home1 and x == home2 and z == home4:
+        pmoves1(win, player, positions, value, m3, 2, positions1, positions2, positions3)
+    elif w == home1 and y == home3 and z == home4:
+        pmoves1(win, player, positions, value, m2, 1, positions1, positions2, positions3)
+    elif x == home2 and y == home3 and z == home4:
+        pmoves1(win, player, positions, value, m1, 0, positions1, positions2, positions3)
+    elif w == home1 and x == home2:
+        if (y + value) == z:
+            pmoves1(win, player, positions, value, m4, 3, positions1, positions2, positions3)
+        elif (z + value) == y:
+            pmoves1(win, player, positions, value, m3, 2, positions1, positions2, positions3)
+        else:
+            pmoves2(win, player, positions, value, m3, m4, 2, 3, positions1, positions2, positions3)
+    elif w == home1 and y == home3:
+        if (x + value) == z:
+            pmoves1(win, player, positions, value, m4, 3, positions1, positions2, positions3)
+        elif (z + value) == x:
+            pmoves1(win, player, positions, value, m2, 1, positions1, positions2, positions3)
+        else:
+            pmoves2(win, player, positions, value, m2, m4, 1, 3, positions1, positions2, positions3)
+    elif w == home1 and z == home4:
+        if (x + value) == y:
+            pmoves1(win, player, positions, value, m3, 2, positions1, positions2, positions3)
+        elif (y + value) == x:
+            pmoves1(win, player, positions, value, m2, 1, positions1, positions2, positions3)
+        else:
+            pmoves2(win, player, positions, value, m2, m3, 1, 2, positions1, positions2, positions3)
+    elif x == home2 and y == home3:
+        if (w + value) == z:
+            pmoves1(win, player, positions, value, m4, 3, positions1, positions2, positions3)
+        elif (z + value) == w:
+            pmoves1(win, player, positions, value, m1, 0, positions1, positions2, positions3)
+        else:
+            pmoves2(win, player, positions, value, m1, m4, 0, 3, positions1, positions2, positions3)
+    elif x == home2 and z == home4:
+        if (w + value) == y:
+            pmoves1(win, player, positions, value, m3, 2, positions1, positions2, positions3)
+        elif (y + value) == w:
+            pmoves1(win, player, positions, value, m1, 0, positions1, positions2, positions3)
+        else:
+            pmoves2(win, player, positions, value, m1, m3, 0, 2, positions1, positions2, positions3)
+    elif y == home3 and z == home4:
+        if (w + value) == x:
+            pmoves1(win, player, positions, value, m2, 1, positions1, positions2, positions3)
+        elif (x + value) == w:
+            pmoves1(win, player, positions, value, m1, 0, positions1, positions2, positions3)
+        else:
+            pmoves2(win, player, positions, value, m1, m2, 0, 1, positions1, positions2, positions3)
+    elif w == home1:
+        if (x + value) == y or (x + value) == z:
+            if (y + value) == z:
+                pmoves1(win, player, positions, value, m4, 3, positions1, positions2, positions3)
+            elif (z + value) == y:
+                pmoves1(win, player, positions, value, m3, 2, positions1, positions2, positions3)
+            else:
+                pmoves2(win, player, positions, value, m3, m4, 2, 3, positions1, positions2, positions3)
+        elif (y + value) == x or (y + value) == z:
+            if (x + value) == z:
+                pmoves1(win, player, positions, value, m4, 3, positions1, positions2, positions3)
+            elif (z + value) == x:
+                pmoves1(win, player, positions, value, m2, 1, positions1, positions2, positions3)
+            else:
+                pmoves2(win, player, positions, value, m2, m4, 1, 3, positions1, positions2, positions3)
+        elif (z + value) == x or (z + value) == y:
+            if (x + value) == y:
+                pmoves1(win, player, positions, value, m3, 2, positions1, positions2, positions3)
+            elif (y + value) == x:
+                pmoves1(win, player, positions, value, m2, 1, positions1, positions2, positions3)
+            else:
+                pmoves2(win, player, positions, value, m2, m3, 1, 2, positions1, positions2, positions3)
+        else:
+            pmoves3(win, player, positions, value, m2, m3, m4, 1, 2, 3, positions1, positions2, positions3)
+    elif x == home2:
+        if (w + value) == y or (w + value) == z:
+            if (y + value) == z:
+                pmoves1(win, player, positions, value, m4, 3, positions1, positions2, positions3)
+            elif (z + value) == y:
+                pmoves1(win, player, positions, value, m3, 2, positions1, positions2, positions3)
+            else:
+                pmoves2(win, player, positions, value, m3, m4, 2, 3, positions1, positions2, positions3)
+        elif (y + value) == w or (y + value) == z:
+            if (w + value) == z:
+                pmoves1(win, player, positions, value, m4, 3, positions1, positions2, positions3)
+            elif (z + value) == w:
+                pmoves1(win, player, positions, value, m1, 0, positions1, positions2, positions3)
+            else:
+                pmoves2(win, player, positions, value, m1, m4, 0, 3, positions1, positions2, positions3)
+        elif (z + value) == w or (z + value) == y:
+            if (w + value) == y:
+                pmoves1(win, player, positions, value, m3, 2, positions1, positions2, positions3)
+            elif (y + value) == w:
+                pmoves1(win, player, positions, value, m1, 0, positions1, positions2, positions3)
+            else:
+                pmoves2(win, player, positions, value, m1, m3, 0, 2, positions1, positions2, positions3)
+        else:
+            pmoves3(win, player, positions, value, m1, m3, m4, 0, 2, 3, positions1, positions2, positions3)
+    elif y == home3:
+        if (w + value) == x or (w + value) == z:
+            if (x + value) == z:
+                pmoves1(win, player, positions, value, m4, 3, positions1, positions2, positions3)
+            elif (z + value) == x:
+                pmoves1(win, player, positions, value, m2, 1, positions1, positions2, positions3)
+            else:
+                pmoves2(win, player, positions, value, m2, m4, 1, 3, positions1, positions2, positions3)
+        elif (x + value) == w or (x + value) == z:
+            if (w + value) == z:
+                pmoves1(win, player, positions, value, m4, 3, positions1, positions2, positions3)
+            elif (z + value) == w:
+                pmoves1(win, player, positions, value, m1, 0, positions1, positions2, positions3)
+            else:
+                pmoves2(win, player, positions, value, m1, m4, 0, 3, positions1, positions2, positions3)
+        elif (z + value) == w or (z + value) == x:
+            if (w + value) == x:
+                pmoves1(win, player, positions, value, m2, 1, positions1, positions2, positions3)
+            elif (x + value) == w:
+                pmoves1(win, player, positions, value, m1, 0, positions1, positions2, positions3)
+            else:
+                pmoves2(win, player, positions, value, m1, m2, 0, 1, positions1, positions2, positions3)
+        else:
+            pmoves3(win, player, positions, value, m1, m2, m4, 0, 1, 3, positions1, positions2, positions3)
+    elif z == home4:
+        if (w + value) == x or (w + value) == y:
+            if (x + value) == y:
+                pmoves1(win, player, positions, value, m3, 2, positions1, positions2, positions3)
+            elif (y + value) == x:
+                pmoves1(win, player, positions, value, m2, 1, positions1, positions2, positions3)
+            else:
+                pmoves2(win, player, positions, value, m2, m3, 1, 2, positions1, positions2, positions3)
+        elif (x + value) == w or (x + value) == y:
+            if (w + value) == y:
+                pmoves1(win, player, positions, value, m3, 2, positions1, positions2, positions3)
+            elif (y + value) == w:
+                pmoves1(win, player, positions, value, m1, 0, positions1, positions2, positions3)
+            else:
+                pmoves2(win, player, positions, value, m1, m3, 0, 2, positions1, positions2, positions3)
+        elif (y + value) == w or (y + value) == x:
+            if (w + value) == x:
+                pmoves1(win, player, positions, value, m2, 1, positions1, positions2, positions3)
+            elif (x + value) == w:
+                pmoves1(win, player, positions, value, m1, 0, positions1, positions2, positions3)
+            else:
+                pmoves2(win, player, positions, value, m1, m2, 0, 1, positions1, positions2, positions3)
+        else:
+            pmoves3(win, player, positions, value, m1, m2, m3, 0, 1, 2, positions1, positions2, positions3)
+    else:
+        if (w + value) == x or (w + value) == y or (w + value) == z:
+            if (x + value) == y or (x + value) == z:
+                if (y + value) == z:
+                    pmoves1(win, player, positions, value, m4, 3, positions1, positions2, positions3)
+                elif (z + value) == y:
+                    pmoves1(win, player, positions, value, m3, 2, positions1, positions2, positions3)
+                else:
+                    pmoves2(win, player, positions, value, m3, m4, 2, 3, positions1, positions2, positions3)
+            elif (y + value) == x or (y + value) == z:
+                if (x + value) == z:
+                    pmoves1(win, player, positions, value, m4, 3, positions1, positions2, positions3)
+                elif (z + value) == x:
+                    pmoves1(win, player, positions, value, m2, 1, positions1, positions2, positions3)
+                else:
+                    pmoves2(win, player, positions, value, m2, m4, 1, 3, positions1, positions2, positions3)
+            elif (z + value) == x or (z + value) == y:
+                if (x + value) == y:
+                    pmoves1(win, player, positions, value, m3, 2, positions1, positions2, positions3)
+                elif (y + value) ==  x:
+                    pmoves1(win, player, positions, value, m2, 1, positions1, positions2, positions3)
+                else:
+                    pmoves2(win, player, positions, value, m2, m3, 1, 2, positions1, positions2, positions3)
+            else:
+                pmoves3(win, player, positions, value, m2, m3, m4, 1, 2, 3, positions1, positions2, positions3)
+        elif (x + value) == w or (x + value) == y or (x + value) == z:
+            if (w + value) == y or (w + value) == z:
+                if (y + value) == z:
+                    pmoves1(win, player, positions, value, m4, 3, positions1, positions2, positions3)
+                elif (z + value) == y:
+                    pmoves1(win, player, positions, value, m3, 2, positions1, positions2, positions3)
+                else:
+                    pmoves2(win, player, positions, value, m3, m4, 2, 3, positions1, positions2, positions3)
+            elif (y + value) == w or (y + value) == z:
+                if (w + value) == z:
+                    pmoves1(win, player, positions, value, m4, 3, positions1, positions2, positions3)
+                elif (z + value) == w:
+                    pmoves1(win, player, positions, value, m1, 0, positions1, positions2, positions3)
+                else:
+                    pmoves2(win, player, positions, value, m1, m4, 0, 3, positions1, positions2, positions3)
+            elif (z + value) == w or (z + value) == y:
+                if (w + value) == y:
+                    pmoves1(win, player, positions, value, m3, 2, positions1, positions2, positions3)
+                elif (y + value) == w:
+                    pmoves1(win, player, positions, value, m1, 0, positions1, positions2, positions3)
+                else:
+                    pmoves2(win, player, positions, value, m1, m3, 0, 2, positions1, positions2, positions3)
+            else:
+                pmoves3(win, player, positions, value, m1, m3, m4, 0, 2, 3, positions1, positions2, positions3)
+        elif (y + value) == w or (y + value) == x or (y + value) == z:
+            if (w + value) == x or (w + value) == z:
+                if (x + value) == z:
+                    pmoves1(win, player, positions, value, m4, 3, positions1, positions2, positions3)
+                elif (z + value) == x:
+                    pmoves1(win, player, positions, value, m2, 1, positions1, positions2, positions3)
+                else:
+                    pmoves2(win, player, positions, value, m2, m4, 1, 3, positions1, positions2, positions3)
+            elif (x + value) == w or (x + value) == z:
+                if (w + value) == z:
+                    pmoves1(win, player, positions, value, m4, 3, positions1, positions2, positions3)
+                elif (z + value) == w:
+                    pmoves1(win, player, positions, value, m1, 0, positions1, positions2, positions3)
+                else:
+                    pmoves2(win, player, positions, value, m1, m4, 0, 3, positions1, positions2, positions3)
+            elif (z + value) == w or (z + value) == x:
+                if (w + value) == x:
+                    pmoves1(win, player, positions, value, m2, 1, positions1, positions2, positions3)
+                elif (x + value) == w:
+                    pmoves1(win, player, positions, value, m1, 0, positions1, positions2, positions3)
+                else:
+                    pmoves2(win, player, positions, value, m1, m2, 0, 1, positions1, positions2, positions3)
+            else:
+                pmoves3(win, player, positions, value, m1, m2, m4, 0, 1, 3, positions1, positions2, positions3)
+        elif (z + value) == w or (z + value) == x or (z + value) == y:
+            if (w + value) == x or (w + value) == y:
+                if (x + value) == y:
+                    pmoves1(win, player, positions, value, m3, 2, positions1, positions2, positions3)
+                elif (y + value) == x:
+                    pmoves1(win, player, positions, value, m2, 1, positions1, positions2, positions3)
+                else:
+                    pmoves2(win, player, positions, value, m2, m3, 1, 2, positions1, positions2, positions3)
+            elif (x + value) == w or (x + value) == y:
+                if (w + value) == y:
+                    pmoves1(win, player, positions, value, m3, 2, positions1, positions2, positions3)
+                elif (y + value) == w:
+                    pmoves1(win, player, positions, value, m1, 0, positions1, positions2, positions3)
+                else:
+                    pmoves2(win, player, positions, value, m1, m3, 0, 2, positions1, positions2, positions3)
+            elif (y + value) == w or (y + value) == x:
+                if (w + value) == x:
+                    pmoves1(win, player, positions, value, m2, 1, positions1, positions2, positions3)
+                elif (x + value) == w:
+                    pmoves1(win, player, positions, value, m1, 0, positions1, positions2, positions3)
+                else:
+                    pmoves2(win, player, positions, value, m1, m2, 0, 1, positions1, positions2, positions3)
+            else:
+                pmoves3(win, player, positions, value, m1, m2, m3, 0, 1, 2, positions1, positions2, positions3)
+        else:
+            pmoves4(win, player, positions, value, m1, m2, m3, m4, positions1, positions2, positions3)
+
+
+def psmoves1_1(win, player, positions, value, mstart1, mplay1, component1, component2, positions1, positions2, positions3):
+    pt = win.getMouse()
+    while not (mstart1.clicked(pt) or mplay1.clicked(pt)):
+        pt = win.getMouse()
+    if player == "player1":
+        psmoves1_1helper(win, pt, player, positions, value, mstart1, mplay1,
+                         component1, component2, 73, 16, 68, positions1, positions2, positions3)
+    elif player == "player2":
+        psmoves1_1helper(win, pt, player, positions, value, mstart1, mplay1,
+                         component1, component2, 82, 29, 77, positions1, positions2, positions3)
+    elif player == "player3":
+        psmoves1_1helper(win, pt, player, positions, value, mstart1, mplay1,
+                         component1, component2, 91, 42, 86, positions1, positions2, positions3)
+    elif player == "player4":
+        psmoves1_1helper(win, pt, player, positions, value, mstart1, mplay1,
+                         component1, component2, 100, 55, 95, positions1, positions2, positions3)
+
+    return positions, positions1, positions2, positions3
+
+def psmoves1_1helper(win, pt, player, positions, value, mstart1, mplay1,
+                     component1, component2, homepos, startpos, arrowpos, positions1, positions2, positions3):
+    if player == "player1":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        else:
+            if (positions[component2] + value) <= (homepos - 1):
+                positions[component2] = positions[component2] + value
+            elif (positions[component2] + value) > (homepos - 1):
+                if component2 == 0:
+                    positions[component2] = homepos
+                elif component2 == 1:
+                    positions[component2] = homepos + 1
+                elif component2 == 2:
+                    positions[component2] = homepos + 2
+                elif component2 == 3:
+                    positions[component2] = homepos + 3
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mplay1)
+    else:
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        else:
+            if ((positions[component2] + value) > 67
+                and positions[component2] < 68):
+                dif = 67 - positions[component2]
+                positions[component2] = 15 + (value-dif)
+            elif (positions[component2] < startpos and
+                  (positions[component2] + value) > (startpos - 1)):
+                dif = startpos - positions[component2]
+                if value == 6:
+                    if dif == 1:
+                        if component2 == 0:
+                            positions[component2] = homepos
+                        elif component2 == 1:
+                            positions[component2] = homepos + 1
+                        elif component2 == 2:
+                            positions[component2] = homepos + 2
+                        elif component2 == 3:
+                            positions[component2] = homepos + 3
+                    else:
+                        positions[component2] = arrowpos + (value-dif)
+                else:
+                    positions[component2] = arrowpos + (value-dif)
+            elif (positions[component2] + value) > (homepos - 1):
+                if component2 == 0:
+                    positions[component2] = homepos
+                elif component2 == 1:
+                    positions[component2] = homepos + 1
+                elif component2 == 2:
+                    positions[component2] = homepos + 2
+                elif component2 == 3:
+                    positions[component2] = homepos + 3
+            else:
+                positions[component2] = positions[component2] + value
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mplay1)
+
+def psmoves1_2(win, player, positions, value, mstart1, mplay1, mplay2,
+               component1, component2, component3, positions1, positions2, positions3):
+    pt = win.getMouse()
+    while not (mstart1.clicked(pt) or mplay1.clicked(pt) or mplay2.clicked(pt)):
+        pt = win.getMouse()
+    if player == "player1":
+        psmoves1_2helper(win, pt, player, positions, value, mstart1, mplay1,
+                         mplay2, component1, component2, component3, 16, 68, 73, positions1, positions2, positions3)
+    elif player == "player2":
+        psmoves1_2helper(win, pt, player, positions, value, mstart1, mplay1,
+                         mplay2, component1, component2, component3, 29, 77, 82, positions1, positions2, positions3)
+    elif player == "player3":
+        psmoves1_2helper(win, pt, player, positions, value, mstart1, mplay1,
+                         mplay2, component1, component2, component3, 42, 86, 91, positions1, positions2, positions3)
+    elif player == "player4":
+        psmoves1_2helper(win, pt, player, positions, value, mstart1, mplay1,
+                         mplay2, component1, component2, component3, 55, 95, 100, positions1, positions2, positions3)
+
+    return positions, positions1, positions2, positions3
+
+def psmoves1_2helper(win, pt, player, positions, value, mstart1, mplay1,
+                     mplay2, component1, component2, component3, startpos,
+                     arrowpos, homepos, positions1, positions2, positions3):
+    if player == "player1":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        elif mplay1.clicked(pt):
+            if (positions[component2] + value) <= 72:
+                positions[component2] = positions[component2] + value
+            elif (positions[component2] + value) > 72:
+                if component2 == 0:
+                    positions[component2] = 73
+                elif component2 == 1:
+                    positions[component2] = 74
+                elif component2 == 2:
+                    positions[component2] = 75
+                elif component2 == 3:
+                    positions[component2] = 76
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mplay1)
+        else:
+            if (positions[component3] + value) <= 72:
+                positions[component3] = positions[component3] + value
+            elif (positions[component3] + value) > 72:
+                if component3 == 0:
+                    positions[component3] = 73
+                elif component3 == 1:
+                    positions[component3] = 74
+                elif component3 == 2:
+                    positions[component3] = 75
+                elif component3 == 3:
+                    positions[component3] = 76
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mplay2)
+    else:
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        elif mplay1.clicked(pt):
+            if (positions[component2] + value) > 67 and positions[component2] < 68:
+                dif = 67 - positions[component2]
+                positions[component2] = 15 + (value-dif)
+            elif positions[component2] < startpos and (positions[component2] + value) > (startpos - 1):
+                dif = startpos - positions[component2]
+                if value == 6:
+                    if dif == 1:
+                        if component2 == 0:
+                            positions[component2] = homepos
+                        elif component2 == 1:
+                            positions[component2] = homepos + 1
+                        elif component2 == 2:
+                            positions[component2] = homepos + 2
+                        elif component2 == 3:
+                            positions[component2] = homepos + 3
+                    else:
+                        positions[component2] = arrowpos + (value-dif)
+                else:
+                    positions[component2] = arrowpos + (value-dif)
+            elif (positions[component2] + value) > (homepos - 1):
+                if component2 == 0:
+                    positions[component2] = homepos
+                elif component2 == 1:
+                    positions[component2] = homepos + 1
+                elif component2 == 2:
+                    positions[component2] = homepos + 2
+                elif component2 == 3:
+                    positions[component2] = homepos + 3
+            else:
+                positions[component2] = positions[component2] + value
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mplay1)
+        else:
+            if (positions[component3] + value) > 67 and positions[component3] < 68:
+                dif = 67 - positions[component3]
+                positions[component3] = 15 + (value-dif)
+            elif positions[component3] < startpos and (positions[component3] + value) > (startpos - 1):
+                dif = startpos - positions[component3]
+                if value == 6:
+                    if dif == 1:
+                        if component3 == 0:
+                            positions[component3] = homepos
+                        elif component3 == 1:
+                            positions[component3] = homepos + 1
+                        elif component3 == 2:
+                            positions[component3] = homepos + 2
+                        elif component3 == 3:
+                            positions[component3] = homepos + 3
+                    else:
+                        positions[component3] = arrowpos + (value-dif)
+                else:
+                    positions[component3] = arrowpos + (value-dif)
+            elif (positions[component3] + value) > (homepos - 1):
+                if component3 == 0:
+                    positions[component3] = homepos
+                elif component3 == 1:
+                    positions[component3] = homepos + 1
+                elif component3 == 2:
+                    positions[component3] = homepos + 2
+                elif component3 == 3:
+                    positions[component3] = homepos + 3
+            else:
+                positions[component3] = positions[component3] + value
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mplay2)
+
+def psmoves1_3(win, player, positions, value, mstart1, mplay1, mplay2, mplay3,
+               component1, component2, component3, component4, positions1, positions2, positions3):
+    pt = win.getMouse()
+    while not (mstart1.clicked(pt) or mplay1.clicked(pt) or mplay2.clicked(pt)
+               or mplay3.clicked(pt)):
+        pt = win.getMouse()
+    if player == "player1":
+        psmoves1_3helper(win, pt, player, positions, value, mstart1, mplay1,
+                         mplay2, mplay3, component1, component2, component3,
+                         component4, 16, 68, 73, positions1, positions2, positions3)
+    elif player == "player2":
+        psmoves1_3helper(win, pt, player, positions, value, mstart1, mplay1,
+                         mplay2, mplay3, component1, component2, component3,
+                         component4, 29, 77, 82, positions1, positions2, positions3)
+    elif player == "player3":
+        psmoves1_3helper(win, pt, player, positions, value, mstart1, mplay1,
+                         mplay2, mplay3, component1, component2, component3,
+                         component4, 42, 86, 91, positions1, positions2, positions3)
+    elif player == "player4":
+        psmoves1_3helper(win, pt, player, positions, value, mstart1, mplay1,
+                         mplay2, mplay3, component1, component2, component3,
+                         component4, 55, 95, 100, positions1, positions2, positions3)
+
+    return positions, positions1, positions2, positions3
+
+def psmoves1_3helper(win, pt, player, positions, value, mstart1, mplay1, mplay2,
+                     mplay3, component1, component2, component3, component4,
+                     startpos, arrowpos, homepos, positions1, positions2, positions3):
+    if player == "player1":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        elif mplay1.clicked(pt):
+            if (positions[component2] + value) <= 72:
+                positions[component2] = positions[component2] + value
+            elif (positions[component2] + value) > 72:
+                if component2 == 0:
+                    positions[component2] = 73
+                elif component2 == 1:
+                    positions[component2] = 74
+                elif component2 == 2:
+                    positions[component2] = 75
+                elif component2 == 3:
+                    positions[component2] = 76
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mplay1)
+        elif mplay2.clicked(pt):
+            if (positions[component3] + value) <= 72:
+                positions[component3] = positions[component3] + value
+            elif (positions[component3] + value) > 72:
+                if component3 == 0:
+                    positions[component3] = 73
+                elif component3 == 1:
+                    positions[component3] = 74
+                elif component3 == 2:
+                    positions[component3] = 75
+                elif component3 == 3:
+                    positions[component3] = 76
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mplay2)
+        else:
+            if (positions[component4] + value) <= 72:
+                positions[component4] = positions[component4] + value
+            elif (positions[component4] + value) > 72:
+                if component4 == 0:
+                    positions[component4] = 73
+                elif component4 == 1:
+                    positions[component4] = 74
+                elif component4 == 2:
+                    positions[component4] = 75
+                elif component4 == 3:
+                    positions[component4] = 76
+            positions1, positions2, positions3 = clipped(win, positions[component4], player, positions1, positions2, positions3)
+            marker_move(win, positions[component4], mplay3)
+    else:
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        elif mplay1.clicked(pt):
+            if (positions[component2] + value) > 67 and positions[component2] < 68:
+                dif = 67 - positions[component2]
+                positions[component2] = 15 + (value-dif)
+            elif positions[component2] < startpos and (positions[component2] + value) > (startpos - 1):
+                dif = startpos - positions[component2]
+                if value == 6:
+                    if dif == 1:
+                        if component2 == 0:
+                            positions[component2] = homepos
+                        elif component2 == 1:
+                            positions[component2] = homepos + 1
+                        elif component2 == 2:
+                            positions[component2] = homepos + 2
+                        elif component2 == 3:
+                            positions[component2] = homepos + 3
+                    else:
+                        positions[component2] = arrowpos + (value-dif)
+                else:
+                    positions[component2] = arrowpos + (value-dif)
+            elif (positions[component2] + value) > (homepos - 1):
+                if component2 == 0:
+                    positions[component2] = homepos
+                elif component2 == 1:
+                    positions[component2] = homepos + 1
+                elif component2 == 2:
+                    positions[component2] = homepos + 2
+                elif component2 == 3:
+                    positions[component2] = homepos + 3
+            else:
+                positions[component2] = positions[component2] + value
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mplay1)
+        elif mplay2.clicked(pt):
+            if (positions[component3] + value) > 67 and positions[component3] < 68:
+                dif = 67 - positions[component3]
+                positions[component3] = 15 + (value-dif)
+            elif positions[component3] < startpos and (positions[component3] + value) > (startpos - 1):
+                dif = startpos - positions[component3]
+                if value == 6:
+                    if dif == 1:
+                        if component3 == 0:
+                            positions[component3] = homepos
+                        elif component3 == 1:
+                            positions[component3] = homepos + 1
+                        elif component3 == 2:
+                            positions[component3] = homepos + 2
+                        elif component3 == 3:
+                            positions[component3] = homepos + 3
+                    else:
+                        positions[component3] = arrowpos + (value-dif)
+                else:
+                    positions[component3] = arrowpos + (value-dif)
+            elif (positions[component3] + value) > (homepos - 1):
+                if component3 == 0:
+                    positions[component3] = homepos
+                elif component3 == 1:
+                    positions[component3] = homepos + 1
+                elif component3 == 2:
+                    positions[component3] = homepos + 2
+                elif component3 == 3:
+                    positions[component3] = homepos + 3
+            else:
+                positions[component3] = positions[component3] + value
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mplay2)
+        else:
+            if (positions[component4] + value) > 67 and positions[component4] < 68:
+                dif = 67 - positions[component4]
+                positions[component4] = 15 + (value-dif)
+            elif positions[component4] < startpos and (positions[component4] + value) > (startpos - 1):
+                dif = startpos - positions[component4]
+                if value == 6:
+                    if dif == 1:
+                        if component4 == 0:
+                            positions[component4] = homepos
+                        elif component4 == 1:
+                            positions[component4] = homepos + 1
+                        elif component4 == 2:
+                            positions[component4] = homepos + 2
+                        elif component4 == 3:
+                            positions[component4] = homepos + 3
+                    else:
+                        positions[component4] = arrowpos + (value-dif)
+                else:
+                    positions[component4] = arrowpos + (value-dif)
+            elif (positions[component4] + value) > (homepos - 1):
+                if component4 == 0:
+                    positions[component4] = homepos
+                elif component4 == 1:
+                    positions[component4] = homepos + 1
+                elif component4 == 2:
+                    positions[component4] = homepos + 2
+                elif component4 == 3:
+                    positions[component4] = homepos + 3
+            else:
+                positions[component4] = positions[component4] + value
+            positions1, positions2, positions3 = clipped(win, positions[component4], player, positions1, positions2, positions3)
+            marker_move(win, positions[component4], mplay3)
+
+def psmoves2_1(win, player, positions, value, mstart1, mstart2, mplay1, component1, component2, component3, positions1, positions2, positions3):
+    pt = win.getMouse()
+    while not (mstart1.clicked(pt) or mstart2.clicked(pt) or mplay1.clicked(pt)):
+        pt = win.getMouse()
+    if player == "player1":
+        psmoves2_1helper(win, pt, player, positions, value, mstart1, mstart2, mplay1,
+                         component1, component2, component3, 16, 68, 73, positions1, positions2, positions3)
+    elif player == "player2":
+        psmoves2_1helper(win, pt, player, positions, value, mstart1, mstart2, mplay1,
+                         component1, component2, component3, 29, 77, 82, positions1, positions2, positions3)
+    elif player == "player3":
+        psmoves2_1helper(win, pt, player, positions, value, mstart1, mstart2, mplay1,
+                         component1, component2, component3, 42, 86, 91, positions1, positions2, positions3)
+    elif player == "player4":
+        psmoves2_1helper(win, pt, player, positions, value, mstart1, mstart2, mplay1,
+                         component1, component2, component3, 55, 95, 100, positions1, positions2, positions3)
+
+    return positions, positions1, positions2, positions3
+            
+
+def psmoves2_1helper(win, pt, player, positions, value, mstart1, mstart2, mplay1,
+                     component1, component2, component3, startpos, arrowpos,
+                     homepos, positions1, positions2, positions3):
+    if player == "player1":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        if mstart2.clicked(pt):
+            positions[component2] = positions[component2] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mstart2)
+        if mplay1.clicked(pt):
+            if (positions[component3] + value) <= (homepos - 1):
+                positions[component3] = positions[component3] + value
+            elif (positions[component3] + value) > (homepos - 1):
+                if component3 == 0:
+                    positions[component3] = (homepos)
+                elif component3 == 1:
+                    positions[component3] = (homepos + 1)
+                elif component3 == 2:
+                    positions[component3] = (homepos + 2)
+                elif component3 == 3:
+                    positions[component3] = (homepos + 3)
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mplay1)
+    else:
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        elif mstart2.clicked(pt):
+            positions[component2] = positions[component2] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mstart2)
+        else:
+            if (positions[component3] + value) > 67 and positions[component3] < 68:
+                dif = 67 - positions[component3]
+                positions[component3] = 15 + (value-dif)
+            elif positions[component3] < (startpos) and (positions[component3] + value) > (startpos - 1):
+                dif = (startpos) - positions[component3]
+                if value == 6:
+                    if dif == 1:
+                        if component3 == 0:
+                            positions[component3] = (homepos)
+                        elif component3 == 1:
+                            positions[component3] = (homepos + 1)
+                        elif component3 == 2:
+                            positions[component3] = (homepos + 2)
+                        elif component3 == 3:
+                            positions[component3] = (homepos + 3)
+                    else:
+                        positions[component3] = arrowpos + (value-dif)
+                else:
+                    positions[component3] = arrowpos + (value-dif)
+            elif (positions[component3] + value) > (homepos - 1):
+                if component3 == 0:
+                    positions[component3] = homepos
+                elif component3 == 1:
+                    positions[component3] = homepos + 1
+                elif component3 == 2:
+                    positions[component3] = homepos + 2
+                elif component3 == 3:
+                    positions[component3] = homepos + 3
+            else:
+                positions[component3] = positions[component3] + value
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mplay1)
+
+def psmoves2_2(win, player, positions, value, mstart1, mstart2, mplay1, mplay2, component1, component2,
+               component3, component4, positions1, positions2, positions3):
+    pt = win.getMouse()
+    while not (mstart1.clicked(pt) or mstart2.clicked(pt) or mplay1.clicked(pt) or mplay2.clicked(pt)):
+        pt = win.getMouse()
+    if player == "player1":
+        psmoves2_2helper(win, pt, player, positions, value, mstart1, mstart2, mplay1,
+                     mplay2, component1, component2, component3, component4, 16, 68, 73, positions1, positions2, positions3)
+    elif player == "player2":
+        psmoves2_2helper(win, pt, player, positions, value, mstart1, mstart2, mplay1,
+                     mplay2, component1, component2, component3, component4, 29, 77, 82, positions1, positions2, positions3)
+    elif player == "player3":
+        psmoves2_2helper(win, pt, player, positions, value, mstart1, mstart2, mplay1,
+                     mplay2, component1, component2, component3, component4, 42, 86, 91, positions1, positions2, positions3)
+    elif player == "player4":
+        psmoves2_2helper(win, pt, player, positions, value, mstart1, mstart2, mplay1,
+                     mplay2, component1, component2, component3, component4, 55, 95, 100, positions1, positions2, positions3)
+
+    return positions, positions1, positions2, positions3
+
+def psmoves2_2helper(win, pt, player, positions, value, mstart1, mstart2, mplay1,
+                     mplay2, component1, component2, component3, component4, startpos, arrowpos,
+                     homepos, positions1, positions2, positions3):
+    if player == "player1":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        elif mstart2.clicked(pt):
+            positions[component2] = positions[component2] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mstart2)
+        elif mplay1.clicked(pt):
+            if (positions[component3] + value) <= (homepos - 1):
+                positions[component3] = positions[component3] + value
+            elif (positions[component3] + value) > (homepos - 1):
+                if component3 == 0:
+                    positions[component3] = (homepos)
+                elif component3 == 1:
+                    positions[component3] = (homepos + 1)
+                elif component3 == 2:
+                    positions[component3] = (homepos + 2)
+                elif component3 == 3:
+                    positions[component3] = (homepos + 3)
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mplay1)
+        else:
+            if (positions[component4] + value) <= (homepos - 1):
+                positions[component4] = positions[component4] + value
+            elif (positions[component4] + value) > (homepos - 1):
+                if component4 == 0:
+                    positions[component4] = (homepos)
+                elif component4 == 1:
+                    positions[component4] = (homepos + 1)
+                elif component4 == 2:
+                    positions[component4] = (homepos + 2)
+                elif component4 == 3:
+                    positions[component4] = (homepos + 3)
+            positions1, positions2, positions3 = clipped(win, positions[component4], player, positions1, positions2, positions3)
+            marker_move(win, positions[component4], mplay2)
+    else:
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        elif mstart2.clicked(pt):
+            positions[component2] = positions[component2] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mstart2)
+        elif mplay1.clicked(pt):
+            if (positions[component3] + value) > 67 and positions[component3] < 68:
+                dif = 67 - positions[component3]
+                positions[component3] = 15 + (value-dif)
+            elif positions[component3] < (startpos) and (positions[component3] + value) > (startpos - 1):
+                dif = (startpos) - positions[component3]
+                if value == 6:
+                    if dif == 1:
+                        if component3 == 0:
+                            positions[component3] = (homepos)
+                        elif component3 == 1:
+                            positions[component3] = (homepos + 1)
+                        elif component3 == 2:
+                            positions[component3] = (homepos + 2)
+                        elif component3 == 3:
+                            positions[component3] = (homepos + 3)
+                    else:
+                        positions[component3] = arrowpos + (value-dif)
+                else:
+                    positions[component3] = arrowpos + (value-dif)
+            elif (positions[component3] + value) > (homepos - 1):
+                if component3 == 0:
+                    positions[component3] = homepos
+                elif component3 == 1:
+                    positions[component3] = homepos + 1
+                elif component3 == 2:
+                    positions[component3] = homepos + 2
+                elif component3 == 3:
+                    positions[component3] = homepos + 3
+            else:
+                positions[component3] = positions[component3] + value
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mplay1)
+        elif mplay2.clicked(pt):
+            if (positions[component4] + value) > 67 and positions[component4] < 68:
+                dif = 67 - positions[component4]
+                positions[component4] = 15 + (value-dif)
+            elif positions[component4] < (startpos) and (positions[component4] + value) > (startpos - 1):
+                dif = (startpos) - positions[component4]
+                if value == 6:
+                    if dif == 1:
+                        if component4 == 0:
+                            positions[component4] = (homepos)
+                        elif component4 == 1:
+                            positions[component4] = (homepos + 1)
+                        elif component4 == 2:
+                            positions[component4] = (homepos + 2)
+                        elif component4 == 3:
+                            positions[component4] = (homepos + 3)
+                    else:
+                        positions[component4] = arrowpos + (value-dif)
+                else:
+                    positions[component4] = arrowpos + (value-dif)
+            elif (positions[component4] + value) > (homepos - 1):
+                if component4 == 0:
+                    positions[component4] = homepos
+                elif component4 == 1:
+                    positions[component4] = homepos + 1
+                elif component4 == 2:
+                    positions[component4] = homepos + 2
+                elif component4 == 3:
+                    positions[component4] = homepos + 3
+            else:
+                positions[component4] = positions[component4] + value
+            positions1, positions2, positions3 = clipped(win, positions[component4], player, positions1, positions2, positions3)
+            marker_move(win, positions[component4], mplay2)
+    
+                
+def psmoves3(win, player, positions, mstart1, mstart2, mstart3, component1, component2, component3, positions1, positions2, positions3):
+    pt = win.getMouse()
+    while not (mstart1.clicked(pt) or mstart2.clicked(pt) or mstart3.clicked(pt)):
+        pt = win.getMouse()
+    if player == "player1":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + 16
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        if mstart2.clicked(pt):
+            positions[component2] = positions[component2] + 16
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mstart2)
+        if mstart3.clicked(pt):
+            positions[component3] = positions[component3] + 16
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mstart3)
+    elif player == "player2":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + 29
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        if mstart2.clicked(pt):
+            positions[component2] = positions[component2] + 29
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mstart2)
+        if mstart3.clicked(pt):
+            positions[component3] = positions[component3] + 29
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mstart3)
+    elif player == "player3":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + 42
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        if mstart2.clicked(pt):
+            positions[component2] = positions[component2] + 42
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mstart2)
+        if mstart3.clicked(pt):
+            positions[component3] = positions[component3] + 42
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mstart3)
+    elif player == "player4":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + 55
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        if mstart2.clicked(pt):
+            positions[component2] = positions[component2] + 55
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mstart2)
+        if mstart3.clicked(pt):
+            positions[component3] = positions[component3] + 55
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mstart3)
+
+    return positions, positions1, positions2, positions3
+
+def psmoves2(win, player, positions, mstart1, mstart2, component1, component2, positions1, positions2, positions3):
+    pt = win.getMouse()
+    while not (mstart1.clicked(pt) or mstart2.clicked(pt)):
+        pt = win.getMouse()
+    if player == "player1":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + 16
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        if mstart2.clicked(pt):
+            positions[component2] = positions[component2] + 16
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mstart2)
+    elif player == "player2":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + 29
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        if mstart2.clicked(pt):
+            positions[component2] = positions[component2] + 29
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mstart2)
+    elif player == "player3":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + 42
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        if mstart2.clicked(pt):
+            positions[component2] = positions[component2] + 42
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mstart2)
+    elif player == "player4":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + 55
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        if mstart2.clicked(pt):
+            positions[component2] = positions[component2] + 55
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mstart2)
+
+    return positions, positions1, positions2, positions3
+
+def psmoves1(win, player, positions, mstart1, component1, positions1, positions2, positions3):
+    pt = win.getMouse()
+    while not mstart1.clicked(pt):
+        pt = win.getMouse()
+    if player == "player1":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + 16
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+    elif player == "player2":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + 29
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+    elif player == "player3":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + 42
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+    elif player == "player4":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + 55
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+
+    return positions, positions1, positions2, positions3
+
+def pmoves6_0(win, player, positions, m1, m2, m3, m4, positions1, positions2, positions3):
+    pt = win.getMouse()
+    while not (m1.clicked(pt) or m2.clicked(pt) or m3.clicked(pt) or m4.clicked(pt)):
+        pt = win.getMouse()
+    if player == "player1":
+        pmoves6_0helper(win, pt, player, positions, m1, m2, m3, m4, 16, positions1, positions2, positions3)
+    elif player == "player2":
+        pmoves6_0helper(win, pt, player, positions, m1, m2, m3, m4, 29, positions1, positions2, positions3)
+    elif player == "player3":
+        pmoves6_0helper(win, pt, player, positions, m1, m2, m3, m4, 42, positions1, positions2, positions3)
+    elif player == "player4":
+        pmoves6_0helper(win, pt, player, positions, m1, m2, m3, m4, 55, positions1, positions2, positions3)
+
+    return positions, positions1, positions2, positions3
+
+def pmoves6_0helper(win, pt, player, positions, m1, m2, m3, m4, n, positions1, positions2, positions3):
+    if m1.clicked(pt):
+        positions[0] = positions[0] + n
+        positions1, positions2, positions3 = clipped(win, positions[0], player, positions1, positions2, positions3)
+        marker_move(win, positions[0], m1)
+    if m2.clicked(pt):
+        positions[1] = positions[1] + n
+        positions1, positions2, positions3 = clipped(win, positions[1], player, positions1, positions2, positions3)
+        marker_move(win, positions[1], m2)
+    if m3.clicked(pt):
+        positions[2] = positions[2] + n
+        positions1, positions2, positions3 = clipped(win, positions[2], player, positions1, positions2, positions3)
+        marker_move(win, positions[2], m3)
+    if m4.clicked(pt):
+        positions[3] = positions[3] + n
+        positions1, positions2, positions3 = clipped(win, positions[3], player, positions1, positions2, positions3)
+        marker_move(win, positions[3], m4)
+
+def pmoves6_1(win, player, positions, mstart1, mstart2, mstart3,
+              mplay1, component1, component2, component3, component4, positions1, positions2, positions3):
+    pt = win.getMouse()
+    while not (mstart1.clicked(pt) or mstart2.clicked(pt) or mstart3.clicked(pt) or mplay1.clicked(pt)):
+        pt = win.getMouse()
+    if player == "player1":
+        pmoves6_1helper(win, pt, player, positions, mstart1, mstart2, mstart3,
+                        mplay1, component1, component2, component3, component4,
+                        16, 68, 73, positions1, positions2, positions3)
+    elif player == "player2":
+        pmoves6_1helper(win, pt, player, positions, mstart1, mstart2, mstart3,
+                        mplay1, component1, component2, component3, component4,
+                        29, 77, 82, positions1, positions2, positions3)
+    elif player == "player3":
+        pmoves6_1helper(win, pt, player, positions, mstart1, mstart2, mstart3,
+                        mplay1, component1, component2, component3, component4,
+                        42, 86, 91, positions1, positions2, positions3)
+    elif player == "player4":
+        pmoves6_1helper(win, pt, player, positions, mstart1, mstart2, mstart3,
+                        mplay1, component1, component2, component3, component4,
+                        55, 95, 100, positions1, positions2, positions3)
+
+    return positions, positions1, positions2, positions3
+
+def pmoves6_1helper(win, pt, player, positions, mstart1, mstart2, mstart3,
+                    mplay1, component1, component2, component3, component4,
+                    startpos, arrowpos, homepos, positions1, positions2, positions3):
+    if player == "player1":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + 16
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        elif mstart2.clicked(pt):
+            positions[component2] = positions[component2] + 16
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mstart2)
+        elif mstart3.clicked(pt):
+            positions[component3] = positions[component3] + 16
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mstart3)
+        else:
+            if (positions[component4] + 6) <= 72:
+                positions[component4] = positions[component4] + 6
+            elif (positions[component4] + 6) > 72:
+                if component4 == 0:
+                    positions[component4] = 73
+                elif component4 == 1:
+                    positions[component4] = 74
+                elif component4 == 2:
+                    positions[component4] = 75
+                elif component4 == 3:
+                    positions[component4] = 76
+            positions1, positions2, positions3 = clipped(win, positions[component4], player, positions1, positions2, positions3)
+            marker_move(win, positions[component4], mplay1)
+    else:
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        elif mstart2.clicked(pt):
+            positions[component2] = positions[component2] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mstart2)
+        elif mstart3.clicked(pt):
+            positions[component3] = positions[component3] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mstart3)
+        else:
+            if (positions[component4] + 6) > 67 and positions[component4] < 68:
+                dif = 67 - positions[component4]
+                positions[component4] = 15 + (6-dif)
+            elif positions[component4] < startpos and (positions[component4] + 6) > (startpos - 1):
+                dif = startpos - positions[component4]
+                if dif == 1:
+                    if component4 == 0:
+                        positions[component4] = homepos
+                    elif component4 == 1:
+                        positions[component4] = homepos + 1
+                    elif component4 == 2:
+                        positions[component4] = homepos + 2
+                    elif component4 == 3:
+                        positions[component4] = homepos + 3
+                else:
+                    positions[component4] = arrowpos + (6-dif)
+            elif (positions[component4] + 6) > (homepos - 1):
+                if component4 == 0:
+                    positions[component4] = homepos
+                elif component4 == 1:
+                    positions[component4] = homepos + 1
+                elif component4 == 2:
+                    positions[component4] = homepos + 2
+                elif component4 == 3:
+                    positions[component4] = homepos + 3
+            else:
+                positions[component4] = positions[component4] + 6
+            positions1, positions2, positions3 = clipped(win, positions[component4], player, positions1, positions2, positions3)
+            marker_move(win, positions[component4], mplay1)
+
+def pmoves6_2(win, player, positions, mstart1, mstart2, mplay1, mplay2, component1, component2, component3, component4, positions1, positions2, positions3):
+    pt = win.getMouse()
+    while not (mstart1.clicked(pt) or mstart2.clicked(pt) or mplay1.clicked(pt) or mplay2.clicked(pt)):
+        pt = win.getMouse()
+    if player == "player1":
+        pmoves6_2helper(win, pt, player, positions, mstart1, mstart2, mplay1,
+                        mplay2, component1, component2, component3, component4,
+                        16, 68, 73, positions1, positions2, positions3)
+    elif player == "player2":
+        pmoves6_2helper(win, pt, player, positions, mstart1, mstart2, mplay1,
+                        mplay2, component1, component2, component3, component4,
+                        29, 77, 82, positions1, positions2, positions3)
+    elif player == "player3":
+        pmoves6_2helper(win, pt, player, positions, mstart1, mstart2, mplay1,
+                        mplay2, component1, component2, component3, component4,
+                        42, 86, 91, positions1, positions2, positions3)
+    elif player == "player4":
+        pmoves6_2helper(win, pt, player, positions, mstart1, mstart2, mplay1,
+                        mplay2, component1, component2, component3, component4,
+                        55, 95, 100, positions1, positions2, positions3)
+
+    return positions, positions1, positions2, positions3
+
+def pmoves6_2helper(win, pt, player, positions, mstart1, mstart2, mplay1,
+                    mplay2, component1, component2, component3, component4,
+                    startpos, arrowpos, homepos, positions1, positions2, positions3):
+    if player == "player1":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + 16
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        elif mstart2.clicked(pt):
+            positions[component2] = positions[component2] + 16
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mstart2)
+        elif mplay1.clicked(pt):
+            if (positions[component3] + 6) <= 72:
+                positions[component3] = positions[component3] + 6
+            elif (positions[component3] + 6) > 72:
+                if component3 == 0:
+                    positions[component3] = 73
+                elif component3 == 1:
+                    positions[component3] = 74
+                elif component3 == 2:
+                    positions[component3] = 75
+                elif component3 == 3:
+                    positions[component3] = 76
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mplay1)
+        else:
+            if (positions[component4] + 6) <= 72:
+                positions[component4] = positions[component4] + 6
+            elif (positions[component4] + 6) > 72:
+                if component4 == 0:
+                    positions[component4] = 73
+                elif component4 == 1:
+                    positions[component4] = 74
+                elif component4 == 2:
+                    positions[component4] = 75
+                elif component4 == 3:
+                    positions[component4] = 76
+            positions1, positions2, positions3 = clipped(win, positions[component4], player, positions1, positions2, positions3)
+            marker_move(win, positions[component4], mplay2)
+    else:
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        elif mstart2.clicked(pt):
+            positions[component2] = positions[component2] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mstart2)
+        elif mplay1.clicked(pt):
+            if (positions[component3] + 6) > 67 and positions[component3] < 68:
+                dif = 67 - positions[component3]
+                positions[component3] = 15 + (6-dif)
+            elif positions[component3] < startpos and (positions[component3] + 6) > (startpos - 1):
+                dif = startpos - positions[component3]
+                if dif == 1:
+                    if component3 == 0:
+                        positions[component3] = homepos
+                    elif component3 == 1:
+                        positions[component3] = homepos + 1
+                    elif component3 == 2:
+                        positions[component3] = homepos + 2
+                    elif component3 == 3:
+                        positions[component3] = homepos + 3
+                else:
+                    positions[component3] = arrowpos + (6-dif)
+            elif (positions[component3] + 6) > (homepos - 1):
+                if component3 == 0:
+                    positions[component3] = homepos
+                elif component3 == 1:
+                    positions[component3] = homepos + 1
+                elif component3 == 2:
+                    positions[component3] = homepos + 2
+                elif component3 == 3:
+                    positions[component3] = homepos + 3
+            else:
+                positions[component3] = positions[component3] + 6
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mplay1)
+        else:
+            if (positions[component4] + 6) > 67 and positions[component4] < 68:
+                dif = 67 - positions[component4]
+                positions[component4] = 15 + (6-dif)
+            elif positions[component4] < startpos and (positions[component4] + 6) > (startpos - 1):
+                dif = startpos - positions[component4]
+                if dif == 1:
+                    if component4 == 0:
+                        positions[component4] = homepos
+                    elif component4 == 1:
+                        positions[component4] = homepos + 1
+                    elif component4 == 2:
+                        positions[component4] = homepos + 2
+                    elif component4 == 3:
+                        positions[component4] = homepos + 3
+                else:
+                    positions[component4] = arrowpos + (6-dif)
+            elif (positions[component4] + 6) > (homepos - 1):
+                if component4 == 0:
+                    positions[component4] = homepos
+                elif component4 == 1:
+                    positions[component4] = homepos + 1
+                elif component4 == 2:
+                    positions[component4] = homepos + 2
+                elif component4 == 3:
+                    positions[component4] = homepos + 3
+            else:
+                positions[component4] = positions[component4] + 6
+            positions1, positions2, positions3 = clipped(win, positions[component4], player, positions1, positions2, positions3)
+            marker_move(win, positions[component4], mplay2)
+
+def pmoves6_3(win, player, positions, mstart1, mplay1, mplay2, mplay3, component1, component2, component3, component4, positions1, positions2, positions3):
+    pt = win.getMouse()
+    while not (mstart1.clicked(pt) or mplay1.clicked(pt) or mplay2.clicked(pt) or mplay3.clicked(pt)):
+        pt = win.getMouse()
+    if player == "player1":
+        pmoves6_3helper(win, pt, player, positions, mstart1, mplay1, mplay2,
+                        mplay3, component1, component2, component3, component4,
+                        16, 68, 73, positions1, positions2, positions3)
+    elif player == "player2":
+        pmoves6_3helper(win, pt, player, positions, mstart1, mplay1, mplay2,
+                        mplay3, component1, component2, component3, component4,
+                        29, 77, 82, positions1, positions2, positions3)
+    elif player == "player3":
+        pmoves6_3helper(win, pt, player, positions, mstart1, mplay1, mplay2,
+                        mplay3, component1, component2, component3, component4,
+                        42, 86, 91, positions1, positions2, positions3)
+    elif player == "player4":
+        pmoves6_3helper(win, pt, player, positions, mstart1, mplay1, mplay2,
+                        mplay3, component1, component2, component3, component4,
+                        55, 95, 100, positions1, positions2, positions3)
+
+    return positions, positions1, positions2, positions3
+
+def pmoves6_3helper(win, pt, player, positions, mstart1, mplay1, mplay2,
+                    mplay3, component1, component2, component3, component4,
+                    startpos, arrowpos, homepos, positions1, positions2, positions3):
+    if player == "player1":
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + 16
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        elif mplay1.clicked(pt):
+            if (positions[component2] + 6) <= 72:
+                positions[component2] = positions[component2] + 6
+            elif (positions[component2] + 6) > 72:
+                if component2 == 0:
+                    positions[component2] = 73
+                elif component2 == 1:
+                    positions[component2] = 74
+                elif component2 == 2:
+                    positions[component2] = 75
+                elif component2 == 3:
+                    positions[component2] = 76
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mplay1)
+        elif mplay2.clicked(pt):
+            if (positions[component3] + 6) <= 72:
+                positions[component3] = positions[component3] + 6
+            elif (positions[component3] + 6) > 72:
+                if component3 == 0:
+                    positions[component3] = 73
+                elif component3 == 1:
+                    positions[component3] = 74
+                elif component3 == 2:
+                    positions[component3] = 75
+                elif component3 == 3:
+                    positions[component3] = 76
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mplay2)
+        else:
+            if (positions[component4] + 6) <= 72:
+                positions[component4] = positions[component4] + 6
+            elif (positions[component4] + 6) > 72:
+                if component4 == 0:
+                    positions[component4] = 73
+                elif component4 == 1:
+                    positions[component4] = 74
+                elif component4 == 2:
+                    positions[component4] = 75
+                elif component4 == 3:
+                    positions[component4] = 76
+            positions1, positions2, positions3 = clipped(win, positions[component4], player, positions1, positions2, positions3)
+            marker_move(win, positions[component4], mplay3)
+    else:
+        if mstart1.clicked(pt):
+            positions[component1] = positions[component1] + startpos
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], mstart1)
+        elif mplay1.clicked(pt):
+            if (positions[component2] + 6) > 67 and positions[component2] < 68:
+                dif = 67 - positions[component2]
+                positions[component2] = 15 + (6-dif)
+            elif positions[component2] < startpos and (positions[component2] + 6) > (startpos - 1):
+                dif = startpos - positions[component2]
+                if dif == 1:
+                    if component2 == 0:
+                        positions[component2] = homepos
+                    elif component2 == 1:
+                        positions[component2] = homepos + 1
+                    elif component2 == 2:
+                        positions[component2] = homepos + 2
+                    elif component2 == 3:
+                        positions[component2] = homepos + 3
+                else:
+                    positions[component2] = arrowpos + (6-dif)
+            elif (positions[component2] + 6) > (homepos - 1):
+                if component2 == 0:
+                    positions[component2] = homepos
+                elif component2 == 1:
+                    positions[component2] = homepos + 1
+                elif component2 == 2:
+                    positions[component2] = homepos + 2
+                elif component2 == 3:
+                    positions[component2] = homepos + 3
+            else:
+                positions[component2] = positions[component2] + 6
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], mplay1)
+        elif mplay2.clicked(pt):
+            if (positions[component3] + 6) > 67 and positions[component3] < 68:
+                dif = 67 - positions[component3]
+                positions[component3] = 15 + (6-dif)
+            elif positions[component3] < startpos and (positions[component3] + 6) > (startpos - 1):
+                dif = startpos - positions[component3]
+                if dif == 1:
+                    if component3 == 0:
+                        positions[component3] = homepos
+                    elif component3 == 1:
+                        positions[component3] = homepos + 1
+                    elif component3 == 2:
+                        positions[component3] = homepos + 2
+                    elif component3 == 3:
+                        positions[component3] = homepos + 3
+                else:
+                    positions[component3] = arrowpos + (6-dif)
+            elif (positions[component3] + 6) > (homepos - 1):
+                if component3 == 0:
+                    positions[component3] = homepos
+                elif component3 == 1:
+                    positions[component3] = homepos + 1
+                elif component3 == 2:
+                    positions[component3] = homepos + 2
+                elif component3 == 3:
+                    positions[component3] = homepos + 3
+            else:
+                positions[component3] = positions[component3] + 6
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], mplay2)
+        else:
+            if (positions[component4] + 6) > 67 and positions[component4] < 68:
+                dif = 67 - positions[component4]
+                positions[component4] = 15 + (6-dif)
+            elif positions[component4] < startpos and (positions[component4] + 6) > (startpos - 1):
+                dif = startpos - positions[component4]
+                if dif == 1:
+                    if component4 == 0:
+                        positions[component4] = homepos
+                    elif component4 == 1:
+                        positions[component4] = homepos + 1
+                    elif component4 == 2:
+                        positions[component4] = homepos + 2
+                    elif component4 == 3:
+                        positions[component4] = homepos + 3
+                else:
+                    positions[component4] = arrowpos + (6-dif)
+            elif (positions[component4] + 6) > (homepos - 1):
+                if component4 == 0:
+                    positions[component4] = homepos
+                elif component4 == 1:
+                    positions[component4] = homepos + 1
+                elif component4 == 2:
+                    positions[component4] = homepos + 2
+                elif component4 == 3:
+                    positions[component4] = homepos + 3
+            else:
+                positions[component4] = positions[component4] + 6
+            positions1, positions2, positions3 = clipped(win, positions[component4], player, positions1, positions2, positions3)
+            marker_move(win, positions[component4], mplay3)
+
+
+def pmoves1(win, player, positions, value, m1, component1, positions1, positions2, positions3):
+    pt = win.getMouse()
+    while not m1.clicked(pt):
+        pt = win.getMouse()
+    if player == "player1":
+        pmoves1helper(win, pt, player, positions, value, m1, component1, 16, 68, 73, positions1, positions2, positions3)
+    elif player == "player2":
+        pmoves1helper(win, pt, player, positions, value, m1, component1, 29, 77, 82, positions1, positions2, positions3)
+    elif player == "player3":
+        pmoves1helper(win, pt, player, positions, value, m1, component1, 42, 86, 91, positions1, positions2, positions3)
+    elif player == "player4":
+        pmoves1helper(win, pt, player, positions, value, m1, component1, 55, 95, 100, positions1, positions2, positions3)
+
+    return positions, positions1, positions2, positions3
+
+def pmoves1helper(win, pt, player, positions, value, m1, component1, startpos, arrowpos,
+                  homepos, positions1, positions2, positions3):
+    if player == "player1":
+        if m1.clicked(pt):
+            if (positions[component1] + value) <= (homepos - 1):
+                positions[component1] = positions[component1] + value
+            elif (positions[component1] + value) > (homepos - 1):
+                if component1 == 0:
+                    positions[component1] = homepos
+                elif component1 == 1:
+                    positions[component1] = homepos + 1
+                elif component1 == 2:
+                    positions[component1] = homepos + 2
+                elif component1 == 3:
+                    positions[component1] = homepos + 3
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], m1)
+    else:
+        if m1.clicked(pt):
+            if (positions[component1] + value) > 67 and positions[component1] < 68:
+                dif = 67 - positions[component1]
+                positions[component1] = 15 + (value-dif)
+            elif positions[component1] < startpos and (positions[component1] + value) > (startpos - 1):
+                dif = startpos - positions[component1]
+                positions[component1] = arrowpos + (value-dif)
+            elif (positions[component1] + value) > (homepos - 1):
+                if component1 == 0:
+                    positions[component1] = homepos
+                elif component1 == 1:
+                    positions[component1] = homepos + 1
+                elif component1 == 2:
+                    positions[component1] = homepos + 2
+                elif component1 == 3:
+                    positions[component1] = homepos + 3
+            else:
+                positions[component1] = positions[component1] + value
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], m1)
+    
+
+def pmoves2(win, player, positions, value, m1, m2, component1, component2, positions1, positions2, positions3):
+    pt = win.getMouse()
+    while not (m1.clicked(pt) or m2.clicked(pt)):
+        pt = win.getMouse()
+    if player == "player1":
+        pmoves2helper(win, pt, player, positions, value, m1, m2, component1, component2, 16, 68, 73, positions1, positions2, positions3)
+    elif player == "player2":
+        pmoves2helper(win, pt, player, positions, value, m1, m2, component1, component2, 29, 77, 82, positions1, positions2, positions3)
+    elif player == "player3":
+        pmoves2helper(win, pt, player, positions, value, m1, m2, component1, component2, 42, 86, 91, positions1, positions2, positions3)
+    elif player == "player4":
+        pmoves2helper(win, pt, player, positions, value, m1, m2, component1, component2, 55, 95, 100, positions1, positions2, positions3)
+
+    return positions, positions1, positions2, positions3
+
+def pmoves2helper(win, pt, player, positions, value, m1, m2, component1,
+                  component2, startpos, arrowpos, homepos, positions1, positions2, positions3):
+    if player == "player1":
+        if m1.clicked(pt):
+            if (positions[component1] + value) <= (homepos - 1):
+                positions[component1] = positions[component1] + value
+            elif (positions[component1] + value) > (homepos - 1):
+                if component1 == 0:
+                    positions[component1] = homepos
+                elif component1 == 1:
+                    positions[component1] = homepos + 1
+                elif component1 == 2:
+                    positions[component1] = homepos + 2
+                elif component1 == 3:
+                    positions[component1] = homepos + 3
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], m1)
+        elif m2.clicked(pt):
+            if (positions[component2] + value) <= (homepos - 1):
+                positions[component2] = positions[component2] + value
+            elif (positions[component2] + value) > (homepos - 1):
+                if component2 == 0:
+                    positions[component2] = homepos
+                elif component2 == 1:
+                    positions[component2] = homepos + 1
+                elif component2 == 2:
+                    positions[component2] = homepos + 2
+                elif component2 == 3:
+                    positions[component2] = homepos + 3
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], m2)
+    else:
+        if m1.clicked(pt):
+            if (positions[component1] + value) > 67 and positions[component1] < 68:
+                dif = 67 - positions[component1]
+                positions[component1] = 15 + (value-dif)
+            elif positions[component1] < startpos and (positions[component1] + value) > (startpos - 1):
+                dif = startpos - positions[component1]
+                positions[component1] = arrowpos + (value-dif)
+            elif (positions[component1] + value) > (homepos - 1):
+                if component1 == 0:
+                    positions[component1] = homepos
+                elif component1 == 1:
+                    positions[component1] = homepos + 1
+                elif component1 == 2:
+                    positions[component1] = homepos + 2
+                elif component1 == 3:
+                    positions[component1] = homepos + 3
+            else:
+                positions[component1] = positions[component1] + value
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], m1)
+        elif m2.clicked(pt):
+            if (positions[component2] + value) > 67 and positions[component2] < 68:
+                dif = 67 - positions[component2]
+                positions[component2] = 15 + (value-dif)
+            elif positions[component2] < startpos and (positions[component2] + value) > (startpos - 1):
+                dif = startpos - positions[component2]
+                positions[component2] = arrowpos + (value-dif)
+            elif (positions[component2] + value) > (homepos - 1):
+                if component2 == 0:
+                    positions[component2] = homepos
+                elif component2 == 1:
+                    positions[component2] = homepos + 1
+                elif component2 == 2:
+                    positions[component2] = homepos + 2
+                elif component2 == 3:
+                    positions[component2] = homepos + 3
+            else:
+                positions[component2] = positions[component2] + value
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], m2)
+
+def pmoves3(win, player, positions, value, m1, m2, m3, component1, component2, component3, positions1, positions2, positions3):
+    pt = win.getMouse()
+    while not (m1.clicked(pt) or m2.clicked(pt) or m3.clicked(pt)):
+        pt = win.getMouse()
+    if player == "player1":
+        pmoves3helper(win, pt, player, positions, value, m1, m2, m3, component1, component2, component3, 16, 68, 73, positions1, positions2, positions3)
+    elif player == "player2":
+        pmoves3helper(win, pt, player, positions, value, m1, m2, m3, component1, component2, component3, 29, 77, 82, positions1, positions2, positions3)
+    elif player == "player3":
+        pmoves3helper(win, pt, player, positions, value, m1, m2, m3, component1, component2, component3, 42, 86, 91, positions1, positions2, positions3)
+    elif player == "player4":
+        pmoves3helper(win, pt, player, positions, value, m1, m2, m3, component1, component2, component3, 55, 95, 100, positions1, positions2, positions3)
+
+    return positions, positions1, positions2, positions3
+
+def pmoves3helper(win, pt, player, positions, value, m1, m2, m3, component1,
+                  component2, component3, startpos, arrowpos, homepos, positions1, positions2, positions3):
+    if player == "player1":
+        if m1.clicked(pt):
+            if (positions[component1] + value) <= (homepos - 1):
+                positions[component1] = positions[component1] + value
+            elif (positions[component1] + value) > (homepos - 1):
+                if component1 == 0:
+                    positions[component1] = homepos
+                elif component1 == 1:
+                    positions[component1] = homepos + 1
+                elif component1 == 2:
+                    positions[component1] = homepos + 2
+                elif component1 == 3:
+                    positions[component1] = homepos + 3
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], m1)
+        elif m2.clicked(pt):
+            if (positions[component2] + value) <= (homepos - 1):
+                positions[component2] = positions[component2] + value
+            elif (positions[component2] + value) > (homepos - 1):
+                if component2 == 0:
+                    positions[component2] = homepos
+                elif component2 == 1:
+                    positions[component2] = homepos + 1
+                elif component2 == 2:
+                    positions[component2] = homepos + 2
+                elif component2 == 3:
+                    positions[component2] = homepos + 3
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], m2)
+        elif m3.clicked(pt):
+            if (positions[component3] + value) <= (homepos - 1):
+                positions[component3] = positions[component3] + value
+            elif (positions[component3] + value) > (homepos - 1):
+                if component3 == 0:
+                    positions[component3] = homepos
+                elif component3 == 1:
+                    positions[component3] = homepos + 1
+                elif component3 == 2:
+                    positions[component3] = homepos + 2
+                elif component3 == 3:
+                    positions[component3] = homepos + 3
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], m3)
+    else:
+        if m1.clicked(pt):
+            if (positions[component1] + value) > 67 and positions[component1] < 68:
+                dif = 67 - positions[component1]
+                positions[component1] = 15 + (value-dif)
+            elif positions[component1] < startpos and (positions[component1] + value) > (startpos - 1):
+                dif = startpos - positions[component1]
+                positions[component1] = arrowpos + (value-dif)
+            elif (positions[component1] + value) > (homepos - 1):
+                if component1 == 0:
+                    positions[component1] = homepos
+                elif component1 == 1:
+                    positions[component1] = homepos + 1
+                elif component1 == 2:
+                    positions[component1] = homepos + 2
+                elif component1 == 3:
+                    positions[component1] = homepos + 3
+            else:
+                positions[component1] = positions[component1] + value
+            positions1, positions2, positions3 = clipped(win, positions[component1], player, positions1, positions2, positions3)
+            marker_move(win, positions[component1], m1)
+        elif m2.clicked(pt):
+            if (positions[component2] + value) > 67 and positions[component2] < 68:
+                dif = 67 - positions[component2]
+                positions[component2] = 15 + (value-dif)
+            elif positions[component2] < startpos and (positions[component2] + value) > (startpos - 1):
+                dif = startpos - positions[component2]
+                positions[component2] = arrowpos + (value-dif)
+            elif (positions[component2] + value) > (homepos - 1):
+                if component2 == 0:
+                    positions[component2] = homepos
+                elif component2 == 1:
+                    positions[component2] = homepos + 1
+                elif component2 == 2:
+                    positions[component2] = homepos + 2
+                elif component2 == 3:
+                    positions[component2] = homepos + 3
+            else:
+                positions[component2] = positions[component2] + value
+            positions1, positions2, positions3 = clipped(win, positions[component2], player, positions1, positions2, positions3)
+            marker_move(win, positions[component2], m2)
+        elif m3.clicked(pt):
+            if (positions[component3] + value) > 67 and positions[component3] < 68:
+                dif = 67 - positions[component3]
+                positions[component3] = 15 + (value-dif)
+            elif positions[component3] < startpos and (positions[component3] + value) > (startpos - 1):
+                dif = startpos - positions[component3]
+                positions[component3] = arrowpos + (value-dif)
+            elif (positions[component3] + value) > (homepos - 1):
+                if component3 == 0:
+                    positions[component3] = homepos
+                elif component3 == 1:
+                    positions[component3] = homepos + 1
+                elif component3 == 2:
+                    positions[component3] = homepos + 2
+                elif component3 == 3:
+                    positions[component3] = homepos + 3
+            else:
+                positions[component3] = positions[component3] + value
+            positions1, positions2, positions3 = clipped(win, positions[component3], player, positions1, positions2, positions3)
+            marker_move(win, positions[component3], m3)
+
+def pmoves4(win, player, positions, value, m1, m2, m3, m4, positions1, positions2, positions3):
+    pt = win.getMouse()
+    while not (m1.clicked(pt) or m2.clicked(pt) or m3.clicked(pt) or m4.clicked(pt)):
+        pt = win.getMouse()
+    if player == "player1":
+        pmoves4helper(win, pt, player, positions, value, m1, m2, m3, m4, 16, 68, 73, positions1, positions2, positions3)
+    elif player == "player2":
+        pmoves4helper(win, pt, player, positions, value, m1, m2, m3, m4, 29, 77, 82, positions1, positions2, positions3)
+    elif player == "player3":
+        pmoves4helper(win, pt, player, positions, value, m1, m2, m3, m4, 42, 86, 91, positions1, positions2, positions3)
+    elif player == "player4":
+        pmoves4helper(win, pt, player, positions, value, m1, m2, m3, m4, 55, 95, 100, positions1, positions2, positions3)
+
+    return positions, positions1, positions2, positions3
+
+def pmoves4helper(win, pt, player, positions, value, m1, m2, m3, m4, startpos, arrowpos, homepos, positions1, positions2, positions3):
+    if player == "player1":
+        if m1.clicked(pt):
+            if (positions[0] + value) <= (homepos - 1):
+                positions[0] = positions[0] + value
+            elif (positions[0] + value) > (homepos - 1):
+                positions[0] = homepos
+            positions1, positions2, positions3 = clipped(win, positions[0], player, positions1, positions2, positions3)
+            marker_move(win, positions[0], m1)
+        if m2.clicked(pt):
+            if (positions[1] + value) <= (homepos - 1):
+                positions[1] = positions[1] + value
+            elif (positions[1] + value) > (homepos - 1):
+                positions[1] = (homepos + 1)
+            positions1, positions2, positions3 = clipped(win, positions[1], player, positions1, positions2, positions3)
+            marker_move(win, positions[1], m2)
+        if m3.clicked(pt):
+            if (positions[2] + value) <= (homepos - 1):
+                positions[2] = positions[2] + value
+            elif (positions[2] + value) > (homepos - 1):
+                positions[2] = (homepos + 2)
+            positions1, positions2, positions3 = clipped(win, positions[2], player, positions1, positions2, positions3)
+            marker_move(win, positions[2], m3)
+        if m4.clicked(pt):
+            if (positions[3] + value) <= (homepos - 1):
+                positions[3] = positions[3] + value
+            elif (positions[3] + value) > (homepos - 1):
+                positions[3] = (homepos + 3)
+            positions1, positions2, positions3 = clipped(win, positions[3], player, positions1, positions2, positions3)
+            marker_move(win, positions[3], m4)
+    else:
+        if m1.clicked(pt):
+            if (positions[0] + value) > 67 and positions[0] < 68:
+                dif = 67 - positions[0]
+                positions[0] = 15 + (value-dif)
+            elif positions[0] < startpos and (positions[0] + value) > (startpos - 1):
+                dif = startpos - positions[0]
+                positions[0] = arrowpos + (value-dif)
+            elif (positions[0] + value) > (homepos - 1):
+                positions[0] = homepos
+            else:
+                positions[0] = positions[0] + value
+            positions1, positions2, positions3 = clipped(win, positions[0], player, positions1, positions2, positions3)
+            marker_move(win, positions[0], m1)
+        if m2.clicked(pt):
+            if (positions[1] + value) > 67 and positions[1] < 68:
+                dif = 67 - positions[0]
+                positions[1] = 15 + (value-dif)
+            elif positions[1] < startpos and (positions[1] + value) > (startpos - 1):
+                dif = startpos - positions[1]
+                positions[1] = arrowpos + (value-dif)
+            elif (positions[1] + value) > (homepos - 1):
+                positions[1] = homepos + 1
+            else:
+                positions[1] = positions[1] + value
+            positions1, positions2, positions3 = clipped(win, positions[1], player, positions1, positions2, positions3)
+            marker_move(win, positions[1], m2)
+        if m3.clicked(pt):
+            if (positions[2] + value) > 67 and positions[2] < 68:
+                dif = 67 - positions[2]
+                positions[2] = 15 + (value-dif)
+            elif positions[2] < startpos and (positions[2] + value) > (startpos - 1):
+                dif = startpos - positions[2]
+                positions[2] = arrowpos + (value-dif)
+            elif (positions[2] + value) > (homepos - 1):
+                positions[2] = homepos + 2
+            else:
+                positions[2] = positions[2] + value
+            positions1, positions2, positions3 = clipped(win, positions[2], player, positions1, positions2, positions3)
+            marker_move(win, positions[2], m3)
+        if m4.clicked(pt):
+            if (positions[3] + value) > 67 and positions[3] < 68:
+                dif = 67 - positions[3]
+                positions[3] = 15 + (value-dif)
+            elif positions[3] < startpos and (positions[3] + value) > (startpos - 1):
+                dif = startpos - positions[3]
+                positions[3] = arrowpos + (value-dif)
+            elif (positions[3] + value) > (homepos - 1):
+                positions[3] = homepos + 3
+            else:
+                positions[3] = positions[3] + value
+            positions1, positions2, positions3 = clipped(win, positions[3], player, positions1, positions2, positions3)
+            marker_move(win, positions[3], m4)
+
+
+
+# The old code redrew a marker after each move; there is no board here.
+def marker_move(win, l_index, marker):
+    pass
+
+
+class Refused(Exception):
+    """The old rules asked for another click: the one given was not a move."""
+
+
+class ClickMarker(object):
+
+    """Stands in for a CButton: marker is its index 0-15."""
+
+    def __init__(self, marker):
+        self.marker = marker
+
+    def clicked(self, pt):
+        return pt == self.marker
+
+
+class OneClickWindow(object):
+
+    """Stands in for the GraphWin: the first getMouse() clicks marker, and
+    any further one means the old rules refused it."""
+
+    def __init__(self, marker):
+        self.marker = marker
+        self.clicks = 0
+
+    def getMouse(self):
+        self.clicks += 1
+        if self.clicks > 1:
+            raise Refused()
+        return self.marker
+
+
+MARKERS = [ClickMarker(marker) for marker in range(16)]
+
+
+def old_move(squares, player, die, piece):
+    """Play the old rules' moves() for player clicking piece with die, from
+    the 16 engine squares.  Returns the 16 squares after the move, or None
+    if the old rules would not move that piece (they asked for another
+    click, or moved nothing without asking for one)."""
+    tables = [[0 if square < 16 else square for square in squares[4 * seat:4 * seat + 4]]
+              for seat in range(4)]
+    others = [tables[seat] for seat in range(4) if seat != player]
+    win = OneClickWindow(4 * player + piece)
+    try:
+        moves(win, die, tables[player], "player{0}".format(player + 1),
+              *(MARKERS + others))
+    except Refused:
+        return None
+    if not win.clicks:
+        return None
+    return [4 * seat + index if square == 0 else square
+            for seat in range(4) for index, square in enumerate(tables[seat])]
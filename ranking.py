@@ -0,0 +1,140 @@
+# ranking.py
+# Dense indexes for the states of a subgame, so that a table over them can
+#   be a plain array with one entry per state instead of a dict.
+#
+# States are taken in canonical form (canonical.py), so each player's
+#   pieces are just so many in the nest, so many home, and a set of
+#   distinct steps along the route.  SeatRanker numbers those positions of
+#   one player 0, 1, 2, ... with no gaps: positions with fewer pieces on
+#   the route come first, then by how many are in the nest, then by their
+#   set of steps in the combinatorial number system.  StateRanker combines
+#   four players' numbers into one index, mixed radix.
+#
+# A subgame is set by where pieces may be: SeatRanker(52, nest=False), for
+#   instance, covers only the home stretch and home slots, which is the
+#   race in tablebase.py.
+
+from math import comb
+
+from engine import NEST, HOME, GameState
+from bitboard import PROGRESS, PATH_LENGTH
+from canonical import canonical_form, rank
+
+# STEP_SQUARE[seat][step] is the board index of step `step` of seat's route.
+STEP_SQUARE = tuple(
+    tuple(PROGRESS[seat].index(step) for step in range(PATH_LENGTH))
+    for seat in range(4))
+
+
+def rank_combination(steps):
+    """Return the index of a sorted sequence of distinct non-negative ints
+    among all sequences of the same length, in colex order."""
+    return sum(comb(step, i + 1) for i, step in enumerate(steps))
+
+def unrank_combination(index, k):
+    """Return the sorted k distinct ints that rank_combination() numbers
+    index."""
+    steps = []
+    for i in range(k, 0, -1):
+        step = i - 1
+        while comb(step + 1, i) <= index:
+            step += 1
+        index -= comb(step, i)
+        steps.append(step)
+    steps.reverse()
+    return steps
+
+
+class SeatRanker(object):
+
+    """Numbers one player's positions in a subgame where pieces on the
+    route are at step first_step or further, and may be in the nest only
+    if nest is true.  size is how many positions there are."""
+
+    def __init__(self, first_step=0, nest=True):
+        self.first_step = first_step
+        self.nest = nest
+        self.length = PATH_LENGTH - first_step
+        # offsets[k][n] is the first number used for positions with k
+        #   pieces on the route and n in the nest.
+        self.offsets = []
+        size = 0
+        for k in range(5):
+            row = []
+            for n in range(5 - k if nest else 1):
+                row.append(size)
+                size += comb(self.length, k)
+            self.offsets.append(row)
+        self.size = size
+
+    def rank(self, steps):
+        """Return the number of the position whose pieces have the given
+        canonical.rank() values, or None if it is not in the subgame."""
+        nests = 0
+        route = []
+        for step in steps:
+            if step < 0:
+                nests += 1
+            elif step < PATH_LENGTH:
+                if step < self.first_step:
+                    return None
+                route.append(step - self.first_step)
+        if nests and not self.nest:
+            return None
+        route.sort()
+        return self.offsets[len(route)][nests] + rank_combination(route)
+
+    def unrank(self, number):
+        """Return the sorted canonical.rank() values of position number."""
+        for k in range(4, -1, -1):
+            row = self.offsets[k]
+            for nests in range(len(row) - 1, -1, -1):
+                if row[nests] <= number:
+                    route = unrank_combination(number - row[nests], k)
+                    homes = 4 - k - nests
+                    return ([-1] * nests + [step + self.first_step for step in route] +
+                            [PATH_LENGTH] * homes)
+        raise ValueError("position number out of range")
+
+
+class StateRanker(object):
+
+    """Numbers the canonical forms of the states in a subgame, given one
+    SeatRanker per player (player 0 being the player to move), from 0 to
+    size - 1."""
+
+    def __init__(self, seats):
+        self.seats = tuple(seats)
+        self.size = 1
+        for seat in self.seats:
+            self.size *= seat.size
+
+    def rank(self, state):
+        """Return the index of state's canonical form, or None if it is
+        not in the subgame."""
+        form = canonical_form(state)[0]
+        index = 0
+        for seat in range(3, -1, -1):
+            first = 4 * seat
+            steps = [rank(seat, form.squares[marker]) for marker in range(first, first + 4)]
+            number = self.seats[seat].rank(steps)
+            if number is None:
+                return None
+            index = index * self.seats[seat].size + number
+        return index
+
+    def unrank(self, index):
+        """Return the canonical state with the given index."""
+        squares = bytearray(16)
+        for seat in range(4):
+            index, number = divmod(index, self.seats[seat].size)
+            steps = self.seats[seat].unrank(number)
+            for piece, step in enumerate(steps):
+                if step < 0:
+                    square = NEST[seat] + piece
+                elif step == PATH_LENGTH:
+                    square = HOME[seat] + piece
+                else:
+                    square = STEP_SQUARE[seat][step]
+                squares[4 * seat + piece] = square
+        return GameState(squares, 0)
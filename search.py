@@ -0,0 +1,317 @@
+# search.py
+# Expectimax search for Clip 'Em.  A turn is a choice node (the mover
+#   picks a piece for the roll it has) followed by a chance node (the next
+#   player's six equally likely rolls).  With four players the values are
+#   4-tuples, one score per player, and every mover maximises its own entry
+#   (the "max-n" rule).
+#
+# ExpectimaxBot deepens one ply at a time until its time budget runs out
+#   and plays the best move of the deepest search that finished.  Chance
+#   node values are kept in a transposition table keyed on the state, so a
+#   position reached by different move orders is only searched once.
+#
+# Race positions (every marker on its home stretch or home) are not
+#   searched but looked up in the race table from tablebase.py, when it
+#   has been generated.
+#
+# For analysis, analyse() splits the root into one job per candidate
+#   piece and roll of the next player and deepens them in a pool of
+#   worker processes against one shared deadline, merging the results as
+#   the workers hand them back.
+
+import multiprocessing
+import time
+
+from engine import legal_moves, apply_move, pass_turn, winner
+from bots import Player, progress
+
+WIN = 1000.0
+
+
+def evaluate(state):
+    """Return a 4-tuple of scores: each player's total progress minus the
+    average progress of the other three."""
+    won = winner(state)
+    if won is not None:
+        return tuple(WIN if player == won else -WIN / 3 for player in range(4))
+    totals = [0, 0, 0, 0]
+    for marker in range(16):
+        owner = marker // 4
+        totals[owner] += progress(owner, marker, state[marker])
+    whole = sum(totals)
+    return tuple(total - (whole - total) / 3.0 for total in totals)
+
+
+def race_value(chances):
+    """Turn each player's chance of winning into the scores evaluate()
+    gives a won game, weighted by those chances."""
+    return tuple(chance * WIN - (1 - chance) * WIN / 3 for chance in chances)
+
+def default_race():
+    """Return tablebase.default(), or None if the table has not been
+    generated or numpy is not installed."""
+    try:
+        import tablebase
+    except ImportError:
+        return None
+    return tablebase.default()
+
+
+class OutOfTime(Exception):
+    pass
+
+
+class Search(object):
+
+    """One expectimax search with a deadline and a transposition table
+    mapping state -> (depth searched, value).  race, if given, is a
+    RaceTable to answer race positions from."""
+
+    def __init__(self, table, deadline, race=None):
+        self.table = table
+        self.deadline = deadline
+        self.race = race
+        self.nodes = 0
+
+    def chance(self, state, depth):
+        """Value of state before its player to move has rolled."""
+        if depth == 0 or winner(state) is not None:
+            return evaluate(state)
+        if self.race is not None:
+            chances = self.race.probe(state)
+            if chances is not None:
+                return race_value(chances)
+        entry = self.table.get(state)
+        if entry is not None and entry[0] >= depth:
+            return entry[1]
+        self.nodes += 1
+        if time.time() > self.deadline:
+            raise OutOfTime()
+        totals = [0.0, 0.0, 0.0, 0.0]
+        for die in range(1, 7):
+            value = self.choice(state, die, depth)
+            for player in range(4):
+                totals[player] += value[player]
+        value = tuple(total / 6.0 for total in totals)
+        self.table[state] = (depth, value)
+        return value
+
+    def choice(self, state, die, depth):
+        """Value of state once its player to move has rolled die."""
+        player = state.player
+        legal = legal_moves(state, player, die)
+        if not legal:
+            return self.chance(pass_turn(state), depth - 1)
+        best = None
+        for piece in legal:
+            value = self.chance(apply_move(state, player, piece, die), depth - 1)
+            if best is None or value[player] > best[player]:
+                best = value
+        return best
+
+    def root(self, state, die, legal, depth):
+        """Return the pieces of legal ordered best first, searched to depth."""
+        player = state.player
+        scored = []
+        for piece in legal:
+            value = self.chance(apply_move(state, player, piece, die), depth - 1)
+            scored.append((value[player], piece))
+        scored.sort(key=lambda item: -item[0])
+        return [piece for score, piece in scored]
+
+
+class ExpectimaxBot(Player):
+
+    """Iterative-deepening expectimax within a wall-clock budget (seconds).
+    The default budget leaves headroom so a move comes back inside 50 ms.
+    The transposition table is kept between moves and cleared once it holds
+    more than table_size states.  race is the RaceTable to use, by default
+    default_race()."""
+
+    name = "Expectimax Bot"
+
+    def __init__(self, budget=0.04, max_depth=12, table_size=200000, race=None):
+        if race is None:
+            race = default_race()
+        self.race = race
+        self.budget = budget
+        self.max_depth = max_depth
+        self.table_size = table_size
+        self.table = {}
+        self.depth = 0
+
+    def choose_move(self, state, die, legal_moves):
+        if len(legal_moves) == 1:
+            return legal_moves[0]
+        if len(self.table) > self.table_size:
+            self.table.clear()
+        search = Search(self.table, time.time() + self.budget, self.race)
+        order = list(legal_moves)
+        self.depth = 0
+        for depth in range(1, self.max_depth + 1):
+            try:
+                order = search.root(state, die, order, depth)
+            except OutOfTime:
+                break
+            self.depth = depth
+        return order[0]
+
+
+# Each worker process keeps its own transposition table between jobs,
+#   unless use_table() has pointed it at a SharedTable file.
+_table = {}
+TABLE_SIZE = 200000
+
+
+def use_table(path):
+    """Make search jobs in this process use the SharedTable (tables.py) at
+    path, so that all the workers in a pool share one table."""
+    global _table
+    from tables import SharedTable
+    _table = SharedTable(path)
+
+
+def search_job(job):
+    """Deepen one root subtree.  job is (piece, state, die, deadline, share,
+    max_depth): state is the position after moving piece and die the next
+    player's roll.  The job stops at the shared deadline or `share` seconds
+    after it starts, whichever is sooner.  Returns (piece, die, {depth:
+    value}) for every depth finished; the first depth is always searched,
+    even past the deadline."""
+    piece, state, die, deadline, share, max_depth = job
+    if isinstance(_table, dict) and len(_table) > TABLE_SIZE:
+        _table.clear()
+    race = default_race()
+    values = {1: Search(_table, float("inf"), race).choice(state, die, 1)}
+    search = Search(_table, min(deadline, time.time() + share), race)
+    for depth in range(2, max_depth + 1):
+        try:
+            values[depth] = search.choice(state, die, depth)
+        except OutOfTime:
+            break
+    return piece, die, values
+
+def analyse(state, die, budget=1.0, workers=None, max_depth=12, pool=None,
+            table=None):
+    """Score every legal move of the player to move in state with die,
+    searching in `workers` processes (all cores by default) for `budget`
+    seconds.  Returns a list of (piece, depth, value) best first, where
+    depth is the search depth reached and value the 4-tuple of scores.
+    An open pool from make_pool() may be passed in to reuse; otherwise
+    table, if given, is the path of a SharedTable for the workers to
+    share.  Returns [] if die gives no legal move.  max_depth counts the
+    root's own ply, so it must be at least 2."""
+    global _table
+    if max_depth < 2:
+        raise ValueError("max_depth must be at least 2")
+    player = state.player
+    legal = legal_moves(state, player, die)
+    if not legal:
+        return []
+    results = {}
+    positions = []
+    for piece in legal:
+        after = apply_move(state, player, piece, die)
+        if winner(after) is not None:
+            value = evaluate(after)
+            final = dict((depth, value) for depth in range(1, max_depth))
+            results[piece] = dict((roll, final) for roll in range(1, 7))
+        else:
+            results[piece] = {}
+            positions.append((piece, after))
+    own = False
+    if workers == 1:
+        # Searching in this process: a SharedTable stands in for its own
+        #   table only for this call.
+        saved = _table
+        start_worker(table)
+        slots = 1
+    else:
+        if pool is None:
+            pool = make_pool(workers, table)
+            own = True
+        slots = workers or multiprocessing.cpu_count()
+    # The clock starts once the workers are ready.  There are usually more
+    #   jobs than workers, so each job also gets only its share of the
+    #   budget; otherwise the first ones would use it all up.
+    deadline = time.time() + budget
+    share = budget * slots / max(6 * len(positions), 1)
+    jobs = [(piece, after, roll, deadline, share, max_depth - 1)
+            for piece, after in positions for roll in range(1, 7)]
+    if workers == 1:
+        try:
+            return _merge(map(search_job, jobs), results, player)
+        finally:
+            if _table is not saved:
+                _table.close()
+                _table = saved
+    try:
+        return _merge(pool.imap_unordered(search_job, jobs), results, player)
+    finally:
+        if own:
+            pool.close()
+            pool.join()
+
+def start_worker(table=None):
+    """Get a process ready to run search jobs: load the race table, and
+    switch to the SharedTable at path table if one is given.  Used as the
+    pool initializer."""
+    default_race()
+    if table is not None:
+        use_table(table)
+
+def make_pool(workers=None, table=None):
+    """Return a pool of search workers, sharing the SharedTable at path
+    table if one is given."""
+    return multiprocessing.Pool(workers, start_worker, (table,))
+
+def _merge(done, results, player):
+    # A move's value is the average over its six rolls.  Every move is
+    #   scored at the deepest depth all the jobs reached, so that they are
+    #   compared fairly; the root adds one ply to that depth.
+    for piece, roll, values in done:
+        results[piece][roll] = values
+    depth = min(max(values) for rolls in results.values() for values in rolls.values())
+    scored = []
+    for piece, rolls in results.items():
+        totals = [0.0, 0.0, 0.0, 0.0]
+        for values in rolls.values():
+            for seat in range(4):
+                totals[seat] += values[depth][seat]
+        scored.append((piece, depth + 1, tuple(total / 6.0 for total in totals)))
+    scored.sort(key=lambda item: -item[2][player])
+    return scored
+
+
+class ParallelExpectimaxBot(Player):
+
+    """Plays the best move from analyse(), keeping one pool of worker
+    processes open until close() is called.  table is as for analyse()."""
+
+    name = "Parallel Expectimax Bot"
+
+    def __init__(self, budget=1.0, workers=None, max_depth=12, table=None):
+        if max_depth < 2:
+            raise ValueError("max_depth must be at least 2")
+        self.budget = budget
+        self.workers = workers
+        self.max_depth = max_depth
+        self.table = table
+        self.pool = None
+        self.depth = 0
+
+    def choose_move(self, state, die, legal_moves):
+        if len(legal_moves) == 1:
+            return legal_moves[0]
+        if self.pool is None and self.workers != 1:
+            self.pool = make_pool(self.workers, self.table)
+        scored = analyse(state, die, self.budget, self.workers, self.max_depth,
+                         self.pool, self.table)
+        self.depth = scored[0][1]
+        return scored[0][0]
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
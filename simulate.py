@@ -0,0 +1,116 @@
+# simulate.py
+# Monte Carlo runs of Clip 'Em spread over a pool of worker processes.
+#   The games are split into chunks, each chunk gets its own random stream
+#   spawned from one seed, and the workers' tallies are merged as they
+#   come back.  Each game rolls its own Dice stream, spawned from its
+#   chunk's, so the same seed always gives the same totals however many
+#   workers are used.
+
+import multiprocessing
+import random
+
+import numpy as np
+
+from engine import new_game, legal_moves, apply_move, pass_turn, winner
+from dice import Dice
+
+# Games per job.  It is fixed rather than worked out from the number of
+#   workers, since the chunks decide the random streams; being small, it
+#   gives even a 10000-game run some 300 jobs, enough to keep every core
+#   busy to the end.
+CHUNK = 32
+
+
+class Tally(object):
+
+    """Totals from a batch of games: wins per player, games played, plies
+    played and games abandoned at the ply limit."""
+
+    def __init__(self):
+        self.wins = [0, 0, 0, 0]
+        self.games = 0
+        self.plies = 0
+        self.unfinished = 0
+
+    def add(self, won, plies):
+        self.games += 1
+        self.plies += plies
+        if won is None:
+            self.unfinished += 1
+        else:
+            self.wins[won] += 1
+
+    def merge(self, other):
+        for player in range(4):
+            self.wins[player] += other.wins[player]
+        self.games += other.games
+        self.plies += other.plies
+        self.unfinished += other.unfinished
+
+    def __repr__(self):
+        return "Tally(wins={0}, games={1}, plies={2}, unfinished={3})".format(
+            self.wins, self.games, self.plies, self.unfinished)
+
+
+def play_game(rng, max_plies=5000, players=None, dice=None):
+    """Play one game.  players, if given, holds four bots from bots.py;
+    otherwise every player moves a random legal piece chosen with rng.
+    dice, if given, is the Dice to roll; otherwise rng rolls too.  Returns
+    (winner, plies); winner is None if max_plies ran out."""
+    state = new_game()
+    for ply in range(max_plies):
+        won = winner(state)
+        if won is not None:
+            return won, ply
+        die = dice.roll() if dice is not None else rng.randint(1, 6)
+        legal = legal_moves(state, state.player, die)
+        if legal and players is not None:
+            piece = players[state.player].choose_move(state, die, legal)
+            state = apply_move(state, state.player, piece, die)
+        elif legal:
+            state = apply_move(state, state.player, rng.choice(legal), die)
+        else:
+            state = pass_turn(state)
+    return winner(state), max_plies
+
+def python_rng(seed_seq):
+    """Return a random.Random seeded from a numpy SeedSequence."""
+    words = seed_seq.generate_state(4)
+    return random.Random(int.from_bytes(words.tobytes(), "little"))
+
+def run_chunk(job):
+    """Play one chunk of games: job is (SeedSequence, games, max_plies)."""
+    seed_seq, games, max_plies = job
+    rng = python_rng(seed_seq)
+    tally = Tally()
+    for dice in Dice(seed_seq).spawn(games):
+        won, plies = play_game(rng, max_plies, dice=dice)
+        tally.add(won, plies)
+    return tally
+
+def simulate(games, workers=None, seed=None, chunk=CHUNK, max_plies=5000,
+             progress=None):
+    """Play `games` games across `workers` processes (all cores by
+    default) and return the merged Tally.  progress, if given, is called
+    with the running Tally each time a chunk finishes."""
+    sizes = [chunk] * (games // chunk)
+    if games % chunk:
+        sizes.append(games % chunk)
+    streams = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(stream, size, max_plies) for stream, size in zip(streams, sizes)]
+    if workers == 1:
+        return _merge(map(run_chunk, jobs), progress)
+    pool = multiprocessing.Pool(workers)
+    try:
+        return _merge(pool.imap_unordered(run_chunk, jobs), progress)
+    finally:
+        pool.close()
+        pool.join()
+
+def _merge(parts, progress):
+    total = Tally()
+    for part in parts:
+        total.merge(part)
+        if progress is not None:
+            progress(total)
+    return total
@@ -0,0 +1,157 @@
+# tablebase.py
+# Exact endgame values for the home-stretch race.  Once every marker still
+#   out is on its own player's home stretch, nothing can be clipped and
+#   each player is just rolling their pieces home, so the rest of the game
+#   can be worked out in full instead of searched.
+#
+# One player's race position is the set of stretch squares they still
+#   occupy, a 5-bit mask (the other pieces are home).  Working backwards
+#   from the finished position, race_turns() finds each mask's best move
+#   for every roll and the resulting distribution of turns left.  Combining
+#   four of those gives each player's chance of finishing first, and
+#   generate() writes that for every race position to a table file that
+#   RaceTable answers from with a single lookup.
+#
+# The table is a flat file of uint16 chances mapped with mmap (see
+#   tables.py), so processes sharing it also share its memory.
+#
+# Each player moves to finish in as few turns as they can on average.
+#   That is not always quite the same as the move that most improves
+#   their chance of beating the others, but it is what a player racing
+#   home would do and it keeps the players' races independent.
+
+import os
+
+import numpy as np
+
+from engine import ARROW, HOME, MOVES
+from canonical import ROTATE
+from tables import write_array, open_array
+
+STRETCH = HOME[0] - ARROW[0]
+MASKS = 1 << STRETCH
+# No race lasts longer than this many turns: every turn some piece moves.
+MAX_TURNS = 1 + STRETCH * 4
+POSITIONS = MASKS ** 4
+MAGIC = b"CLIPRACE1\n"
+SCALE = 65535
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "race.tb")
+
+
+def _moves(mask, die):
+    """Return the masks a player with pieces on the stretch squares in mask
+    can move to with die.  Pieces are interchangeable, so this uses the
+    engine's moves for piece 0."""
+    result = []
+    for step in range(STRETCH):
+        if not mask >> step & 1:
+            continue
+        dest = MOVES[(ARROW[0] + step) * 6 + die - 1]
+        after = mask & ~(1 << step)
+        if dest < HOME[0]:
+            bit = 1 << (dest - ARROW[0])
+            if after & bit:
+                continue
+            after |= bit
+        result.append(after)
+    return result
+
+def race_turns():
+    """Return (expected, dist, best): for every mask, the expected number
+    of turns to bring the rest home, the distribution of that number
+    (dist[mask][t] = P(exactly t turns)), and best[mask][die - 1], the mask
+    to move to with die."""
+    expected = np.zeros(MASKS)
+    dist = np.zeros((MASKS, MAX_TURNS + 1))
+    best = np.zeros((MASKS, 6), dtype=np.int64)
+    dist[0, 0] = 1.0
+    # A move clears one bit and sets a higher one (or none, for a piece
+    #   going home), which makes the mask smaller read with its bits
+    #   reversed.  So in that order every mask comes after those it leads to.
+    order = sorted(range(1, MASKS),
+                   key=lambda mask: int(format(mask, "0{0}b".format(STRETCH))[::-1], 2))
+    for mask in order:
+        total = 0.0
+        for die in range(1, 7):
+            after = min(_moves(mask, die), key=lambda m: expected[m])
+            best[mask, die - 1] = after
+            total += expected[after]
+            dist[mask, 1:] += dist[after, :-1] / 6.0
+        expected[mask] = 1 + total / 6.0
+    return expected, dist, best
+
+def win_chances(dist):
+    """Return an array of shape (MASKS,) * 4 + (4,): the chance of each
+    player finishing first, player 0 to move, indexed by the four masks."""
+    more = 1.0 - np.cumsum(dist, axis=1)   # P(T > t)
+    least = more + dist                    # P(T >= t)
+    chances = np.zeros((MASKS,) * 4 + (4,))
+    for player in range(4):
+        # Players moving before `player` in a round must take longer to
+        #   tie it; players after it only need to take as long.
+        factors = [more if seat < player else least for seat in range(4)]
+        factors[player] = dist
+        letters = "abcd"
+        spec = ",".join("{0}t".format(letter) for letter in letters) + "->abcd"
+        chances[..., player] = np.einsum(spec, *factors)
+    return chances
+
+def generate(path=DEFAULT_PATH):
+    """Write the race table to path and return the number of positions."""
+    expected, dist, best = race_turns()
+    chances = win_chances(dist)
+    # Masks are stored with player 0's in the low bits.
+    table = np.round(chances.transpose(3, 2, 1, 0, 4) * SCALE).astype("<u2")
+    write_array(path, MAGIC, table)
+    return POSITIONS
+
+
+def race_masks(state):
+    """Return the four players' stretch masks, the player to move first,
+    or None if some marker is not on its home stretch or home slot."""
+    rotate = ROTATE[state.player]
+    masks = [0, 0, 0, 0]
+    for seat in range(4):
+        first = 4 * ((seat + state.player) % 4)
+        arrow = ARROW[seat]
+        for marker in range(first, first + 4):
+            step = rotate[state.squares[marker]] - arrow
+            if step < 0 or step >= STRETCH + 4:
+                return None
+            if step < STRETCH:
+                masks[seat] |= 1 << step
+    return masks
+
+
+class RaceTable(object):
+
+    """The table written by generate(), mapped into memory."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.table = open_array(path, MAGIC, "<u2", (POSITIONS, 4))
+
+    def probe(self, state):
+        """Return each player's chance of winning (a 4-tuple, indexed by
+        player) if state is a race position, otherwise None."""
+        masks = race_masks(state)
+        if masks is None:
+            return None
+        index = (masks[0] | masks[1] << STRETCH | masks[2] << 2 * STRETCH |
+                 masks[3] << 3 * STRETCH)
+        row = self.table[index]
+        shift = state.player
+        return tuple(int(row[(player - shift) % 4]) / float(SCALE) for player in range(4))
+
+
+_default = []
+
+def default():
+    """Return the RaceTable at DEFAULT_PATH, or None if it has not been
+    generated.  It is only loaded once."""
+    if not _default:
+        _default.append(RaceTable() if os.path.exists(DEFAULT_PATH) else None)
+    return _default[0]
+
+
+if __name__ == "__main__":
+    print("{0} positions written to {1}".format(generate(), DEFAULT_PATH))
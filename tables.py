@@ -0,0 +1,85 @@
+# tables.py
+# Flat binary files for precomputed tables, opened with mmap so that every
+#   process using one shares a single copy through the page cache instead
+#   of loading its own.
+#
+# A table file is a short magic line naming what it holds followed by
+#   fixed-width little-endian records, so the file can be mapped straight
+#   into a NumPy array.  SharedTable uses the same layout for a
+#   transposition table that several worker processes read and write at
+#   once.
+
+import numpy as np
+
+
+def write_array(path, magic, array):
+    """Write array to path after the magic line."""
+    with open(path, "wb") as out:
+        out.write(magic)
+        np.ascontiguousarray(array).tofile(out)
+
+def open_array(path, magic, dtype, shape=None, mode="r"):
+    """Map the array written by write_array() into memory.  Raises
+    ValueError if the file does not start with magic."""
+    with open(path, "rb") as table:
+        if table.read(len(magic)) != magic:
+            raise ValueError("{0} is not a {1} table".format(
+                path, magic.strip().decode("ascii", "replace")))
+    array = np.memmap(path, dtype=dtype, mode=mode, offset=len(magic))
+    if shape is not None:
+        array = array.reshape(shape)
+    return array
+
+
+SHARED_MAGIC = b"CLIPTT1\n"
+
+
+class SharedTable(object):
+
+    """A fixed-size transposition table in a mapped file, usable in place
+    of the dict Search keeps: get(state) and table[state] = (depth, value),
+    value being a 4-tuple of scores.
+
+    Each slot is four 64-bit words: a check word, the depth, and the four
+    scores as float32.  The check word is the state's Zobrist key XORed
+    with the other three, so a slot half written by one process while
+    another reads it fails the check and reads as empty.  A new entry
+    replaces whatever is in its slot, unless that is the same state
+    already searched deeper."""
+
+    def __init__(self, path, slots=None):
+        """Open the table at path, or create it with `slots` slots (a power
+        of two) if slots is given."""
+        if slots is not None:
+            if slots & (slots - 1):
+                raise ValueError("slots must be a power of two")
+            write_array(path, SHARED_MAGIC, np.zeros((slots, 4), dtype="<u8"))
+        self.path = path
+        self.words = open_array(path, SHARED_MAGIC, "<u8", (-1, 4), "r+")
+        self.mask = len(self.words) - 1
+
+    def get(self, state, default=None):
+        key = state.key
+        slot = self.words[key & self.mask]
+        check, depth, first, second = (int(word) for word in slot)
+        if not depth or check ^ depth ^ first ^ second != key:
+            return default
+        scores = np.array([first, second], dtype="<u8").view("<f4")
+        return depth, tuple(float(score) for score in scores)
+
+    def __setitem__(self, state, entry):
+        depth, value = entry
+        key = state.key
+        index = key & self.mask
+        check, old, first, second = (int(word) for word in self.words[index])
+        if old > depth and check ^ old ^ first ^ second == key:
+            return
+        first, second = (int(word) for word in np.array(value, dtype="<f4").view("<u8"))
+        self.words[index] = (key ^ depth ^ first ^ second, depth, first, second)
+
+    def __len__(self):
+        return len(self.words)
+
+    def close(self):
+        self.words.flush()
+        del self.words
@@ -0,0 +1,41 @@
+# test_batch.py
+# Steps a BatchGame and checks that every running game changed by one
+#   engine.py move, or a pass, for some die, and that winners are
+#   recorded when a game ends.
+
+from engine import GameState, legal_moves, apply_move, winner
+from batch import BatchGame
+
+
+def engine_results(squares, player):
+    """Every position engine.py allows player to reach from squares in
+    one ply, a pass included."""
+    state = GameState(squares, player)
+    results = set([bytes(squares)])
+    for die in range(1, 7):
+        for piece in legal_moves(state, player, die):
+            results.add(bytes(apply_move(state, player, piece, die).squares))
+    return results
+
+def test_batch_steps_are_engine_moves(games=100, seed=3):
+    batch = BatchGame(games, seed)
+    while batch.running:
+        player = batch.player
+        before = dict((int(game), bytes(batch.squares[:, column]))
+                      for column, game in enumerate(batch.ids)
+                      if not batch.done[column])
+        batch.step()
+        after = dict((int(game), bytes(batch.squares[:, column]))
+                     for column, game in enumerate(batch.ids))
+        for game, squares in before.items():
+            won = batch.winner[game]
+            if game not in after:
+                # Dropped by _compact(), which only drops finished games.
+                assert won == player
+                continue
+            assert after[game] in engine_results(squares, player)
+            if winner(GameState(after[game], player)) is None:
+                assert won == -1
+            else:
+                assert won == player and batch.plies[game] == batch.ply
+    assert (batch.winner >= 0).all()
@@ -0,0 +1,64 @@
+# test_canonical.py
+# Checks canonical.py and ranking.py along seeded random games: a state's
+#   canonical form must have the same legal moves, through pieces, and a
+#   move made in the form must reach the same canonical form as the move
+#   it stands for in the state.  StateRanker must give back the canonical
+#   form of every state it numbers, and number race states with no gaps.
+
+import random
+
+from engine import new_game, legal_moves, apply_move, pass_turn, winner
+from canonical import canonical_form
+from ranking import SeatRanker, StateRanker
+
+
+def positions(games, seed):
+    """Yield every state of `games` random games."""
+    rng = random.Random(seed)
+    for game in range(games):
+        state = new_game(game % 4)
+        while winner(state) is None:
+            yield state
+            die = rng.randint(1, 6)
+            legal = legal_moves(state, state.player, die)
+            if legal:
+                state = apply_move(state, state.player, rng.choice(legal), die)
+            else:
+                state = pass_turn(state)
+
+def test_canonical_form_plays_the_same(games=10, seed=4):
+    for state in positions(games, seed):
+        form, pieces = canonical_form(state)
+        assert canonical_form(form)[0] == form
+        player = state.player
+        for die in range(1, 7):
+            legal = legal_moves(form, 0, die)
+            assert sorted(pieces[i] for i in legal) == legal_moves(state, player, die)
+            for i in legal:
+                moved = canonical_form(apply_move(form, 0, i, die))[0]
+                assert moved == canonical_form(apply_move(state, player, pieces[i], die))[0]
+
+def test_unrank_gives_back_the_canonical_form(games=10, seed=5):
+    ranker = StateRanker([SeatRanker()] * 4)
+    for state in positions(games, seed):
+        index = ranker.rank(state)
+        assert 0 <= index < ranker.size
+        assert ranker.unrank(index) == canonical_form(state)[0]
+
+def test_race_ranks_are_dense(samples=500, seed=6):
+    # Random games rarely reach a race, so start from random race states
+    #   and check them and every state one move on.
+    ranker = StateRanker([SeatRanker(52, nest=False)] * 4)
+    rng = random.Random(seed)
+    for _ in range(samples):
+        index = rng.randrange(ranker.size)
+        state = ranker.unrank(index)
+        assert ranker.rank(state) == index
+        if winner(state) is not None:
+            continue
+        for die in range(1, 7):
+            for piece in legal_moves(state, 0, die):
+                after = apply_move(state, 0, piece, die)
+                index = ranker.rank(after)
+                assert 0 <= index < ranker.size
+                assert ranker.unrank(index) == canonical_form(after)[0]
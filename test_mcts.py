@@ -0,0 +1,34 @@
+# test_mcts.py
+# Checks that the tree credits a win to the player who made it, and that
+#   MCTSBot finds the move that stops an opponent about to win.
+
+import random
+
+from engine import GameState, NEST, legal_moves, apply_move, winner
+from mcts import Tree, Node, MCTSBot
+
+# Players 2 and 3 stay in their nests throughout.
+NESTS = list(range(8, 16))
+
+
+def test_winning_move_is_credited_to_the_winner():
+    # Player 0 has three pieces home and rolls the 3 the last one needs.
+    state = GameState([73, 74, 75, 70] + [NEST[1] + piece for piece in range(4)] + NESTS, 0)
+    assert winner(apply_move(state, 0, 3, 3)) == 0
+    tree = Tree(Node(state), random.Random(1))
+    for _ in range(20):
+        tree.iterate(3)
+    child = tree.root.children[3, 3]
+    assert child.wins == [child.visits, 0, 0, 0]
+
+
+def test_bot_clips_the_piece_about_to_win():
+    # Player 1 has three pieces home and the last on 26, a couple of turns
+    #   from home.  Player 0 rolls a 2: piece 0 clips it from 24, piece 1
+    #   only runs on from 40.
+    state = GameState([24, 40, 2, 3, 82, 83, 84, 26] + NESTS, 0)
+    legal = legal_moves(state, 0, 2)
+    assert legal == [0, 1]
+    for seed in range(3):
+        bot = MCTSBot(budget=None, iterations=400, rng=random.Random(seed))
+        assert bot.choose_move(state, 2, legal) == 0
@@ -0,0 +1,123 @@
+# test_rules.py
+# Replays the old click-driven rules (oldrules.py) against engine.py for
+#   every die and piece in positions from seeded random games.  The two
+#   must agree except for the differences in DIFFERENCES, which engine.py
+#   makes on purpose; any other disagreement fails.  Run with pytest, or as
+#   "python test_rules.py [GAMES]" to see how often each difference comes up.
+
+import random
+import sys
+
+from engine import (START, HOME, SQUARES, MOVES, new_game, legal_moves,
+                    apply_move, pass_turn, winner)
+from oldrules import old_move
+
+DIFFERENCES = (
+    ("home-noop",
+     "a piece in its home slot was offered as a move that changed nothing"),
+    ("nest-any-roll",
+     "with one piece home, one in the nest and two out, the nest piece "
+     "could come out on any roll, not only a six"),
+    ("naive-block",
+     "own-piece blocking looked at square + die, so a move that wraps or "
+     "turns into the stretch was refused for an own piece on square + die"),
+    ("lands-on-own",
+     "for the same reason, a move onto an own piece at its real landing "
+     "square was allowed, leaving two markers on one square"),
+    ("home-slot-0",
+     "a six from the last track square put the piece in its side's first "
+     "home slot, whatever the piece"),
+    ("wrap-from-piece-0",
+     "with no piece in the nest, pieces 2-4 wrapping from 67 to 16 counted "
+     "from piece 1's square, landing anywhere, a nest included"),
+    )
+
+# Enough games for every difference to come up at least once.
+GAMES = 24
+
+
+def positions(games=GAMES, seed=1):
+    """Yield every state of `games` random games."""
+    rng = random.Random(seed)
+    for _ in range(games):
+        state = new_game()
+        while winner(state) is None:
+            yield state
+            die = rng.randint(1, 6)
+            legal = legal_moves(state, state.player, die)
+            if legal:
+                state = apply_move(state, state.player, rng.choice(legal), die)
+            else:
+                state = pass_turn(state)
+
+def difference(state, die, piece):
+    """Return None if the old rules and the engine agree on moving piece
+    with die in state, else the name of the difference, "unexplained" if it
+    is none of DIFFERENCES."""
+    player = state.player
+    squares = list(state.squares)
+    old = old_move(squares, player, die, piece)
+    new = None
+    if piece in legal_moves(state, player, die):
+        new = list(apply_move(state, player, piece, die).squares)
+    if old == new:
+        return None
+    marker = 4 * player + piece
+    square = squares[marker]
+    own = squares[4 * player:4 * player + 4]
+    landing = MOVES[(marker * SQUARES + square) * 6 + die - 1]
+    if new is None:
+        if old == squares and square == HOME[player] + piece:
+            return "home-noop"
+        if square < 16 and die != 6 and old[marker] == START[player]:
+            return "nest-any-roll"
+        if landing in own:
+            return "lands-on-own"
+    elif old is None:
+        if square + die in own and square + die != landing:
+            return "naive-block"
+    else:
+        if old[marker] == HOME[player] and new[marker] == HOME[player] + piece:
+            return "home-slot-0"
+        wrapped = 15 + die - (67 - own[0])
+        if (piece and not any(s < 16 for s in own) and square + die > 67 and
+                old[marker] in (wrapped, marker if wrapped == 0 else None)):
+            return "wrap-from-piece-0"
+    return "unexplained"
+
+def tally(games=GAMES, seed=1):
+    """Return ({difference: count}, pairs, examples): how often each
+    difference came up over every (state, die, piece), and up to ten
+    unexplained ones as (squares, player, die, piece)."""
+    counts = {}
+    pairs = 0
+    examples = []
+    for state in positions(games, seed):
+        for die in range(1, 7):
+            for piece in range(4):
+                pairs += 1
+                name = difference(state, die, piece)
+                if name is None:
+                    continue
+                counts[name] = counts.get(name, 0) + 1
+                if name == "unexplained" and len(examples) < 10:
+                    examples.append((list(state.squares), state.player, die, piece))
+    return counts, pairs, examples
+
+
+def test_engine_matches_old_rules():
+    counts, pairs, examples = tally()
+    assert not examples, "unexplained differences: {0}".format(examples)
+    assert sorted(counts) == sorted(name for name, description in DIFFERENCES)
+
+
+if __name__ == "__main__":
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else GAMES
+    counts, pairs, examples = tally(games)
+    print("{0} (state, die, piece) triples from {1} games".format(pairs, games))
+    for name, description in DIFFERENCES + (("unexplained", "none of the above"),):
+        print("{0:>18}: {1:6d}  {2}".format(name, counts.get(name, 0), description))
+    for example in examples:
+        print("unexplained: squares={0} player={1} die={2} piece={3}".format(*example))
+    if examples:
+        sys.exit(1)
@@ -0,0 +1,25 @@
+# test_search.py
+# Edge cases of search.analyse(), searched in this process.
+
+import pytest
+
+from engine import GameState, new_game
+from search import analyse
+
+# Player 0 has three pieces home; a 3 takes the last one home.
+ONE_TO_GO = GameState([70, 74, 75, 76] + list(range(4, 16)), 0)
+
+
+def test_no_legal_move():
+    assert analyse(new_game(), 3, budget=0.1, workers=1) == []
+
+
+def test_winning_move_at_shallowest_depth():
+    [(piece, depth, value)] = analyse(ONE_TO_GO, 3, budget=0.1, workers=1, max_depth=2)
+    assert (piece, depth) == (0, 2)
+    assert value[0] > 0
+
+
+def test_max_depth_below_two_is_rejected():
+    with pytest.raises(ValueError):
+        analyse(ONE_TO_GO, 3, workers=1, max_depth=1)
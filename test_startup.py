@@ -0,0 +1,18 @@
+# test_startup.py
+# Checks that the modules a headless process imports (cli.HEADLESS) start
+#   within cli.STARTUP_BUDGET and never pull in graphics.  Run with pytest,
+#   or as "python test_startup.py", which exits non-zero on failure.
+
+from cli import HEADLESS, STARTUP_BUDGET, startup_times
+
+
+def test_headless_imports_start_within_budget():
+    times = startup_times()
+    assert [code for code, seconds in times] == list(HEADLESS)
+    for code, seconds in times:
+        assert seconds < STARTUP_BUDGET, "{0!r} took {1:.0f} ms".format(code, seconds * 1000)
+
+
+if __name__ == "__main__":
+    test_headless_imports_start_within_budget()
+    print("headless imports start within {0:.0f} ms".format(STARTUP_BUDGET * 1000))
@@ -0,0 +1,36 @@
+# test_zobrist.py
+# Plays seeded random games with engine.py and checks, after every move
+#   and pass, that the Zobrist key and occupant table kept up to date
+#   incrementally equal the ones computed from scratch, and that pack()
+#   and unpack() give back the same state.
+
+import random
+
+from engine import (GameState, zobrist, new_game, legal_moves, apply_move,
+                    pass_turn, winner)
+
+
+def check(state):
+    assert state.key == zobrist(state.squares, state.player)
+    assert state.occupant == GameState(state.squares, state.player).occupant
+    copy = GameState.unpack(state.pack())
+    assert copy == state
+    assert copy.key == state.key
+
+def test_keys_match_scratch_and_pack_round_trips(games=20, seed=2):
+    rng = random.Random(seed)
+    for game in range(games):
+        state = new_game(game % 4)
+        check(state)
+        while winner(state) is None:
+            player = state.player
+            for die in range(1, 7):
+                for piece in legal_moves(state, player, die):
+                    check(apply_move(state, player, piece, die))
+            die = rng.randint(1, 6)
+            legal = legal_moves(state, player, die)
+            if legal:
+                state = apply_move(state, player, rng.choice(legal), die)
+            else:
+                state = pass_turn(state)
+            check(state)
@@ -0,0 +1,101 @@
+# turnflow.py
+# The order of play as a state machine.  A turn goes AWAIT_ROLL, the roll,
+#   AWAIT_PIECE, the move (with any clip, which apply_move() makes), then
+#   the next seat's AWAIT_ROLL, until GAME_OVER.  A roll with no legal move
+#   passes straight to the next seat.
+#
+# Nothing here waits.  Whatever drives the game (the window's loop in
+#   clip_em.py, or a headless loop) feeds clicks in with roll() and pick()
+#   and calls tick() as time passes, which is when bots act, so a turn never
+#   blocks on getMouse() and the loop is free to do other work in between.
+
+import time
+
+from engine import new_game, legal_moves, apply_move, pass_turn, game_over
+
+AWAIT_ROLL = "await roll"
+AWAIT_PIECE = "await piece"
+GAME_OVER = "game over"
+
+
+class TurnMachine(object):
+
+    """One game's turns.  bots[seat] is a bot from bots.py, or None for a
+    person at the window.  A bot rolls `delay` seconds after its turn comes
+    up and moves `delay` seconds after its roll.  events counts the
+    transitions made so far, so a view can tell when to redraw."""
+
+    def __init__(self, dice, bots=None, delay=0.0, state=None):
+        self.dice = dice
+        self.bots = list(bots) if bots is not None else [None] * 4
+        self.delay = delay
+        self.state = new_game() if state is None else state
+        self.value = None
+        self.legal = []
+        self.due = None
+        self.events = 0
+        self.phase = GAME_OVER if game_over(self.state) else AWAIT_ROLL
+
+    @property
+    def player(self):
+        return self.state.player
+
+    def person(self):
+        """Return whether the seat to play is a person's."""
+        return self.phase != GAME_OVER and self.bots[self.player] is None
+
+    def roll(self):
+        """The roll button was pressed.  Return whether that was a move."""
+        if self.phase != AWAIT_ROLL or not self.person():
+            return False
+        self._roll()
+        return True
+
+    def pick(self, marker):
+        """Marker (or None for a click on no marker) was clicked.  Return
+        whether that was a move."""
+        if self.phase != AWAIT_PIECE or not self.person():
+            return False
+        if marker is None or marker // 4 != self.player or marker % 4 not in self.legal:
+            return False
+        self._move(marker % 4)
+        return True
+
+    def tick(self, now=None):
+        """Let a bot roll or move if its time has come.  Return whether it
+        did."""
+        if self.phase == GAME_OVER:
+            return False
+        bot = self.bots[self.player]
+        if bot is None:
+            return False
+        if now is None:
+            now = time.time()
+        if self.due is None:
+            self.due = now + self.delay
+        if now < self.due:
+            return False
+        self.due = None
+        if self.phase == AWAIT_ROLL:
+            self._roll()
+        else:
+            self._move(bot.choose_move(self.state, self.value, self.legal))
+        return True
+
+    def _roll(self):
+        self.value = self.dice.roll()
+        self.legal = legal_moves(self.state, self.player, self.value)
+        if self.legal:
+            self.phase = AWAIT_PIECE
+            self.events += 1
+        else:
+            self._next_seat(pass_turn(self.state))
+
+    def _move(self, piece):
+        self._next_seat(apply_move(self.state, self.player, piece, self.value))
+
+    def _next_seat(self, state):
+        self.state = state
+        self.legal = []
+        self.phase = GAME_OVER if game_over(state) else AWAIT_ROLL
+        self.events += 1